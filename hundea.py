@@ -2,6 +2,7 @@ import requests
 from datetime import datetime
 import json
 import os
+from modules.anunciados import RegistroAnunciados
 
 # 🎮 HunDea - Epic Games Free Hunter v1.0
 # Bot cazador de juegos gratis de Epic Games
@@ -25,20 +26,17 @@ def cargar_config():
 def cargar_cache():
     """
     Carga los juegos ya anunciados para no repetirlos
+
+    Usa el mismo registro que HunDea v3 (cache.json + cache_journal.jsonl)
     """
-    try:
-        with open('cache.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"juegos_anunciados": []}
+    return RegistroAnunciados.cargar('cache.json', 'cache_journal.jsonl')
 
 
 def guardar_cache(cache):
     """
     Guarda los juegos anunciados en cache.json
     """
-    with open('cache.json', 'w', encoding='utf-8') as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+    cache.compactar('cache.json')
 
 
 def obtener_juegos_gratis():
@@ -261,13 +259,13 @@ def main():
             juegos_nuevos = 0
             for juego in juegos:
                 # Verificar si ya fue anunciado
-                if juego['id'] in cache['juegos_anunciados']:
+                if juego['id'] in cache:
                     print(f"⏭️ Saltando {juego['titulo']} (ya fue anunciado)")
                     continue
                 
                 # Enviar a Discord
                 if enviar_a_discord(juego, webhook_url, rol_id):
-                    cache['juegos_anunciados'].append(juego['id'])
+                    cache.registrar(juego['id'])
                     juegos_nuevos += 1
             
             # Guardar cache actualizado
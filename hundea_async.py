@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+🎮 HunDea v3 - Runner asíncrono
+Consulta todas las tiendas sobre un único event loop y envía cada lote al
+pipeline en cuanto su fuente termina
+
+Los hunters siguen usando el cliente HTTP bloqueante: sus métodos *_async
+(modules/async_engine.py) los ejecutan con asyncio.to_thread, y el tope de
+peticiones simultáneas por host lo pone ClienteHTTP en cada petición.
+"""
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from hundea_v2 import main as main_v2
+from modules.async_engine import version_async
+
+
+async def _consultar_fuente(nombre, funcion, args):
+    """
+    Consulta una fuente con la versión async de su método
+
+    Args:
+        nombre (str): Nombre de la fuente
+        funcion (callable): Método bloqueante del hunter
+        args (tuple): Argumentos del método
+
+    Returns:
+        tuple: (nombre, lista de juegos); lista vacía si la fuente falla
+    """
+    try:
+        return nombre, await version_async(funcion)(*args)
+    except Exception as e:
+        print(f"❌ Error en fuente {nombre}: {e}")
+        return nombre, []
+
+
+async def producir_lotes_async(tareas, config, emitir):
+    """
+    Versión asíncrona de hundea_v2.producir_lotes
+
+    Args:
+        tareas (list): Lista de tuplas (nombre, funcion, args)
+        config (dict): Configuración
+        emitir (callable): Envía un lote a la primera etapa del pipeline
+    """
+    # Un hilo por fuente más uno para emitir: emitir bloquea si el buffer
+    # del pipeline está lleno y no debe frenar al event loop
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=config.get('max_hilos', 16) + 1))
+
+    print(f"\n🚀 Consultando {len(tareas)} fuentes (asyncio)...")
+    pendientes = [_consultar_fuente(nombre, funcion, args) for nombre, funcion, args in tareas]
+    for siguiente in asyncio.as_completed(pendientes):
+        nombre, juegos = await siguiente
+        await asyncio.to_thread(emitir, {'fuente': nombre, 'juegos': juegos})
+
+
+def main():
+    """Ejecuta HunDea v3 con el runner asíncrono"""
+    main_v2(productor=lambda tareas, config, emitir: asyncio.run(
+        producir_lotes_async(tareas, config, emitir)
+    ))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Interrumpido por el usuario\n")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Error fatal: {e}\n")
+        sys.exit(1)
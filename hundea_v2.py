@@ -21,7 +21,42 @@ from modules.nintendo_hunter import NintendoHunter
 from modules.scoring import SistemaScoring
 from modules.discord_notifier import DiscordNotifier
 from modules.reviews_externas import ReviewsExternas
+from modules.reviews_itad import ReviewsITAD
 from modules.status_notifier import StatusNotifier
+from modules.concurrencia import iterar_completadas
+from modules.http_client import configurar_cliente
+from modules.cache_persistente import obtener_cache
+from modules.tiendas import configurar_tiendas
+from modules.pipeline import Pipeline, pasar_si_falla
+from modules.normalizacion import normalizar_titulo  # noqa: F401 (re-exportado para los tests)
+from modules.duplicados import IndiceDuplicados
+from modules.fusion import FusionJuegos, es_mejor
+from modules.identidad import ResolvedorIdentidad
+from modules.anunciados import RegistroAnunciados, TTL_GRATIS_DIAS, TTL_OFERTAS_DIAS
+
+# Snapshot del registro de anuncios y journal de cambios posteriores
+ARCHIVO_CACHE = 'cache.json'
+ARCHIVO_JOURNAL = 'cache_journal.jsonl'
+
+# Fuentes de ofertas con descuento (el resto son juegos gratis o free weekends)
+FUENTES_OFERTAS = ['itad_ofertas', 'cheapshark_ofertas', 'playstation_ofertas', 'xbox_ofertas', 'nintendo_ofertas']
+
+# Tienda usada al buscar reviews externas por fuente (None = tienda del juego)
+# Las fuentes que no aparecen aquí no se enriquecen (p.ej. free weekends de Steam)
+TIENDAS_REVIEWS = {
+    'epic': 'Epic Games',
+    'itad': None,
+    'cheapshark': None,
+    'itch': 'Itch.io',
+    'playstation': 'PlayStation',
+    'xbox': 'Xbox',
+    'nintendo': 'Nintendo',
+    'itad_ofertas': None,
+    'cheapshark_ofertas': None,
+    'playstation_ofertas': 'PlayStation',
+    'xbox_ofertas': 'Xbox',
+    'nintendo_ofertas': 'Nintendo',
+}
 
 def cargar_config():
     """Carga configuración"""
@@ -35,25 +70,40 @@ def cargar_config():
         print("❌ Error al leer config.json")
         return None
 
-def cargar_cache():
-    """Carga cache de juegos anunciados"""
-    try:
-        with open('cache.json', 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-            if not isinstance(cache, dict):
-                return {"juegos_anunciados": [], "weekend_anunciados": {}}
-            if 'juegos_anunciados' not in cache or not isinstance(cache['juegos_anunciados'], list):
-                cache['juegos_anunciados'] = []
-            if 'weekend_anunciados' not in cache or not isinstance(cache['weekend_anunciados'], dict):
-                cache['weekend_anunciados'] = {}
-            return cache
-    except FileNotFoundError:
-        return {"juegos_anunciados": [], "weekend_anunciados": {}}
+def cargar_cache(config=None):
+    """
+    Carga el registro de juegos anunciados (cache.json + journal)
+    
+    Args:
+        config (dict, optional): Configuración (vigencias de los anuncios)
+    
+    Returns:
+        RegistroAnunciados: Registro (migra el formato de listas anterior)
+    """
+    config = config or {}
+    return RegistroAnunciados.cargar(
+        ARCHIVO_CACHE,
+        ARCHIVO_JOURNAL,
+        ttl_gratis_dias=config.get('anunciados_ttl_gratis_dias', TTL_GRATIS_DIAS),
+        ttl_ofertas_dias=config.get('anunciados_ttl_ofertas_dias', TTL_OFERTAS_DIAS)
+    )
 
-def guardar_cache(cache):
-    """Guarda cache"""
-    with open('cache.json', 'w', encoding='utf-8') as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+def guardar_cache(anunciados, config=None, forzar=False):
+    """
+    Compacta el journal en cache.json cuando crece lo suficiente
+    
+    Los anuncios ya quedaron en el journal al registrarse; aquí solo se
+    reescribe el snapshot de vez en cuando.
+    
+    Args:
+        anunciados (RegistroAnunciados): Registro a guardar
+        config (dict, optional): Configuración (journal_max_lineas)
+        forzar (bool): Compactar aunque el journal sea pequeño
+    """
+    max_lineas = (config or {}).get('journal_max_lineas', 200)
+    if forzar or anunciados.migrado or anunciados.lineas_journal >= max_lineas:
+        anunciados.compactar(ARCHIVO_CACHE)
+        print("🗜️ Cache compactado")
 
 def iso_a_timestamp(fecha_str):
     """Convierte fecha ISO a timestamp Unix"""
@@ -65,85 +115,132 @@ def iso_a_timestamp(fecha_str):
     except Exception:
         return None
 
-def normalizar_titulo(titulo):
+def eliminar_duplicados(juegos_lista, umbral=0.8):
     """
-    Normaliza títulos para comparación
-    Elimina caracteres especiales, artículos, etc.
+    Elimina juegos duplicados y casi duplicados entre tiendas
+    ("GTA V Premium Edition" / "Grand Theft Auto V")
+    Mantiene el que tenga mejor información (más reviews o mejor precio)
+    
+    Args:
+        juegos_lista (list): Lista de juegos
+        umbral (float): Similitud mínima para casi duplicados (1 = solo exactos)
+    
+    Returns:
+        list: Lista sin duplicados
     """
-    import re
+    vistos = {}
+    indice = IndiceDuplicados(umbral)
+    
+    for juego in juegos_lista:
+        # Grupo del título (exacto, acrónimo o casi igual)
+        titulo_norm, _ = indice.agrupar(juego['titulo'])
+        
+        # Si no lo hemos visto, agregarlo; si ya existe, conservar el mejor
+        categoria = 'oferta' if juego.get('precio_actual') is not None else 'gratis'
+        if titulo_norm not in vistos or es_mejor(juego, vistos[titulo_norm], categoria):
+            vistos[titulo_norm] = juego
     
-    # Convertir a minúsculas
-    titulo = titulo.lower().strip()
+    return list(vistos.values())
+
+def enriquecer_reviews(juegos, reviews_externas, tienda=None):
+    """
+    Busca reviews externas para los juegos que no traen reviews propias
     
-    # Extraer contenido de paréntesis y agregarlo al título
-    # "Rustler (Grand Theft Horse)" → "Rustler Grand Theft Horse"
-    parentesis_content = re.findall(r'\(([^)]*)\)', titulo)
-    for contenido in parentesis_content:
-        titulo = titulo.replace(f'({contenido})', contenido)
+    Args:
+        juegos (list): Lista de juegos de una fuente
+        reviews_externas (ReviewsExternas): Buscador de reviews
+        tienda (str, optional): Tienda fija (si no, se usa la del juego)
+    """
+    reviews_externas.buscar_reviews_lote(juegos, tienda)
+
+def producir_lotes(tareas, config, emitir):
+    """
+    Consulta todas las fuentes en paralelo y emite cada lote al terminar
     
-    # Eliminar caracteres especiales comunes
-    titulo = titulo.replace('-', ' ')
-    titulo = titulo.replace(':', ' ')
-    titulo = titulo.replace('_', ' ')
+    Args:
+        tareas (list): Lista de tuplas (nombre, funcion, args)
+        config (dict): Configuración
+        emitir (callable): Envía un lote a la primera etapa del pipeline
+    """
+    print(f"\n🚀 Consultando {len(tareas)} fuentes en paralelo...")
+    for nombre, juegos in iterar_completadas(tareas, max_workers=config.get('max_hilos', 16)):
+        emitir({'fuente': nombre, 'juegos': juegos})
+
+def crear_notificador(config):
+    """
+    Crea el notificador de Discord si está habilitado y configurado
     
-    # Eliminar palabras comunes al final
-    sufijos = [' es gratis', ' is free', ' gratis', ' free']
-    for sufijo in sufijos:
-        if titulo.endswith(sufijo):
-            titulo = titulo[:-len(sufijo)]
+    Args:
+        config (dict): Configuración
     
-    # Eliminar artículos al inicio
-    articulos_inicio = ['the ', 'a ', 'an ', 'el ', 'la ', 'los ', 'las ']
-    for articulo in articulos_inicio:
-        if titulo.startswith(articulo):
-            titulo = titulo[len(articulo):]
-            break
+    Returns:
+        DiscordNotifier: Notificador o None (modo solo consola)
+    """
+    if not config.get('enviar_discord'):
+        return None
     
-    # Eliminar artículos en medio (con espacios a los lados)
-    for articulo in [' the ', ' a ', ' an ', ' el ', ' la ', ' los ', ' las ']:
-        titulo = titulo.replace(articulo, ' ')
+    webhook_premium = config.get('webhook_premium')
+    webhook_bajos = config.get('webhook_bajos')
+    webhook_weekends = config.get('webhook_weekends')
     
-    # Eliminar espacios múltiples
-    titulo = ' '.join(titulo.split())
+    if not all([webhook_premium, webhook_bajos, webhook_weekends]):
+        print("⚠️ Faltan webhooks configurados. Solo mostrando en consola.\n")
+        return None
     
-    return titulo.strip()
+    return DiscordNotifier(
+        webhook_premium,
+        webhook_bajos,
+        webhook_weekends,
+        webhook_deals=config.get('webhook_deals'),
+        webhook_todos=config.get('webhook_todos'),
+        rol_premium=config.get('rol_premium'),
+        rol_bajos=config.get('rol_bajos'),
+        rol_weekends=config.get('rol_weekends'),
+        rol_deals=config.get('rol_deals'),
+        rol_todos=config.get('rol_todos')
+    )
 
-def eliminar_duplicados(juegos_lista):
+def id_anuncio(juego):
     """
-    Elimina juegos duplicados basándose en el título normalizado
-    Mantiene el que tenga mejor información (más reviews o mejor precio)
+    Id con el que se registra un anuncio: el canónico (ITAD) si existe,
+    así el mismo juego desde otra tienda no se vuelve a anunciar
+    """
+    return juego.get('id_canonico') or juego['id']
+
+def webhook_consola(juego, config):
+    """
+    Webhook del canal de consola (Nintendo, PlayStation, Xbox) para un juego
     
     Args:
-        juegos_lista (list): Lista de juegos
+        juego (dict): Info del juego
+        config (dict): Configuración
     
     Returns:
-        list: Lista sin duplicados
+        str: Webhook del canal o None
     """
-    vistos = {}
+    tienda = (juego.get('tienda') or '').lower()
+    if 'nintendo' in tienda:
+        return config.get('webhook_nintendo')
+    if 'playstation' in tienda:
+        return config.get('webhook_playstation')
+    if 'xbox' in tienda:
+        return config.get('webhook_xbox')
+    return None
+
+def main(productor=None):
+    """
+    Función principal de HunDea v3
     
-    for juego in juegos_lista:
-        # Normalizar título para comparación
-        titulo_norm = normalizar_titulo(juego['titulo'])
-        
-        # Si no lo hemos visto, agregarlo
-        if titulo_norm not in vistos:
-            vistos[titulo_norm] = juego
-        else:
-            # Ya existe, decidir cuál mantener
-            juego_existente = vistos[titulo_norm]
-            
-            # Para ofertas, mantener el de mejor precio
-            if juego.get('precio_actual') is not None:
-                if juego['precio_actual'] < juego_existente.get('precio_actual', float('inf')):
-                    vistos[titulo_norm] = juego
-            # Para juegos gratis, mantener el que tenga más reviews
-            elif juego.get('reviews_count', 0) > juego_existente.get('reviews_count', 0):
-                vistos[titulo_norm] = juego
+    Cada lote avanza por fuente → identidad → reviews → precios → fusión en
+    cuanto su fuente termina. Los juegos gratis siguen enseguida a score →
+    Discord; las ofertas se retienen en la fusión hasta recibir todas las
+    fuentes, para anunciar siempre la más barata.
     
-    return list(vistos.values())
-
-def main():
-    """Función principal de HunDea v3"""
+    Args:
+        productor (callable, optional): Consulta las fuentes y emite sus
+            lotes, con la firma de producir_lotes (por defecto, hilos;
+            hundea_async.py pasa el runner asyncio)
+    """
     
     print("\n" + "="*70)
     print("🎮 HunDea v3 - Multi-Store Free Games Hunter")
@@ -155,6 +252,9 @@ def main():
         print("⚠️ Continuando en modo solo consola...")
         config = {}
     
+    # Cliente HTTP compartido (pools, keep-alive y reintentos)
+    configurar_cliente(config)
+    
     # Inicializar notificador de status
     status_webhook = config.get('webhook_status')
     status_notifier = StatusNotifier(status_webhook) if status_webhook else None
@@ -165,16 +265,43 @@ def main():
         print("📡 Notificación de inicio enviada\n")
     
     try:
-        # Cargar cache
-        cache = cargar_cache()
+        # Cargar registro de anunciados y descartar entradas expiradas
+        anunciados = cargar_cache(config)
+        purgados = anunciados.purgar()
+        if purgados:
+            print(f"🧹 {purgados} anuncio(s) expirado(s) eliminados del cache")
+        
+        # Cache en disco de consultas externas (persiste entre ejecuciones)
+        cache_disco = obtener_cache(config.get('cache_db'))
+        cache_disco.purgar_expirados()
+        
+        # Catálogo de tiendas compartido (ITAD + CheapShark, cacheado en disco)
+        configurar_tiendas(config, cache_disco)
         
         # Inicializar detectores
         epic_hunter = EpicHunter()
         steam_cc = config.get('steam_cc', 'us')
         steam_lang = config.get('steam_lang', 'english')
-        steam_hunter = SteamHunter(cc=steam_cc, lang=steam_lang)
-        itad_hunter = IsThereAnyDealHunter()
-        cheapshark_hunter = CheapSharkHunter()
+        steam_hunter = SteamHunter(
+            cc=steam_cc,
+            lang=steam_lang,
+            cache=cache_disco,
+            ttl_reviews_horas=config.get('steam_reviews_ttl_horas', 24),
+            ttl_detalles_dias=config.get('steam_detalles_ttl_dias', 7),
+            max_hilos=config.get('steam_max_hilos', 4)
+        )
+        itad_hunter = IsThereAnyDealHunter(
+            api_key=config.get('itad_api_key'),
+            pais=config.get('itad_pais', 'US'),
+            max_paginas=config.get('itad_max_paginas', 5),
+            filtro=config.get('itad_filtro'),
+            cache=cache_disco,
+            ttl_minimos_horas=config.get('itad_minimos_ttl_horas', 12)
+        )
+        cheapshark_hunter = CheapSharkHunter(
+            max_paginas=config.get('cheapshark_max_paginas', 5),
+            paginas_paralelas=config.get('cheapshark_paginas_paralelas', 3)
+        )
         itch_hunter = ItchHunter()
         ps_region = config.get('ps_region', 'en-us')
         platprices_hunter = PlatPricesHunter(region=ps_region)
@@ -189,458 +316,301 @@ def main():
         scoring = SistemaScoring()
         
         # Reviews externas con API key si está configurado
+        # Reviews por id de ITAD (RAWG queda como respaldo por título)
+        reviews_itad = None
+        if config.get('reviews_itad', True) and config.get('itad_api_key'):
+            reviews_itad = ReviewsITAD(
+                api_key=config.get('itad_api_key'),
+                cache=cache_disco,
+                ttl_horas=config.get('itad_reviews_ttl_horas', 168),
+                max_hilos=config.get('reviews_max_hilos', 8)
+            )
+        
         rawg_api_key = config.get('rawg_api_key')
-        reviews_externas = ReviewsExternas(api_key=rawg_api_key)
+        reviews_externas = ReviewsExternas(
+            api_key=rawg_api_key,
+            cache=cache_disco,
+            ttl_horas=config.get('rawg_cache_ttl_horas', 168),
+            ttl_negativo_horas=config.get('rawg_cache_ttl_negativo_horas', 24),
+            max_hilos=config.get('reviews_max_hilos', 8),
+            itad=reviews_itad,
+            steam=steam_hunter if config.get('reviews_steam', True) else None
+        )
         
         if rawg_api_key:
             print("✅ RAWG API key configurada")
         else:
             print("⚠️ RAWG API key no configurada (reviews limitadas)")
         
-        # Recolectar juegos de todas las tiendas
-        todos_juegos = []
-        
-        # Epic Games
-        juegos_epic = epic_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews externas para juegos de Epic
-        for juego in juegos_epic:
-            if 'reviews_count' not in juego or not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'Epic Games')
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_epic)
-        
-        # IsThereAnyDeal (múltiples tiendas) - GRATIS
-        print("\n🌟 Buscando juegos GRATIS en múltiples tiendas con ITAD...")
-        juegos_itad = itad_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews externas para juegos de ITAD
-        for juego in juegos_itad:
-            if 'reviews_count' not in juego or not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], juego['tienda'])
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_itad)
-        
-        # CheapShark - Juegos Gratis
-        print("\n🦈 Buscando juegos GRATIS en CheapShark...")
-        juegos_cheapshark = cheapshark_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews para juegos de CheapShark
-        for juego in juegos_cheapshark:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], juego['tienda'])
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_cheapshark)
-        
-        # Itch.io - Juegos indie gratis
-        print("\n🔴 Buscando juegos indie gratis en Itch.io...")
-        juegos_itch = itch_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews para juegos de Itch.io
-        for juego in juegos_itch:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'Itch.io')
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_itch)
-        
-        # PlatPrices - PlayStation deals
-        print("\n🎮 Buscando deals de PlayStation (PlatPrices)...")
-        juegos_playstation = platprices_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews para PlayStation
-        for juego in juegos_playstation:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'PlayStation')
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_playstation)
-        
-        # Xbox - Microsoft Store
-        print("\n🎮 Buscando juegos gratis de Xbox (Microsoft Store)...")
-        juegos_xbox = xbox_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews para Xbox
-        for juego in juegos_xbox:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'Xbox')
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_xbox)
-
-        # Nintendo - eShop
-        print("\n🎮 Buscando juegos gratis de Nintendo eShop...")
-        juegos_nintendo = nintendo_hunter.obtener_juegos_gratis()
-        
-        # Buscar reviews para Nintendo
-        for juego in juegos_nintendo:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'Nintendo')
-                if reviews:
-                    juego.update(reviews)
-        
-        todos_juegos.extend(juegos_nintendo)
-        
-        # Eliminar duplicados en juegos gratis
-        print(f"\n🗑️ Eliminando duplicados en juegos gratis...")
-        juegos_antes = len(todos_juegos)
-        todos_juegos = eliminar_duplicados(todos_juegos)
-        duplicados_removidos = juegos_antes - len(todos_juegos)
-        if duplicados_removidos > 0:
-            print(f"   ✅ Removidos {duplicados_removidos} duplicado(s)")
-            print(f"   📊 Total juegos únicos: {len(todos_juegos)}")
-        
-        # IsThereAnyDeal - OFERTAS CON DESCUENTO
+        # Revalidar precios en ITAD antes de anunciar (requiere API key)
+        verificar_precios = config.get('verificar_precios', True)
+        minimos_historicos = config.get('minimos_historicos', True)
+        # Confirmar en Steam las ofertas de la tienda Steam (en el país de su moneda)
+        verificar_precios_steam = config.get('verificar_precios_steam', True)
+        
+        # Identidad canónica entre tiendas (ITAD lookup)
+        identidad = None
+        if config.get('identidad_itad', True):
+            identidad = ResolvedorIdentidad(
+                api_key=config.get('itad_api_key'),
+                cache=cache_disco,
+                ttl_dias=config.get('identidad_ttl_dias', 30)
+            )
+        
+        # Parámetros de ofertas con descuento
         descuento_minimo = config.get('deals_descuento_minimo', 30)
         descuento_maximo = config.get('deals_descuento_maximo', 99)
         precio_maximo_deals = config.get('deals_precio_maximo', 10)
         
-        print(f"\n💰 Buscando OFERTAS con {descuento_minimo}%+ descuento en ITAD...")
-        ofertas_itad = itad_hunter.obtener_ofertas_descuento(descuento_minimo)
-        
-        # Buscar reviews para ofertas de ITAD
-        for juego in ofertas_itad:
-            if 'reviews_count' not in juego or not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], juego['tienda'])
-                if reviews:
-                    juego.update(reviews)
-        
-        # CheapShark - Ofertas con Descuento
-        print(f"\n🦈 Buscando OFERTAS con {descuento_minimo}%+ descuento en CheapShark...")
-        ofertas_cheapshark = cheapshark_hunter.obtener_ofertas_descuento(descuento_minimo, precio_maximo_deals)
-        
-        # Buscar reviews para ofertas de CheapShark
-        for juego in ofertas_cheapshark:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], juego['tienda'])
-                if reviews:
-                    juego.update(reviews)
-        
-        # Combinar todas las ofertas
-        ofertas_itad.extend(ofertas_cheapshark)
-
-        # PlayStation - Ofertas con Descuento (PlatPrices)
-        print(f"\n🎮 Buscando OFERTAS con {descuento_minimo}%+ descuento en PlayStation (PlatPrices)...")
-        ofertas_playstation = platprices_hunter.obtener_ofertas_descuento(descuento_minimo, descuento_maximo)
-        
-        # Buscar reviews para ofertas de PlayStation
-        for juego in ofertas_playstation:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'PlayStation')
-                if reviews:
-                    juego.update(reviews)
-        ofertas_itad.extend(ofertas_playstation)
-
-        # Xbox - Ofertas con Descuento
-        print(f"\n🎮 Buscando OFERTAS con {descuento_minimo}%+ descuento en Xbox Store...")
-        ofertas_xbox = xbox_hunter.obtener_ofertas_descuento(descuento_minimo, descuento_maximo)
-        
-        # Buscar reviews para ofertas de Xbox
-        for juego in ofertas_xbox:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'Xbox')
-                if reviews:
-                    juego.update(reviews)
-        ofertas_itad.extend(ofertas_xbox)
-
-        # Nintendo - Ofertas con Descuento
-        print(f"\n🎮 Buscando OFERTAS con {descuento_minimo}%+ descuento en Nintendo eShop...")
-        ofertas_nintendo = nintendo_hunter.obtener_ofertas_descuento(descuento_minimo, descuento_maximo)
-        
-        # Buscar reviews para ofertas de Nintendo
-        for juego in ofertas_nintendo:
-            if not juego.get('reviews_count'):
-                print(f"   🔍 Buscando reviews para: {juego['titulo']}")
-                reviews = reviews_externas.buscar_reviews(juego['titulo'], 'Nintendo')
-                if reviews:
-                    juego.update(reviews)
-        ofertas_itad.extend(ofertas_nintendo)
-        
-        # Eliminar duplicados ANTES de separar 100%
-        print(f"\n🗑️ Eliminando duplicados en ofertas...")
-        ofertas_antes = len(ofertas_itad)
-        ofertas_itad = eliminar_duplicados(ofertas_itad)
-        duplicados_removidos = ofertas_antes - len(ofertas_itad)
-        if duplicados_removidos > 0:
-            print(f"   ✅ Removidos {duplicados_removidos} duplicado(s) en ofertas")
-
-        # Filtrar descuentos fuera de rango (máximo para deals pagados)
-        ofertas_filtradas = []
-        for oferta in ofertas_itad:
-            descuento = oferta.get('descuento_porcentaje', 0) or 0
-            if descuento >= 100:
-                ofertas_filtradas.append(oferta)
-            elif descuento_maximo and descuento > descuento_maximo:
-                continue
-            else:
-                ofertas_filtradas.append(oferta)
-        ofertas_itad = ofertas_filtradas
-        
-        # Separar ofertas 100% descuento (son GRATIS)
-        print(f"\n🎁 Separando ofertas 100% descuento como GRATIS...")
-        ofertas_100 = []
-        ofertas_con_descuento = []
-        
-        for oferta in ofertas_itad:
-            if oferta.get('descuento_porcentaje', 0) >= 100:
-                # 100% descuento = GRATIS
-                oferta['tipo'] = 'gratis'
-                ofertas_100.append(oferta)
-            else:
-                ofertas_con_descuento.append(oferta)
-        
-        if ofertas_100:
-            print(f"   🎉 {len(ofertas_100)} oferta(s) 100% movidas a canal GRATIS")
-            # Eliminar duplicados antes de agregar a todos_juegos
-            todos_juegos_temp = todos_juegos + ofertas_100
-            todos_juegos = eliminar_duplicados(todos_juegos_temp)
-            print(f"   📊 Total juegos después de merge: {len(todos_juegos)}")
-        
-        # Actualizar lista de ofertas (sin las 100%)
-        ofertas_itad = ofertas_con_descuento
-        
-        # Eliminar duplicados en ofertas finales
-        print(f"\n🗑️ Eliminando duplicados finales...")
-        ofertas_antes = len(ofertas_itad)
-        ofertas_itad = eliminar_duplicados(ofertas_itad)
-        duplicados_removidos = ofertas_antes - len(ofertas_itad)
-        if duplicados_removidos > 0:
-            print(f"   ✅ Removidos {duplicados_removidos} duplicado(s)")
-            print(f"   📊 Total ofertas únicas: {len(ofertas_itad)}")
-        
-        # Steam (temporalmente desactivado - requiere mejor implementación)
-        # juegos_steam = steam_hunter.obtener_juegos_gratis()
-        # todos_juegos.extend(juegos_steam)
-        
-        # Free Weekends (Steam)
-        free_weekends = steam_hunter.obtener_free_weekends()
-        
-        print(f"\n📊 Total encontrado: {len(todos_juegos)} juego(s) gratis")
-        print(f"💰 Ofertas: {len(ofertas_itad)} oferta(s) con descuento")
-        print(f"⏰ Free Weekends: {len(free_weekends)} juego(s)\n")
-        
-        if not todos_juegos and not free_weekends and not ofertas_itad:
-            print("✅ No hay juegos gratis ni ofertas nuevas por ahora\n")
-            
-            # Notificar éxito (aunque no haya juegos nuevos)
-            if status_notifier:
-                status_notifier.notificar_exito(0, 0, 0)
-            
-            return
+        # Consultar todas las tiendas a la vez (cada fuente aislada)
+        tareas = [
+            ('epic', epic_hunter.obtener_juegos_gratis, ()),
+            ('itad', itad_hunter.obtener_juegos_gratis, ()),
+            ('cheapshark', cheapshark_hunter.obtener_juegos_gratis, ()),
+            ('itch', itch_hunter.obtener_juegos_gratis, ()),
+            ('playstation', platprices_hunter.obtener_juegos_gratis, ()),
+            ('xbox', xbox_hunter.obtener_juegos_gratis, ()),
+            ('nintendo', nintendo_hunter.obtener_juegos_gratis, ()),
+            ('itad_ofertas', itad_hunter.obtener_ofertas_descuento, (descuento_minimo,)),
+            ('cheapshark_ofertas', cheapshark_hunter.obtener_ofertas_descuento, (descuento_minimo, precio_maximo_deals)),
+            ('playstation_ofertas', platprices_hunter.obtener_ofertas_descuento, (descuento_minimo, descuento_maximo)),
+            ('xbox_ofertas', xbox_hunter.obtener_ofertas_descuento, (descuento_minimo, descuento_maximo)),
+            ('nintendo_ofertas', nintendo_hunter.obtener_ofertas_descuento, (descuento_minimo, descuento_maximo)),
+            ('steam_weekends', steam_hunter.obtener_free_weekends, ()),
+        ]
         
-        # Procesar juegos regulares
-        juegos_premium = []
-        juegos_bajos = []
-        
-        # Procesar ofertas con descuento (solo las de calidad 3.6+)
-        ofertas_calidad = []
         score_minimo_deals = config.get('deals_score_minimo', 3.6)
         
-        for juego in todos_juegos:
-            # Calcular score
+        # Discord (None = solo consola)
+        notifier = crear_notificador(config)
+        if notifier:
+            print("📤 Las alertas se enviarán a Discord en cuanto estén listas\n")
+        
+        webhook_premium = config.get('webhook_premium')
+        webhook_bajos = config.get('webhook_bajos')
+        webhook_deals = config.get('webhook_deals')
+        
+        now_ts = int(datetime.now(timezone.utc).timestamp())
+        
+        # Estado compartido entre etapas (cada contador lo escribe una sola etapa)
+        fusion = FusionJuegos(
+            FUENTES_OFERTAS,
+            descuento_maximo=descuento_maximo,
+            umbral=config.get('duplicados_umbral', 0.8),
+            orden_fuentes=[nombre for nombre, _, _ in tareas]
+        )
+        stats = {
+            'gratis': 0,
+            'ofertas': 0,
+            'weekends': 0,
+            'premium': 0,
+            'bajos': 0,
+            'ofertas_calidad': 0,
+            'enviados_premium': 0,
+            'enviados_bajos': 0,
+            'enviados_deals': 0,
+        }
+        
+        def etapa_reviews(lote):
+            """Busca reviews externas para el lote de una fuente"""
+            fuente = lote['fuente']
+            if fuente in TIENDAS_REVIEWS:
+                enriquecer_reviews(lote['juegos'], reviews_externas, TIENDAS_REVIEWS[fuente])
+            yield lote
+        
+        def etapa_identidad(lote):
+            """Asigna el id canónico de ITAD a los juegos del lote"""
+            if identidad and lote['fuente'] not in fusion.fuentes_weekend:
+                identidad.resolver_lote(lote['juegos'])
+            yield lote
+        
+        def etapa_precios(lote):
+            """Revalida en ITAD (y en Steam) los precios del lote y agrega su mínimo histórico"""
+            # Las fuentes de ITAD ya traen el precio de esta misma ejecución
+            if verificar_precios and lote['fuente'] not in ('itad', 'itad_ofertas', *fusion.fuentes_weekend):
+                lote['juegos'] = itad_hunter.verificar_precios(lote['juegos'])
+            if verificar_precios_steam and lote['fuente'] in FUENTES_OFERTAS:
+                lote['juegos'] = steam_hunter.verificar_precios(lote['juegos'])
+            # Solo se piden los mínimos que la verificación no haya traído ya
+            if minimos_historicos and lote['fuente'] in FUENTES_OFERTAS:
+                itad_hunter.enriquecer_minimos(lote['juegos'])
+            yield lote
+        
+        def etapa_fusion(lote):
+            """Clasifica el lote: los gratis siguen de inmediato, las ofertas se retienen"""
+            yield from fusion.procesar_lote(lote['fuente'], lote['juegos'])
+        
+        def etapa_fusion_fin():
+            """Con todas las fuentes recibidas, entrega la mejor versión de cada oferta"""
+            return fusion.vaciar()
+        
+        def etapa_score(item):
+            """Calcula el score y filtra ofertas de baja calidad"""
+            categoria, juego = item
             score = scoring.calcular_score(juego)
-            clasificacion = scoring.clasificar_juego(score)
             estrellas = scoring.obtener_estrellas(score)
-            descripcion = scoring.obtener_descripcion_score(score)
-            
-            # Agregar info de score
             juego['score'] = score
-            juego['clasificacion'] = clasificacion
             juego['estrellas'] = estrellas
+            
+            if categoria == 'weekend':
+                stats['weekends'] += 1
+                yield item
+                return
+            
+            if categoria == 'oferta':
+                stats['ofertas'] += 1
+                
+                # Solo ofertas de calidad
+                if score < score_minimo_deals:
+                    return
+                stats['ofertas_calidad'] += 1
+                
+                print(f"💰 {juego['titulo']}")
+                print(f"   🏪 {juego['tienda']} | 📊 {score:.1f}/5.0 ({estrellas})")
+                print(f"   💸 -{juego.get('descuento_porcentaje', 0)}% | ${juego.get('precio_actual', 0):.2f}")
+                if juego.get('reviews_percent'):
+                    print(f"   ⭐ {juego['reviews_percent']}% ({juego['reviews_count']:,} reviews)")
+                if juego.get('es_minimo_historico'):
+                    print("   📉 Mínimo histórico")
+                print(f"   🔗 {juego['url']}")
+                print(f"   {'─'*60}")
+                yield item
+                return
+            
+            stats['gratis'] += 1
+            clasificacion = scoring.clasificar_juego(score)
+            descripcion = scoring.obtener_descripcion_score(score)
+            juego['clasificacion'] = clasificacion
             juego['descripcion_score'] = descripcion
             
-            # Clasificar
             if clasificacion == 'premium':
-                juegos_premium.append(juego)
+                stats['premium'] += 1
             else:
-                juegos_bajos.append(juego)
+                stats['bajos'] += 1
             
-            # Mostrar en consola
             print(f"{estrellas} {juego['titulo']}")
             print(f"   🏪 {juego['tienda']} | 📊 {score:.1f}/5.0 ({descripcion})")
             if 'reviews_percent' in juego:
                 print(f"   ⭐ {juego['reviews_percent']}% ({juego['reviews_count']:,} reviews)")
             print(f"   🔗 {juego['url']}")
             print(f"   {'─'*60}")
+            yield item
         
-        # Procesar ofertas con descuento
-        for juego in ofertas_itad:
-            score = scoring.calcular_score(juego)
-            estrellas = scoring.obtener_estrellas(score)
+        def etapa_discord(item):
+            """Envía el juego a su canal de Discord (si no fue anunciado)"""
+            if not notifier:
+                return
             
-            juego['score'] = score
-            juego['estrellas'] = estrellas
+            categoria, juego = item
             
-            # Solo ofertas de calidad 3.6+
-            if score >= score_minimo_deals:
-                ofertas_calidad.append(juego)
+            if categoria == 'weekend':
+                weekend_key = juego['id']
+                fin_ts = iso_a_timestamp(juego.get('fin')) or juego.get('fin_ts_estimada')
+                if not fin_ts:
+                    fin_ts = now_ts + (4 * 24 * 60 * 60)
                 
-                print(f"💰 {juego['titulo']}")
-                print(f"   🏪 {juego['tienda']} | 📊 {score:.1f}/5.0 ({estrellas})")
-                print(f"   💸 -{juego.get('descuento_porcentaje', 0)}% | ${juego.get('precio_actual', 0):.2f}")
-                if juego.get('reviews_percent'):
-                    print(f"   ⭐ {juego['reviews_percent']}% ({juego['reviews_count']:,} reviews)")
-                print(f"   🔗 {juego['url']}")
-                print(f"   {'─'*60}")
+                if weekend_key in anunciados:
+                    anunciados.tocar(weekend_key)
+                    print(f"⏭️  Saltando {juego['titulo']} (free weekend activo)")
+                    return
+                
+                if notifier.enviar_free_weekend(juego, juego['score'], juego['estrellas']):
+                    anunciados.registrar(weekend_key, expira=fin_ts)
+                return
+            
+            if categoria == 'oferta':
+                if not webhook_deals:
+                    return
+                deal_id = f"{id_anuncio(juego)}_deal"
+                if deal_id in anunciados or f"{juego['id']}_deal" in anunciados:
+                    anunciados.tocar(deal_id)
+                    print(f"⏭️  Saltando oferta {juego['titulo']} (ya anunciado)")
+                    return
+                if notifier.enviar_oferta_descuento(juego, juego['score'], juego['estrellas']):
+                    anunciados.registrar(deal_id)
+                    stats['enviados_deals'] += 1
+                    webhook_extra = webhook_consola(juego, config)
+                    if webhook_extra and webhook_extra != webhook_deals:
+                        notifier.enviar_oferta_descuento(
+                            juego, juego['score'], juego['estrellas'],
+                            webhook_override=webhook_extra,
+                            rol_override=None
+                        )
+                return
+            
+            if id_anuncio(juego) in anunciados or juego['id'] in anunciados:
+                anunciados.tocar(id_anuncio(juego))
+                print(f"⏭️  Saltando {juego['titulo']} (ya anunciado)")
+                return
+            
+            if juego['clasificacion'] == 'premium':
+                enviado = notifier.enviar_juego_premium(juego, juego['score'], juego['estrellas'])
+                tipo, estrellas, webhook_canal = "premium", juego['estrellas'], webhook_premium
+            else:
+                enviado = notifier.enviar_juego_bajos(juego, juego['score'])
+                tipo, estrellas, webhook_canal = "bajos", "⚠️", webhook_bajos
+            
+            if enviado:
+                anunciados.registrar(id_anuncio(juego))
+                stats[f'enviados_{tipo}'] += 1
+                webhook_extra = webhook_consola(juego, config)
+                if webhook_extra and webhook_extra != webhook_canal:
+                    notifier._enviar_notificacion(
+                        juego, juego['score'], estrellas,
+                        webhook_extra, tipo, None
+                    )
+        
+        pipeline = Pipeline(
+            [
+                # La identidad va primero: con el id de ITAD las reviews se
+                # piden por id exacto en lugar de por título
+                ('identidad', pasar_si_falla('identidad', etapa_identidad)),
+                ('reviews', pasar_si_falla('reviews', etapa_reviews)),
+                ('precios', pasar_si_falla('precios', etapa_precios)),
+                ('fusion', etapa_fusion, etapa_fusion_fin),
+                ('score', etapa_score),
+                ('discord', etapa_discord),
+            ],
+            tamano_buffer=config.get('pipeline_buffer', 32)
+        )
+        
+        productor = productor or producir_lotes
+        pipeline.ejecutar(lambda emitir: productor(tareas, config, emitir))
+        
+        if fusion.total_duplicados > 0:
+            print(f"\n🗑️ Removidos {fusion.total_duplicados} duplicado(s)")
+            for fuente, cantidad in sorted(fusion.duplicados_por_fuente.items(), key=lambda x: -x[1]):
+                print(f"   • {fuente}: {cantidad}")
+        if fusion.descartados > 0:
+            print(f"🚫 Descartadas {fusion.descartados} oferta(s) sobre {descuento_maximo}% de descuento")
         
         # Mostrar resumen
         print(f"\n📈 Resumen:")
-        print(f"   ⭐ Premium (3.5+): {len(juegos_premium)} juego(s)")
-        print(f"   ⚠️  Bajos (<3.5): {len(juegos_bajos)} juego(s)")
-        print(f"   💰 Ofertas Calidad (3.6+): {len(ofertas_calidad)} oferta(s)")
-        print(f"   ⏰ Free Weekends: {len(free_weekends)} juego(s)\n")
-        
-        # Enviar a Discord si está configurado
-        enviados_premium = 0
-        enviados_bajos = 0
-        enviados_deals = 0
-        
-        if config.get('enviar_discord'):
-            webhook_premium = config.get('webhook_premium')
-            webhook_bajos = config.get('webhook_bajos')
-            webhook_weekends = config.get('webhook_weekends')
-            webhook_deals = config.get('webhook_deals')
-            webhook_todos = config.get('webhook_todos')
-            webhook_nintendo = config.get('webhook_nintendo')
-            webhook_playstation = config.get('webhook_playstation')
-            webhook_xbox = config.get('webhook_xbox')
-            rol_id = config.get('rol_id')
-            rol_todos = config.get('rol_todos')
-            rol_deals = config.get('rol_deals')
+        print(f"   📊 Total encontrado: {stats['gratis']} juego(s) gratis")
+        print(f"   ⭐ Premium (3.5+): {stats['premium']} juego(s)")
+        print(f"   ⚠️  Bajos (<3.5): {stats['bajos']} juego(s)")
+        print(f"   💰 Ofertas Calidad ({score_minimo_deals}+): {stats['ofertas_calidad']} de {stats['ofertas']} oferta(s)")
+        print(f"   ⏰ Free Weekends: {stats['weekends']} juego(s)\n")
+        
+        if not stats['gratis'] and not stats['weekends'] and not stats['ofertas']:
+            print("✅ No hay juegos gratis ni ofertas nuevas por ahora\n")
+        
+        enviados_premium = stats['enviados_premium']
+        enviados_bajos = stats['enviados_bajos']
+        enviados_deals = stats['enviados_deals']
+        
+        if notifier:
+            # Compactar cache (los anuncios ya están en el journal)
+            guardar_cache(anunciados, config)
             
-            if not all([webhook_premium, webhook_bajos, webhook_weekends]):
-                print("⚠️ Faltan webhooks configurados. Solo mostrando en consola.\n")
+            total_enviados = enviados_premium + enviados_bajos + enviados_deals
+            if total_enviados > 0:
+                print(f"\n🎉 {total_enviados} alerta(s) enviada(s) a Discord")
+                print(f"   • Premium: {enviados_premium}")
+                print(f"   • Bajos: {enviados_bajos}")
+                print(f"   • Ofertas: {enviados_deals}")
             else:
-                print("📤 Enviando alertas a Discord...\n")
-                
-                notifier = DiscordNotifier(
-                    webhook_premium,
-                    webhook_bajos,
-                    webhook_weekends,
-                    webhook_deals=webhook_deals,
-                    webhook_todos=webhook_todos,
-                    rol_premium=config.get('rol_premium'),
-                    rol_bajos=config.get('rol_bajos'),
-                    rol_weekends=config.get('rol_weekends'),
-                    rol_deals=config.get('rol_deals'),
-                    rol_todos=config.get('rol_todos')
-                )
-
-                def _webhook_consola(juego):
-                    tienda = (juego.get('tienda') or '').lower()
-                    if 'nintendo' in tienda:
-                        return webhook_nintendo
-                    if 'playstation' in tienda:
-                        return webhook_playstation
-                    if 'xbox' in tienda:
-                        return webhook_xbox
-                    return None
-                
-                # Enviar juegos premium
-                for juego in juegos_premium:
-                    if juego['id'] not in cache['juegos_anunciados']:
-                        if notifier.enviar_juego_premium(juego, juego['score'], juego['estrellas']):
-                            cache['juegos_anunciados'].append(juego['id'])
-                            enviados_premium += 1
-                            webhook_consola = _webhook_consola(juego)
-                            if webhook_consola and webhook_consola != webhook_premium:
-                                notifier._enviar_notificacion(
-                                    juego, juego['score'], juego['estrellas'],
-                                    webhook_consola, "premium", None
-                                )
-                    else:
-                        print(f"⏭️  Saltando {juego['titulo']} (ya anunciado)")
-                
-                # Enviar juegos bajos
-                for juego in juegos_bajos:
-                    if juego['id'] not in cache['juegos_anunciados']:
-                        if notifier.enviar_juego_bajos(juego, juego['score']):
-                            cache['juegos_anunciados'].append(juego['id'])
-                            enviados_bajos += 1
-                            webhook_consola = _webhook_consola(juego)
-                            if webhook_consola and webhook_consola != webhook_bajos:
-                                notifier._enviar_notificacion(
-                                    juego, juego['score'], "⚠️",
-                                    webhook_consola, "bajos", None
-                                )
-                    else:
-                        print(f"⏭️  Saltando {juego['titulo']} (ya anunciado)")
-                
-                # Enviar free weekends (deduplicación por ventana activa)
-                now_ts = int(datetime.now(timezone.utc).timestamp())
-                weekend_cache = cache.setdefault('weekend_anunciados', {})
-                expirados = [
-                    k for k, v in weekend_cache.items()
-                    if isinstance(v, (int, float)) and now_ts >= v
-                ]
-                for k in expirados:
-                    del weekend_cache[k]
-
-                for juego in free_weekends:
-                    weekend_key = juego['id']
-                    fin_ts = iso_a_timestamp(juego.get('fin')) or juego.get('fin_ts_estimada')
-                    if not fin_ts:
-                        fin_ts = now_ts + (4 * 24 * 60 * 60)
-
-                    cache_fin = weekend_cache.get(weekend_key)
-                    if cache_fin and now_ts < cache_fin:
-                        print(f"⏭️  Saltando {juego['titulo']} (free weekend activo)")
-                        continue
-
-                    score = scoring.calcular_score(juego)
-                    estrellas = scoring.obtener_estrellas(score)
-                    if notifier.enviar_free_weekend(juego, score, estrellas):
-                        weekend_cache[weekend_key] = fin_ts
-                
-                # Enviar ofertas con descuento
-                if webhook_deals:
-                    for juego in ofertas_calidad:
-                        deal_id = f"{juego['id']}_deal"
-                        if deal_id not in cache['juegos_anunciados']:
-                            if notifier.enviar_oferta_descuento(juego, juego['score'], juego['estrellas']):
-                                cache['juegos_anunciados'].append(deal_id)
-                                enviados_deals += 1
-                                webhook_consola = _webhook_consola(juego)
-                                if webhook_consola and webhook_consola != webhook_deals:
-                                    notifier.enviar_oferta_descuento(
-                                        juego, juego['score'], juego['estrellas'],
-                                        webhook_override=webhook_consola,
-                                        rol_override=None
-                                    )
-                        else:
-                            print(f"⏭️  Saltando oferta {juego['titulo']} (ya anunciado)")
-                
-                # Guardar cache
-                guardar_cache(cache)
-                
-                total_enviados = enviados_premium + enviados_bajos + enviados_deals
-                if total_enviados > 0:
-                    print(f"\n🎉 {total_enviados} alerta(s) enviada(s) a Discord")
-                    print(f"   • Premium: {enviados_premium}")
-                    print(f"   • Bajos: {enviados_bajos}")
-                    print(f"   • Ofertas: {enviados_deals}")
-                else:
-                    print("\n✅ Todos los juegos ya habían sido anunciados")
+                print("\n✅ Todos los juegos ya habían sido anunciados")
         
         print("\n" + "="*70)
         print("✅ Búsqueda completada!")
@@ -651,7 +621,7 @@ def main():
             status_notifier.notificar_exito(
                 enviados_premium, 
                 enviados_bajos, 
-                len(todos_juegos)
+                stats['gratis']
             )
             print("📡 Notificación de éxito enviada\n")
     
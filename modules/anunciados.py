@@ -0,0 +1,268 @@
+"""
+Registro de juegos anunciados para HunDea v3
+Índice id → {primera, ultima, expira} con búsqueda O(1) y una sola
+expiración para juegos gratis, ofertas y free weekends
+
+Persistencia: cada cambio se agrega a un journal (una línea JSON con fsync)
+y el snapshot completo solo se reescribe al compactar, de forma atómica
+"""
+
+import json
+import os
+import threading
+import time
+
+# Vigencias por defecto (días)
+TTL_GRATIS_DIAS = 365
+TTL_OFERTAS_DIAS = 30
+
+# La última vez visto solo se anota en el journal una vez por día
+GRANULARIDAD_ULTIMA = 86400
+
+
+class RegistroAnunciados:
+    """
+    Juegos ya enviados a Discord, con primera/última vez visto y expiración
+
+    Cada entrada expira en un timestamp Unix; al expirar se puede volver a
+    anunciar (una oferta que regresa, un free weekend nuevo).
+    """
+
+    def __init__(self, entradas=None, ttl_gratis_dias=TTL_GRATIS_DIAS, ttl_ofertas_dias=TTL_OFERTAS_DIAS, journal=None):
+        """
+        Args:
+            entradas (dict, optional): id -> {'primera', 'ultima', 'expira'}
+            ttl_gratis_dias (float): Vigencia de un juego gratis anunciado
+            ttl_ofertas_dias (float): Vigencia de una oferta desde la última vez vista
+            journal (str, optional): Archivo donde se agregan los cambios
+        """
+        self.entradas = dict(entradas or {})
+        self.ttl_gratis = ttl_gratis_dias * 86400
+        self.ttl_ofertas = ttl_ofertas_dias * 86400
+        self.journal = journal
+        self.lineas_journal = 0
+        self.migrado = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def cargar(cls, ruta_snapshot, ruta_journal, **kwargs):
+        """
+        Carga el snapshot y reaplica el journal encima
+
+        Una última línea sin salto de línea (escritura interrumpida) se
+        descarta y se corta del archivo antes de volver a agregar.
+
+        Args:
+            ruta_snapshot (str): Archivo JSON con el estado compactado
+            ruta_journal (str): Archivo JSONL con los cambios posteriores
+            **kwargs: Vigencias (ver __init__)
+
+        Returns:
+            RegistroAnunciados: Registro cargado
+        """
+        try:
+            with open(ruta_snapshot, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+
+        if not isinstance(cache, dict):
+            cache = {}
+
+        registro = cls.desde_cache(cache, **kwargs)
+        registro.journal = ruta_journal
+
+        completo = 0
+        try:
+            with open(ruta_journal, 'rb') as f:
+                for linea in f:
+                    if not linea.endswith(b'\n'):
+                        # Última línea a medio escribir por una interrupción
+                        break
+                    completo += len(linea)
+                    try:
+                        registro_linea = json.loads(linea)
+                        juego_id = registro_linea.pop('id')
+                    except (ValueError, KeyError, AttributeError):
+                        continue
+                    registro.entradas[juego_id] = registro_linea
+                    registro.lineas_journal += 1
+                truncado = f.tell() > completo
+        except FileNotFoundError:
+            truncado = False
+
+        if truncado:
+            # Se corta la cola parcial: si no, el próximo append quedaría
+            # pegado a ella y esa entrada se perdería al recargar
+            with open(ruta_journal, 'r+b') as f:
+                f.truncate(completo)
+
+        return registro
+
+    @classmethod
+    def desde_cache(cls, cache, **kwargs):
+        """
+        Crea el registro desde el contenido de cache.json
+
+        Migra el formato anterior (lista `juegos_anunciados` y dict
+        `weekend_anunciados` id -> fin) al índice con expiración.
+
+        Args:
+            cache (dict): Contenido de cache.json
+            **kwargs: Vigencias (ver __init__)
+
+        Returns:
+            RegistroAnunciados: Registro cargado
+        """
+        registro = cls(cache.get('anunciados') if isinstance(cache.get('anunciados'), dict) else None, **kwargs)
+        registro.migrado = 'juegos_anunciados' in cache or 'weekend_anunciados' in cache
+        ahora = int(time.time())
+
+        for juego_id in cache.get('juegos_anunciados') or []:
+            if juego_id not in registro.entradas:
+                registro.entradas[juego_id] = {
+                    'primera': ahora,
+                    'ultima': ahora,
+                    'expira': ahora + registro._ttl_por_id(juego_id)
+                }
+
+        for juego_id, fin_ts in (cache.get('weekend_anunciados') or {}).items():
+            if isinstance(fin_ts, (int, float)) and juego_id not in registro.entradas:
+                registro.entradas[juego_id] = {'primera': ahora, 'ultima': ahora, 'expira': int(fin_ts)}
+
+        return registro
+
+    def _ttl_por_id(self, juego_id):
+        """Vigencia según el tipo de id (las ofertas terminan en _deal)"""
+        return self.ttl_ofertas if juego_id.endswith('_deal') else self.ttl_gratis
+
+    def __contains__(self, juego_id):
+        return self.contiene(juego_id)
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def contiene(self, juego_id, ahora=None):
+        """
+        Indica si el juego fue anunciado y su entrada sigue vigente
+
+        Args:
+            juego_id (str): Id del juego
+            ahora (int, optional): Timestamp actual
+
+        Returns:
+            bool: True si no se debe volver a anunciar
+        """
+        entrada = self.entradas.get(juego_id)
+        if not entrada:
+            return False
+        return (ahora or time.time()) < entrada['expira']
+
+    def registrar(self, juego_id, expira=None):
+        """
+        Marca un juego como anunciado
+
+        Args:
+            juego_id (str): Id del juego
+            expira (int, optional): Timestamp de expiración fijo (free weekends).
+                Si no se indica se usa la vigencia según el tipo de id.
+        """
+        ahora = int(time.time())
+        with self._lock:
+            entrada = self.entradas.get(juego_id)
+            primera = entrada['primera'] if entrada else ahora
+            self.entradas[juego_id] = {
+                'primera': primera,
+                'ultima': ahora,
+                'expira': int(expira) if expira else ahora + self._ttl_por_id(juego_id)
+            }
+            self._anotar(juego_id)
+
+    def tocar(self, juego_id):
+        """
+        Actualiza la última vez visto de un juego ya anunciado
+
+        Las ofertas extienden su vigencia mientras sigan apareciendo;
+        las expiraciones fijas (free weekends) no cambian.
+
+        Args:
+            juego_id (str): Id del juego
+        """
+        ahora = int(time.time())
+        with self._lock:
+            entrada = self.entradas.get(juego_id)
+            if not entrada:
+                return
+            anotar = ahora - entrada['ultima'] >= GRANULARIDAD_ULTIMA
+            entrada['ultima'] = ahora
+            if juego_id.endswith('_deal'):
+                entrada['expira'] = max(entrada['expira'], ahora + self.ttl_ofertas)
+            if anotar:
+                self._anotar(juego_id)
+
+    def _anotar(self, juego_id):
+        """
+        Agrega la entrada actual al journal y la fuerza a disco
+
+        Debe llamarse con el lock tomado.
+        """
+        if not self.journal:
+            return
+        linea = json.dumps({'id': juego_id, **self.entradas[juego_id]}, ensure_ascii=False)
+        with open(self.journal, 'a', encoding='utf-8') as f:
+            f.write(linea + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.lineas_journal += 1
+
+    def purgar(self, ahora=None):
+        """
+        Elimina las entradas expiradas
+
+        Args:
+            ahora (int, optional): Timestamp actual
+
+        Returns:
+            int: Entradas eliminadas
+        """
+        ahora = ahora or time.time()
+        with self._lock:
+            expirados = [k for k, v in self.entradas.items() if v['expira'] <= ahora]
+            for k in expirados:
+                del self.entradas[k]
+        return len(expirados)
+
+    def compactar(self, ruta_snapshot):
+        """
+        Escribe el snapshot completo de forma atómica y vacía el journal
+
+        Se escribe a un archivo temporal, se hace fsync y se reemplaza con
+        os.replace: una interrupción deja el snapshot anterior intacto.
+
+        Args:
+            ruta_snapshot (str): Archivo JSON del snapshot
+        """
+        contenido = self.a_cache()
+        temporal = f"{ruta_snapshot}.tmp"
+
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(contenido, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, ruta_snapshot)
+
+        with self._lock:
+            if self.journal:
+                open(self.journal, 'w').close()
+            self.lineas_journal = 0
+            self.migrado = False
+
+    def a_cache(self):
+        """
+        Devuelve el contenido a guardar en cache.json
+
+        Returns:
+            dict: {'anunciados': {id: {'primera', 'ultima', 'expira'}}}
+        """
+        with self._lock:
+            return {'anunciados': {k: dict(v) for k, v in self.entradas.items()}}
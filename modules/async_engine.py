@@ -0,0 +1,79 @@
+"""
+Motor asíncrono para HunDea v3
+Interfaz async de los hunters para el runner asyncio (hundea_async.py)
+
+Los hunters usan el cliente `requests` compartido (bloqueante) y el proyecto
+no depende de una librería HTTP asíncrona, así que cada método async despacha
+la versión bloqueante a un hilo con asyncio.to_thread: el event loop programa
+todas las fuentes y entrega cada lote en cuanto termina. El tope de
+peticiones simultáneas por host lo aplica ClienteHTTP en cada petición
+(LimitadorConcurrencia), no alrededor del método entero, así que vale igual
+para los hilos del loop y para los del pipeline.
+"""
+
+import asyncio
+
+
+async def en_hilo(funcion, *args):
+    """
+    Ejecuta una función bloqueante en un hilo del executor del loop
+
+    Args:
+        funcion (callable): Función bloqueante
+        *args: Argumentos de la función
+
+    Returns:
+        Resultado de la función
+    """
+    return await asyncio.to_thread(funcion, *args)
+
+
+def version_async(funcion):
+    """
+    Método async equivalente a un método bloqueante de un hunter
+
+    obtener_juegos_gratis → obtener_juegos_gratis_async, etc.
+
+    Args:
+        funcion (callable): Método ligado de un hunter
+
+    Returns:
+        callable: Método async ligado al mismo hunter
+
+    Raises:
+        AttributeError: Si el hunter no tiene versión async de ese método
+    """
+    return getattr(funcion.__self__, f"{funcion.__name__}_async")
+
+
+class HunterAsyncMixin:
+    """
+    Versión async de obtener_juegos_gratis (la API bloqueante no cambia)
+    """
+
+    async def obtener_juegos_gratis_async(self):
+        """
+        Versión asíncrona de obtener_juegos_gratis
+
+        Returns:
+            list: Lista de juegos gratis
+        """
+        return await en_hilo(self.obtener_juegos_gratis)
+
+
+class OfertasAsyncMixin:
+    """
+    Versión async de obtener_ofertas_descuento, para hunters con ofertas
+    """
+
+    async def obtener_ofertas_descuento_async(self, *args):
+        """
+        Versión asíncrona de obtener_ofertas_descuento
+
+        Args:
+            *args: Mismos argumentos que obtener_ofertas_descuento
+
+        Returns:
+            list: Lista de ofertas con descuento
+        """
+        return await en_hilo(self.obtener_ofertas_descuento, *args)
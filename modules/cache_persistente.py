@@ -0,0 +1,205 @@
+"""
+Cache persistente en disco para HunDea v3
+Guarda respuestas de APIs externas en SQLite con expiración por entrada,
+para que ejecuciones consecutivas no repitan las mismas consultas
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+# Archivo por defecto (junto a cache.json)
+RUTA_DEFAULT = 'hundea_cache.db'
+
+# Marca de respuesta fallida (error de red o HTTP): no se guarda en cache
+SIN_RESPUESTA = object()
+
+
+class CachePersistente:
+    """
+    Almacén clave → valor JSON con TTL, agrupado por espacios de nombres
+
+    Un valor None se guarda como resultado negativo ("no encontrado"): se
+    distingue de una clave ausente gracias a que `obtener` devuelve si hubo hit.
+    """
+
+    def __init__(self, ruta=RUTA_DEFAULT):
+        """
+        Args:
+            ruta (str): Archivo SQLite (':memory:' para pruebas)
+        """
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " espacio TEXT NOT NULL,"
+            " clave TEXT NOT NULL,"
+            " valor TEXT,"
+            " expira REAL NOT NULL,"
+            " PRIMARY KEY (espacio, clave))"
+        )
+        self._conexion.commit()
+
+    def obtener(self, espacio, clave):
+        """
+        Busca una entrada vigente
+
+        Args:
+            espacio (str): Espacio de nombres (p.ej. 'rawg')
+            clave (str): Clave dentro del espacio
+
+        Returns:
+            tuple: (hit, valor). hit es False si no existe o expiró;
+                valor puede ser None en un resultado negativo.
+        """
+        with self._lock:
+            fila = self._conexion.execute(
+                "SELECT valor, expira FROM cache WHERE espacio = ? AND clave = ?",
+                (espacio, clave)
+            ).fetchone()
+
+        if not fila or fila[1] < time.time():
+            return False, None
+
+        return True, json.loads(fila[0]) if fila[0] is not None else None
+
+    def guardar(self, espacio, clave, valor, ttl):
+        """
+        Guarda (o reemplaza) una entrada
+
+        Args:
+            espacio (str): Espacio de nombres
+            clave (str): Clave dentro del espacio
+            valor: Valor serializable a JSON (None = resultado negativo)
+            ttl (float): Segundos de vigencia
+        """
+        texto = json.dumps(valor, ensure_ascii=False) if valor is not None else None
+
+        with self._lock:
+            self._conexion.execute(
+                "INSERT OR REPLACE INTO cache (espacio, clave, valor, expira) VALUES (?, ?, ?, ?)",
+                (espacio, clave, texto, time.time() + ttl)
+            )
+            self._conexion.commit()
+
+    def purgar_expirados(self):
+        """
+        Elimina las entradas vencidas
+
+        Returns:
+            int: Entradas eliminadas
+        """
+        with self._lock:
+            cursor = self._conexion.execute("DELETE FROM cache WHERE expira < ?", (time.time(),))
+            self._conexion.commit()
+            return cursor.rowcount
+
+    def cerrar(self):
+        """Cierra la conexión"""
+        with self._lock:
+            self._conexion.close()
+
+
+class CacheConsultas:
+    """
+    Cache en memoria delante de un espacio de la cache persistente
+
+    Para proveedores que consultan una API por clave: se busca primero en
+    memoria, luego en disco, y solo si no hay hit se consulta. Los
+    resultados negativos se guardan con su propia vigencia; las respuestas
+    fallidas (SIN_RESPUESTA) no se guardan y se reintentan en la próxima
+    ejecución.
+    """
+
+    def __init__(self, espacio, cache=None, ttl=0, ttl_negativo=0, es_negativo=None):
+        """
+        Args:
+            espacio (str): Espacio de nombres en la cache persistente
+            cache (CachePersistente, optional): Cache en disco (None = solo memoria)
+            ttl (float): Segundos de vigencia de un resultado
+            ttl_negativo (float): Segundos de vigencia de un resultado negativo
+            es_negativo (callable, optional): Indica si un valor es negativo
+                (default: valor vacío o None)
+        """
+        self.espacio = espacio
+        self.cache = cache
+        self.ttl = ttl
+        self.ttl_negativo = ttl_negativo
+        self.es_negativo = es_negativo or (lambda valor: not valor)
+        self.memoria = {}
+
+    def __contains__(self, clave):
+        """True si la clave ya está en memoria (sin mirar el disco)"""
+        return clave in self.memoria
+
+    def obtener(self, clave):
+        """
+        Busca una clave en memoria y luego en disco
+
+        Args:
+            clave (str): Clave dentro del espacio
+
+        Returns:
+            tuple: (hit, valor o None)
+        """
+        if clave in self.memoria:
+            return True, self.memoria[clave]
+
+        if self.cache:
+            hit, guardado = self.cache.obtener(self.espacio, clave)
+            if hit:
+                self.memoria[clave] = guardado
+                return True, guardado
+
+        return False, None
+
+    def consultar(self, clave, funcion, *args):
+        """
+        Devuelve el valor cacheado o lo consulta y lo guarda
+
+        Args:
+            clave (str): Clave dentro del espacio
+            funcion (callable): Consulta; devuelve SIN_RESPUESTA si falló
+            *args: Argumentos de la consulta
+
+        Returns:
+            Valor encontrado, o None si la consulta falló
+        """
+        hit, guardado = self.obtener(clave)
+        if hit:
+            return guardado
+
+        valor = funcion(*args)
+        if valor is SIN_RESPUESTA:
+            return None
+
+        self.memoria[clave] = valor
+        if self.cache:
+            ttl = self.ttl_negativo if self.es_negativo(valor) else self.ttl
+            self.cache.guardar(self.espacio, clave, valor, ttl)
+
+        return valor
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def obtener_cache(ruta=None):
+    """
+    Devuelve la cache persistente compartida (la abre la primera vez)
+
+    Args:
+        ruta (str, optional): Archivo SQLite; solo se usa al crearla
+
+    Returns:
+        CachePersistente: Cache compartida
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = CachePersistente(ruta or RUTA_DEFAULT)
+        return _cache
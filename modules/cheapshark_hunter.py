@@ -4,36 +4,35 @@ Detector de ofertas usando CheapShark API
 Encuentra juegos gratis y ofertas increíbles
 """
 
-import requests
-import time
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin, OfertasAsyncMixin
+from modules.concurrencia import iterar_paginas
+from modules.tiendas import obtener_tiendas
 
-class CheapSharkHunter:
+# Máximo permitido por /deals
+TAMANO_PAGINA = 60
+
+class CheapSharkHunter(HunterAsyncMixin, OfertasAsyncMixin):
     """
     Busca juegos gratis y ofertas en múltiples tiendas usando CheapShark
     """
     
-    def __init__(self):
+    def __init__(self, max_paginas=5, paginas_paralelas=3):
+        """
+        Args:
+            max_paginas (int): Páginas de 60 deals como máximo por búsqueda
+            paginas_paralelas (int): Páginas pedidas a la vez
+        """
         self.base_url = "https://www.cheapshark.com/api/1.0"
+        self.max_paginas = max(1, max_paginas)
+        self.paginas_paralelas = max(1, paginas_paralelas)
+        self.session = obtener_cliente()
         
-        # Mapeo de tiendas (CheapShark IDs)
-        self.tiendas_map = {
-            '1': {'nombre': 'Steam', 'emoji': '🔵'},
-            '2': {'nombre': 'GamersGate', 'emoji': '🟣'},
-            '3': {'nombre': 'GreenManGaming', 'emoji': '🟢'},
-            '7': {'nombre': 'GOG', 'emoji': '🟣'},
-            '8': {'nombre': 'Origin', 'emoji': '🟠'},
-            '11': {'nombre': 'Humble Store', 'emoji': '🟠'},
-            '13': {'nombre': 'Uplay', 'emoji': '🔵'},
-            '15': {'nombre': 'Fanatical', 'emoji': '🔴'},
-            '25': {'nombre': 'Epic Games', 'emoji': '⚫'},
-            '27': {'nombre': 'Gamesplanet', 'emoji': '🔵'},
-            '28': {'nombre': 'Gamesload', 'emoji': '🟡'},
-            '29': {'nombre': 'AllYouPlay', 'emoji': '🟢'},
-            '30': {'nombre': 'DLGamer', 'emoji': '🟠'},
-        }
+        # Tiendas de CheapShark (storeID) desde el registro compartido
+        self.tiendas = obtener_tiendas()
         
         print("\n🦈 CheapShark Hunter inicializado")
-        print(f"   📍 Monitoreando {len(self.tiendas_map)} tiendas")
+        print("   📍 Monitoreando todas las tiendas de CheapShark")
     
     def obtener_juegos_gratis(self):
         """
@@ -48,22 +47,12 @@ class CheapSharkHunter:
             print("\n🦈 Consultando CheapShark (juegos gratis)...")
             
             # Endpoint: juegos con precio máximo $0
-            url = f"{self.base_url}/deals"
             params = {
                 'upperPrice': 0,
-                'pageSize': 60,
                 'sortBy': 'recent'
             }
             
-            response = requests.get(url, params=params, timeout=15)
-            
-            if response.status_code != 200:
-                print(f"   ⚠️ CheapShark respondió con {response.status_code}")
-                return []
-            
-            data = response.json()
-            
-            for deal in data:
+            for deal in self.iterar_deals(params):
                 juego_info = self._extraer_info_juego(deal, tipo='gratis')
                 if juego_info:
                     juegos.append(juego_info)
@@ -77,7 +66,7 @@ class CheapSharkHunter:
         
         except Exception as e:
             print(f"   ❌ Error en CheapShark: {e}")
-            return []
+            return juegos
     
     def obtener_ofertas_descuento(self, descuento_minimo=70, precio_maximo=10):
         """
@@ -95,30 +84,21 @@ class CheapSharkHunter:
         try:
             print(f"\n🦈 Consultando CheapShark (ofertas {descuento_minimo}%+)...")
             
-            url = f"{self.base_url}/deals"
             params = {
                 'lowerPrice': 0,
                 'upperPrice': precio_maximo,
                 'onSale': 1,
-                'pageSize': 60,
                 'sortBy': 'Savings'  # Ordenar por mayor descuento
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            # Ordenado por descuento: la primera oferta bajo el mínimo corta la búsqueda
+            def corte(deal):
+                return float(deal.get('savings', '0')) < descuento_minimo
             
-            if response.status_code != 200:
-                print(f"   ⚠️ CheapShark respondió con {response.status_code}")
-                return []
-            
-            data = response.json()
-            
-            # Filtrar por descuento mínimo
-            for deal in data:
-                descuento = float(deal.get('savings', '0'))
-                if descuento >= descuento_minimo:
-                    juego_info = self._extraer_info_juego(deal, tipo='descuento')
-                    if juego_info:
-                        ofertas.append(juego_info)
+            for deal in self.iterar_deals(params, corte=corte):
+                juego_info = self._extraer_info_juego(deal, tipo='descuento')
+                if juego_info:
+                    ofertas.append(juego_info)
             
             if ofertas:
                 print(f"   ✅ CheapShark: {len(ofertas)} oferta(s)")
@@ -129,7 +109,54 @@ class CheapSharkHunter:
         
         except Exception as e:
             print(f"   ❌ Error en CheapShark: {e}")
-            return []
+            return ofertas
+    
+    def iterar_deals(self, params, corte=None):
+        """
+        Recorre las páginas de /deals y entrega cada deal en orden
+        
+        La primera página trae el total de páginas (X-Total-Page-Count); el
+        resto se pide en rondas paralelas dentro del presupuesto max_paginas.
+        Cada página se entrega en cuanto llega su turno, sin esperar al resto.
+        
+        Args:
+            params (dict): Filtros de /deals (sin pageNumber ni pageSize)
+            corte (callable, optional): deal -> True si ya no interesa ninguno
+                a partir de él (resultados ordenados)
+        
+        Yields:
+            dict: Deals de CheapShark
+        """
+        def pagina(numero):
+            return self._obtener_pagina(params, numero)
+        
+        for deal in iterar_paginas(pagina, self.max_paginas, self.paginas_paralelas):
+            if corte and corte(deal):
+                return
+            yield deal
+    
+    def _obtener_pagina(self, params, numero):
+        """
+        Pide una página de /deals
+        
+        Returns:
+            tuple: (lista de deals o None, total de páginas o None)
+        """
+        response = self.session.get(
+            f"{self.base_url}/deals",
+            params={**params, 'pageSize': TAMANO_PAGINA, 'pageNumber': numero}
+        )
+        
+        if response.status_code != 200:
+            print(f"   ⚠️ CheapShark respondió con {response.status_code}")
+            return None, None
+        
+        try:
+            total = int(response.headers.get('X-Total-Page-Count', 1))
+        except ValueError:
+            total = 1
+        
+        return response.json(), total
     
     def _extraer_info_juego(self, deal, tipo='gratis'):
         """
@@ -152,10 +179,10 @@ class CheapSharkHunter:
             
             # Tienda
             store_id = deal.get('storeID', '1')
-            tienda_info = self.tiendas_map.get(store_id, {
+            tienda_info = self.tiendas.por_cheapshark(store_id) or {
                 'nombre': f'Tienda {store_id}',
                 'emoji': '🏪'
-            })
+            }
             
             # Precios
             precio_actual = float(deal.get('salePrice', '0'))
@@ -165,9 +192,11 @@ class CheapSharkHunter:
             # URL (CheapShark redirect)
             url = f"https://www.cheapshark.com/redirect?dealID={deal_id}"
             
-            # Rating de Steam (si existe)
-            steam_rating = deal.get('steamRatingPercent', None)
-            steam_reviews = deal.get('steamRatingCount', None)
+            # Rating de Steam y Metacritic que CheapShark ya incluye
+            steam_rating = deal.get('steamRatingPercent')
+            steam_reviews = int(deal.get('steamRatingCount') or 0)
+            metacritic = int(deal.get('metacriticScore') or 0)
+            steam_appid = deal.get('steamAppID')
             
             # Fecha de fin (timestamp)
             fecha_fin = None
@@ -189,13 +218,18 @@ class CheapSharkHunter:
                 'imagen_url': imagen_url,
                 'tipo': tipo,
                 'fuente': 'CheapShark',
-                'metacritic': int(deal.get('metacriticScore', 0)) if deal.get('metacriticScore') else None
+                'metacritic': metacritic or None
             }
             
-            # Agregar reviews de Steam si existen
-            if steam_rating and steam_reviews:
+            # El appid permite resolver la identidad y las reviews por id exacto
+            if steam_appid:
+                juego_base['appid'] = str(steam_appid)
+            
+            # Agregar reviews de Steam si existen (no hace falta buscarlas en RAWG)
+            if steam_rating is not None and steam_reviews > 0:
                 juego_base['reviews_percent'] = int(steam_rating)
-                juego_base['reviews_count'] = int(steam_reviews)
+                juego_base['reviews_count'] = steam_reviews
+                juego_base['fuente_reviews'] = 'Steam (CheapShark)'
             else:
                 juego_base['reviews_percent'] = None
                 juego_base['reviews_count'] = None
@@ -0,0 +1,125 @@
+"""
+Utilidades de concurrencia para HunDea v3
+Ejecuta consultas a varias tiendas en paralelo con un pool acotado de hilos
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def ejecutar_en_paralelo(tareas, max_workers=8, valor_error=None):
+    """
+    Ejecuta varias tareas a la vez y devuelve sus resultados en orden fijo
+
+    Cada tarea está aislada: si una fuente lanza una excepción se registra
+    el error y se usa `valor_error` como resultado, sin afectar a las demás.
+
+    Args:
+        tareas (list): Lista de tuplas (nombre, funcion, args)
+        max_workers (int): Máximo de hilos simultáneos
+        valor_error: Resultado a usar si la tarea falla (default: lista vacía)
+
+    Returns:
+        dict: nombre -> resultado, en el mismo orden que `tareas`
+    """
+    resultados = {}
+    if not tareas:
+        return resultados
+
+    workers = max(1, min(max_workers, len(tareas)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futuros = [
+            (nombre, executor.submit(funcion, *args))
+            for nombre, funcion, args in tareas
+        ]
+
+        # Recoger en el orden de envío para que el merge sea determinista
+        for nombre, futuro in futuros:
+            try:
+                resultados[nombre] = futuro.result()
+            except Exception as e:
+                print(f"❌ Error en fuente {nombre}: {e}")
+                resultados[nombre] = [] if valor_error is None else valor_error
+
+    return resultados
+
+
+def iterar_completadas(tareas, max_workers=8, valor_error=None):
+    """
+    Ejecuta varias tareas a la vez y entrega cada resultado al terminar
+
+    A diferencia de ejecutar_en_paralelo, no espera a la fuente más lenta:
+    cada resultado se entrega en cuanto su tarea termina.
+
+    Args:
+        tareas (list): Lista de tuplas (nombre, funcion, args)
+        max_workers (int): Máximo de hilos simultáneos
+        valor_error: Resultado a usar si la tarea falla (default: lista vacía)
+
+    Yields:
+        tuple: (nombre, resultado) en orden de finalización
+    """
+    if not tareas:
+        return
+
+    workers = max(1, min(max_workers, len(tareas)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        nombres = {
+            executor.submit(funcion, *args): nombre
+            for nombre, funcion, args in tareas
+        }
+
+        for futuro in as_completed(nombres):
+            nombre = nombres[futuro]
+            try:
+                yield nombre, futuro.result()
+            except Exception as e:
+                print(f"❌ Error en fuente {nombre}: {e}")
+                yield nombre, [] if valor_error is None else valor_error
+
+
+def iterar_paginas(obtener_pagina, max_paginas, paginas_paralelas=4):
+    """
+    Recorre una API paginada y entrega cada elemento en orden
+
+    La primera página se pide sola; el resto en rondas paralelas dentro de
+    max_paginas (y del total de páginas si la API lo indica). Como es un
+    generador, el consumidor corta la paginación al dejar de iterar.
+
+    Args:
+        obtener_pagina (callable): n -> (lista de elementos o None si falló,
+            total de páginas o None si no se conoce)
+        max_paginas (int): Presupuesto máximo de páginas
+        paginas_paralelas (int): Páginas pedidas a la vez en cada ronda
+
+    Yields:
+        Elementos de las páginas, en orden
+    """
+    elementos, total = obtener_pagina(0)
+    limite = max_paginas if total is None else min(total, max_paginas)
+    pagina = 1
+
+    while elementos:
+        yield from elementos
+
+        if pagina >= limite:
+            return
+
+        ronda = range(pagina, min(pagina + paginas_paralelas, limite))
+        tareas = [(n, obtener_pagina, (n,)) for n in ronda]
+        resultados = ejecutar_en_paralelo(tareas, max_workers=paginas_paralelas, valor_error=(None, None))
+        pagina = ronda.stop
+
+        elementos = []
+        for n in ronda:
+            contenido, total = resultados[n]
+            if not contenido:
+                # Página fallida o vacía: no se puede seguir en orden
+                limite = pagina
+                break
+            elementos.extend(contenido)
+            if total is not None:
+                limite = min(limite, total)
+                if n + 1 >= limite:
+                    break
@@ -3,11 +3,12 @@
 Busca deals de Xbox usando CheapShark API
 """
 
-import requests
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin
 
 
-class ConsoleHunter:
+class ConsoleHunter(HunterAsyncMixin):
     """
     Busca deals de Xbox
     """
@@ -16,6 +17,7 @@ class ConsoleHunter:
         self.min_discount = min_discount
         self.cheapshark_url = "https://www.cheapshark.com/api/1.0/deals"
         self.xbox_store_id = "30"  # Microsoft Store en CheapShark
+        self.session = obtener_cliente()
     
     def obtener_xbox_deals(self):
         """
@@ -36,7 +38,7 @@ class ConsoleHunter:
                 'pageSize': 60
             }
             
-            response = requests.get(self.cheapshark_url, params=params, timeout=10)
+            response = self.session.get(self.cheapshark_url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -3,7 +3,8 @@ Sistema de notificaciones de Discord para HunDea v3
 Maneja los 5 webhooks y formatos de mensajes
 """
 
-import requests
+from modules.http_client import obtener_cliente
+from modules.tiendas import obtener_tiendas
 from datetime import datetime
 
 class DiscordNotifier:
@@ -50,14 +51,10 @@ class DiscordNotifier:
         self.rol_weekends = rol_weekends
         self.rol_deals = rol_deals
         self.rol_todos = rol_todos
+        self.session = obtener_cliente()
         
-        # Colores por tienda
-        self.colores_tienda = {
-            'Epic Games': 0x00D9FF,
-            'Steam': 0x1B2838,
-            'GOG': 0x86328A,
-            'Itch.io': 0xFA5C5C
-        }
+        # Colores por tienda (registro compartido)
+        self.tiendas = obtener_tiendas()
     
     def enviar_juego_premium(self, juego, score, estrellas):
         """
@@ -183,7 +180,7 @@ class DiscordNotifier:
                 content += f" <@&{rol_target}>"
             
             # Crear embed
-            color = self.colores_tienda.get(juego['tienda'], 0x00D9FF)
+            color = self.tiendas.color(juego['tienda'])
             
             embed = {
                 "title": f"💸 {juego['titulo']}",
@@ -225,6 +222,20 @@ class DiscordNotifier:
                     "inline": False
                 })
             
+            # Mínimo histórico (ITAD)
+            if juego.get('minimo_historico') is not None:
+                if juego.get('es_minimo_historico'):
+                    valor_minimo = "**¡Precio más bajo de la historia!**"
+                else:
+                    valor_minimo = f"{simbolo_moneda}{juego['minimo_historico']:.2f}"
+                if juego.get('minimo_tienda') is not None:
+                    valor_minimo += f" • en {juego['tienda']}: {simbolo_moneda}{juego['minimo_tienda']:.2f}"
+                embed['fields'].append({
+                    "name": "📉 Mínimo histórico",
+                    "value": valor_minimo,
+                    "inline": False
+                })
+            
             # Fecha de fin
             if juego.get('fecha_fin'):
                 embed['fields'].append({
@@ -243,7 +254,7 @@ class DiscordNotifier:
                 "embeds": [embed]
             }
             
-            response = requests.post(webhook_target, json=payload)
+            response = self.session.post(webhook_target, json=payload)
             
             if response.status_code == 204:
                 print(f"✅ Oferta enviada: {juego['titulo']} (-{descuento}%)")
@@ -287,7 +298,7 @@ class DiscordNotifier:
             }
             
             # Enviar
-            response = requests.post(webhook, json=payload, timeout=10)
+            response = self.session.post(webhook, json=payload)
             
             if response.status_code == 204:
                 print(f"✅ Enviado a Discord ({tipo}): {juego['titulo']}")
@@ -316,7 +327,7 @@ class DiscordNotifier:
             dict: Embed de Discord
         """
         tienda = juego.get('tienda', 'Desconocida')
-        color = self.colores_tienda.get(tienda, 0x00D9FF)
+        color = self.tiendas.color(tienda)
         
         # Título según tipo
         if tipo == "todos":
@@ -0,0 +1,185 @@
+"""
+Detección de casi-duplicados para HunDea v3
+Índice MinHash/LSH sobre trigramas del título normalizado: agrupa el mismo
+juego publicado con nombres distintos en varias tiendas ("GTA V Premium
+Edition" / "Grand Theft Auto V") sin comparar todos contra todos
+"""
+
+import re
+import threading
+import zlib
+from functools import lru_cache
+
+from modules.normalizacion import normalizar_titulo
+
+# Palabras de edición que se ignoran al final del título
+PALABRAS_EDICION = frozenset([
+    'edition', 'deluxe', 'premium', 'gold', 'ultimate', 'complete', 'definitive',
+    'goty', 'standard', 'digital', 'enhanced', 'special', 'anniversary', 'bundle',
+])
+
+_GOTY = re.compile(r'\bgame of (?:the )?year\b')
+_NUMERO = re.compile(r'^(?:\d+|[ivx]{1,4})$')
+
+# Primo de Mersenne para las permutaciones de MinHash
+_PRIMO = (1 << 61) - 1
+
+
+def forma_base(titulo):
+    """
+    Título normalizado sin las palabras de edición finales
+
+    "GTA V Premium Edition" → "gta v"
+
+    Args:
+        titulo (str): Título original
+
+    Returns:
+        str: Forma comparable
+    """
+    palabras = _GOTY.sub('goty', normalizar_titulo(titulo)).split()
+    while len(palabras) > 1 and palabras[-1] in PALABRAS_EDICION:
+        palabras.pop()
+    return ' '.join(palabras)
+
+
+def variantes_acronimo(forma):
+    """
+    Variantes con las primeras palabras abreviadas a sus iniciales
+
+    "grand theft auto v" → ["gta v"]. Solo se abrevian 3 o más palabras.
+
+    Args:
+        forma (str): Forma base
+
+    Returns:
+        list: Variantes abreviadas
+    """
+    palabras = forma.split()
+    variantes = []
+    for k in range(3, len(palabras) + 1):
+        prefijo = palabras[:k]
+        if any(_NUMERO.match(p) for p in prefijo):
+            break
+        variantes.append(' '.join([''.join(p[0] for p in prefijo)] + palabras[k:]))
+    return variantes
+
+
+def _shingles(forma):
+    """Trigramas de caracteres (con bordes)"""
+    texto = f" {forma} "
+    return frozenset(texto[i:i + 3] for i in range(max(1, len(texto) - 2)))
+
+
+def _numeros(forma):
+    """Números y numerales romanos del título (distinguen secuelas)"""
+    return frozenset(p for p in forma.split() if _NUMERO.match(p))
+
+
+def _jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class IndiceDuplicados:
+    """
+    Agrupa títulos casi iguales en tiempo sublineal
+
+    Tres vías, todas por búsqueda en diccionario:
+      1. Forma base idéntica
+      2. Acrónimo de un título contra la forma completa del otro
+      3. MinHash/LSH sobre trigramas, verificado con Jaccard >= umbral
+         y con los mismos números (Witcher 2 ≠ Witcher 3)
+    """
+
+    def __init__(self, umbral=0.8, num_hashes=64, bandas=16):
+        """
+        Args:
+            umbral (float): Similitud Jaccard mínima (0-1) para considerar duplicado
+            num_hashes (int): Funciones hash de la firma MinHash
+            bandas (int): Bandas LSH (num_hashes debe ser múltiplo)
+        """
+        self.umbral = umbral
+        self.bandas = bandas
+        self.filas = num_hashes // bandas
+        self._semillas = [
+            (zlib.crc32(f"a{i}".encode()) | 1, zlib.crc32(f"b{i}".encode()))
+            for i in range(self.filas * bandas)
+        ]
+        self._firma = lru_cache(maxsize=8192)(self._calcular_firma)
+
+        self._por_forma = {}       # forma -> clave del grupo
+        self._por_acronimo = {}    # variante abreviada -> clave del grupo
+        self._cubetas = {}         # (banda, hash) -> [forma]
+        self._lock = threading.Lock()
+
+    def _calcular_firma(self, forma):
+        hashes = [zlib.crc32(s.encode()) for s in _shingles(forma)]
+        return tuple(min((a * h + b) % _PRIMO for h in hashes) for a, b in self._semillas)
+
+    def _claves_banda(self, firma):
+        return [
+            (i, hash(firma[i * self.filas:(i + 1) * self.filas]))
+            for i in range(self.bandas)
+        ]
+
+    def _buscar(self, forma):
+        """Clave del grupo al que pertenece `forma` o None"""
+        if forma in self._por_forma:
+            return self._por_forma[forma]
+
+        # "gta v" contra "grand theft auto v" y viceversa
+        if forma in self._por_acronimo:
+            return self._por_acronimo[forma]
+        for variante in variantes_acronimo(forma):
+            if variante in self._por_forma:
+                return self._por_forma[variante]
+
+        if self.umbral >= 1:
+            return None
+
+        shingles = _shingles(forma)
+        numeros = _numeros(forma)
+        candidatos = set()
+        for clave_banda in self._claves_banda(self._firma(forma)):
+            candidatos.update(self._cubetas.get(clave_banda, ()))
+
+        mejor, mejor_similitud = None, self.umbral
+        for candidato in candidatos:
+            if _numeros(candidato) != numeros:
+                continue
+            similitud = _jaccard(shingles, _shingles(candidato))
+            if similitud >= mejor_similitud:
+                mejor, mejor_similitud = candidato, similitud
+
+        return self._por_forma[mejor] if mejor else None
+
+    def _agregar(self, forma, clave):
+        self._por_forma[forma] = clave
+        for variante in variantes_acronimo(forma):
+            self._por_acronimo.setdefault(variante, clave)
+        if self.umbral < 1:
+            for clave_banda in self._claves_banda(self._firma(forma)):
+                self._cubetas.setdefault(clave_banda, []).append(forma)
+
+    def agrupar(self, titulo):
+        """
+        Devuelve el grupo del título, creándolo si es nuevo
+
+        Args:
+            titulo (str): Título original
+
+        Returns:
+            tuple: (clave del grupo, True si el grupo es nuevo)
+        """
+        forma = forma_base(titulo)
+        with self._lock:
+            clave = self._buscar(forma)
+            if clave is not None:
+                if forma not in self._por_forma:
+                    self._agregar(forma, clave)
+                return clave, False
+
+            self._agregar(forma, forma)
+            return forma, True
@@ -3,16 +3,18 @@ Detector mejorado de juegos gratis de Epic Games
 Con soporte para reviews
 """
 
-import requests
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin
 
-class EpicHunter:
+class EpicHunter(HunterAsyncMixin):
     """
     Busca juegos gratis en Epic Games Store
     """
     
     def __init__(self):
         self.api_url = "https://store-site-backend-static-ipv4.ak.epicgames.com/freeGamesPromotions"
+        self.session = obtener_cliente()
     
     def obtener_juegos_gratis(self):
         """
@@ -25,10 +27,9 @@ class EpicHunter:
         
         try:
             print("🔍 Consultando Epic Games Store...")
-            response = requests.get(
+            response = self.session.get(
                 self.api_url, 
-                params={'locale': 'es-ES', 'country': 'CO'}, 
-                timeout=10
+                params={'locale': 'es-ES', 'country': 'CO'}
             )
             response.raise_for_status()
             
@@ -0,0 +1,226 @@
+"""
+Fusión de juegos de todas las fuentes para HunDea v3
+Una sola pasada por lote: clasifica (gratis / oferta / free weekend /
+descartado), agrupa por identidad del juego y conserva la mejor versión
+entre todas las tiendas
+"""
+
+import threading
+
+from modules.duplicados import IndiceDuplicados
+
+
+def es_mejor(juego, existente, categoria='oferta'):
+    """
+    Política de conservación entre dos versiones del mismo juego
+
+    Ofertas: gana el menor precio. Gratis: gana el que tenga más reviews
+    (aunque alguna versión sea un 100% de descuento con precio 0). Los
+    valores ausentes o None cuentan como el peor caso.
+
+    Args:
+        juego (dict): Versión candidata
+        existente (dict): Versión conservada hasta ahora
+        categoria (str): 'gratis' u 'oferta'
+
+    Returns:
+        bool: True si `juego` debe reemplazar a `existente` (en un empate
+            ninguna reemplaza a la otra)
+    """
+    if categoria == 'gratis':
+        return (juego.get('reviews_count') or 0) > (existente.get('reviews_count') or 0)
+
+    precio = juego.get('precio_actual')
+    precio_existente = existente.get('precio_actual')
+    return (precio if precio is not None else float('inf')) < \
+        (precio_existente if precio_existente is not None else float('inf'))
+
+
+class FusionJuegos:
+    """
+    Etapa de fusión: clasifica y deduplica todos los lotes
+
+    Los juegos gratis salen en cuanto llegan (la mejor versión del lote,
+    por reviews); si el mismo juego aparece después en otra fuente solo
+    cuenta como duplicado, porque ya pudo anunciarse. De ellos solo se
+    guarda la clave del grupo.
+
+    Las ofertas conservan su mejor versión entre todas las fuentes (menor
+    precio) y se entregan con vaciar(), cuando ya llegaron todos los lotes:
+    el resultado no depende del orden en que terminan las fuentes. Los
+    empates los gana la fuente que va primero en `orden_fuentes`.
+    """
+
+    def __init__(self, fuentes_ofertas, descuento_maximo=None, umbral=0.8, fuentes_weekend=('steam_weekends',),
+                 orden_fuentes=None):
+        """
+        Args:
+            fuentes_ofertas (list): Fuentes cuyos juegos son ofertas con descuento
+            descuento_maximo (float, optional): Ofertas por encima se descartan
+                (100% siempre se considera gratis)
+            umbral (float): Similitud mínima para casi duplicados
+            fuentes_weekend (tuple): Fuentes de free weekends (no se deduplican)
+            orden_fuentes (list, optional): Prioridad de las fuentes en empates
+                y orden de salida (por defecto, orden de llegada)
+        """
+        self.fuentes_ofertas = set(fuentes_ofertas)
+        self.fuentes_weekend = set(fuentes_weekend)
+        self.descuento_maximo = descuento_maximo
+        self.prioridad = {fuente: n for n, fuente in enumerate(orden_fuentes or [])}
+        self.indices = {
+            'gratis': IndiceDuplicados(umbral),
+            'oferta': IndiceDuplicados(umbral),
+        }
+        # id_canonico -> clave del grupo, y clave del grupo -> id_canonico
+        self.por_id = {'gratis': {}, 'oferta': {}}
+        self.id_de_grupo = {'gratis': {}, 'oferta': {}}
+        # clave -> (orden, fuente, juego) de la mejor oferta hasta ahora
+        self._ofertas = {}
+        # Claves de los juegos gratis que ya salieron
+        self._gratis_emitidos = set()
+        self.duplicados_por_fuente = {}
+        self.descartados = 0
+        self._lock = threading.Lock()
+
+    def clasificar(self, fuente, juego):
+        """
+        Categoría de un juego según su fuente y descuento
+
+        Args:
+            fuente (str): Nombre de la fuente
+            juego (dict): Juego
+
+        Returns:
+            str: 'weekend', 'gratis', 'oferta' o None (descartado)
+        """
+        if fuente in self.fuentes_weekend:
+            return 'weekend'
+        if fuente not in self.fuentes_ofertas:
+            return 'gratis'
+
+        descuento = juego.get('descuento_porcentaje', 0) or 0
+        if descuento >= 100:
+            # 100% descuento = GRATIS
+            juego['tipo'] = 'gratis'
+            return 'gratis'
+        if self.descuento_maximo and descuento > self.descuento_maximo:
+            return None
+        return 'oferta'
+
+    def clave(self, categoria, juego):
+        """
+        Identidad del juego dentro de su categoría
+
+        El id canónico (ITAD) manda sobre el título: dos títulos distintos con
+        el mismo id son el mismo juego, y dos ids distintos nunca se fusionan.
+
+        Args:
+            categoria (str): 'gratis' u 'oferta'
+            juego (dict): Juego
+
+        Returns:
+            tuple: (clave del grupo, True si es la primera vez que aparece)
+        """
+        id_canonico = juego.get('id_canonico')
+        por_id = self.por_id[categoria]
+        id_de_grupo = self.id_de_grupo[categoria]
+
+        if id_canonico and id_canonico in por_id:
+            self.indices[categoria].agrupar(juego['titulo'])
+            return por_id[id_canonico], False
+
+        clave, nuevo = self.indices[categoria].agrupar(juego['titulo'])
+
+        if id_canonico:
+            otro_id = id_de_grupo.get(clave)
+            if otro_id and otro_id != id_canonico:
+                # Mismo título aproximado pero otro juego según ITAD
+                clave, nuevo = id_canonico, True
+            por_id[id_canonico] = clave
+            id_de_grupo.setdefault(clave, id_canonico)
+
+        return clave, nuevo
+
+    def procesar_lote(self, fuente, juegos):
+        """
+        Clasifica un lote: entrega los gratis nuevos y retiene las ofertas
+
+        Args:
+            fuente (str): Nombre de la fuente
+            juegos (list): Juegos del lote
+
+        Returns:
+            list: Tuplas (categoria, juego) de free weekends y juegos gratis
+                que continúan ya por el pipeline; las ofertas salen con vaciar()
+        """
+        salida = []
+        gratis = {}  # clave -> (posicion, juego) de la mejor versión del lote
+
+        with self._lock:
+            prioridad = self.prioridad.setdefault(fuente, len(self.prioridad))
+
+            for posicion, juego in enumerate(juegos):
+                categoria = self.clasificar(fuente, juego)
+
+                if categoria is None:
+                    self.descartados += 1
+                    continue
+
+                if categoria == 'weekend':
+                    salida.append((posicion, 'weekend', juego))
+                    continue
+
+                clave, _ = self.clave(categoria, juego)
+
+                if categoria == 'gratis':
+                    if clave in self._gratis_emitidos:
+                        # Ya salió con un lote anterior
+                        self._contar_duplicado(fuente)
+                    elif clave not in gratis:
+                        gratis[clave] = (posicion, juego)
+                    else:
+                        if es_mejor(juego, gratis[clave][1], 'gratis'):
+                            gratis[clave] = (posicion, juego)
+                        self._contar_duplicado(fuente)
+                    continue
+
+                orden = (prioridad, posicion)
+                actual = self._ofertas.get(clave)
+
+                if actual is None:
+                    self._ofertas[clave] = (orden, fuente, juego)
+                    continue
+
+                orden_actual, fuente_actual, existente = actual
+                mejor = es_mejor(juego, existente, categoria)
+                empate = not mejor and not es_mejor(existente, juego, categoria)
+                if mejor or (empate and orden < orden_actual):
+                    self._ofertas[clave] = (orden, fuente, juego)
+                    self._contar_duplicado(fuente_actual)
+                else:
+                    self._contar_duplicado(fuente)
+
+            self._gratis_emitidos.update(gratis)
+            salida.extend((posicion, 'gratis', juego) for posicion, juego in gratis.values())
+
+        return [(categoria, juego) for _, categoria, juego in sorted(salida, key=lambda x: x[0])]
+
+    def _contar_duplicado(self, fuente):
+        self.duplicados_por_fuente[fuente] = self.duplicados_por_fuente.get(fuente, 0) + 1
+
+    def vaciar(self):
+        """
+        Entrega la mejor versión de cada oferta una vez que llegaron todos los lotes
+
+        Returns:
+            list: Tuplas ('oferta', juego) en orden de fuente y de posición
+        """
+        with self._lock:
+            ganadores = sorted(self._ofertas.values(), key=lambda x: x[0])
+            self._ofertas = {}
+        return [('oferta', juego) for _, _, juego in ganadores]
+
+    @property
+    def total_duplicados(self):
+        """Duplicados eliminados en todas las fuentes"""
+        return sum(self.duplicados_por_fuente.values())
@@ -3,11 +3,12 @@
 Busca SOLO juegos gratis completos (NO keys, codes, DLCs)
 """
 
-import requests
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin
 
 
-class GamerPowerHunter:
+class GamerPowerHunter(HunterAsyncMixin):
     """
     Busca SOLO juegos completos en GamerPower
     FILTRA: Keys, Codes, DLCs, Skins, Packs, etc.
@@ -15,6 +16,7 @@ class GamerPowerHunter:
     
     def __init__(self):
         self.api_url = "https://www.gamerpower.com/api/giveaways"
+        self.session = obtener_cliente()
         
         # BLACKLIST - Filtrar toda esta basura
         self.spam_keywords = [
@@ -62,7 +64,7 @@ class GamerPowerHunter:
         
         try:
             print("🔍 Consultando GamerPower API...")
-            response = requests.get(self.api_url, timeout=10)
+            response = self.session.get(self.api_url)
             response.raise_for_status()
             
             data = response.json()
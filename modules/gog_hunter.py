@@ -3,10 +3,11 @@ Detector de juegos gratis en GOG
 GOG ocasionalmente tiene giveaways gratuitos
 """
 
-import requests
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin
 
-class GOGHunter:
+class GOGHunter(HunterAsyncMixin):
     """
     Busca giveaways gratuitos en GOG
     """
@@ -14,6 +15,7 @@ class GOGHunter:
     def __init__(self):
         self.base_url = "https://www.gog.com"
         self.api_url = "https://api.gog.com"
+        self.session = obtener_cliente()
     
     def obtener_juegos_gratis(self):
         """
@@ -39,7 +41,7 @@ class GOGHunter:
                 'page': 1
             }
             
-            response = requests.get(url, params=params, timeout=10, headers={
+            response = self.session.get(url, params=params, headers={
                 'User-Agent': 'Mozilla/5.0'
             })
             
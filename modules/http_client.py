@@ -0,0 +1,180 @@
+"""
+Cliente HTTP compartido para HunDea v3
+Una sola sesión para todos los hunters y notificadores: pools de conexiones
+por host con keep-alive, reintentos con backoff exponencial + jitter en
+429/5xx, un timeout uniforme, limitador de tasa por host (también en
+cada reintento) y tope de peticiones simultáneas por host
+"""
+
+import threading
+import requests
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from modules.rate_limiter import LimitadorConcurrencia, LimitadorTasa
+
+# Códigos que se reintentan (rate limit y errores del servidor)
+CODIGOS_REINTENTO = (429, 500, 502, 503, 504)
+
+
+def _es_idempotente(metodo):
+    """Indica si repetir el método no cambia el resultado (GET, PUT, DELETE...)"""
+    return bool(metodo) and metodo.upper() in Retry.DEFAULT_ALLOWED_METHODS
+
+
+class _RetryHunDea(Retry):
+    """
+    Retry de urllib3 que también reintenta POST, pero solo ante 429 con Retry-After
+
+    Un 429 garantiza que el servidor no procesó la petición (no hay riesgo de
+    publicar dos veces en Discord). Un 5xx, un timeout de lectura o una
+    conexión cortada en un POST no se reintentan: el servidor pudo haberlo
+    procesado. Los errores al conectar sí, porque la petición no llegó a salir.
+
+    Cada reintento pasa por el limitador de tasa del host antes de salir,
+    igual que el primer intento.
+    """
+
+    # LimitadorTasa compartido y host del último intento (los fija ClienteHTTP / increment)
+    limitador = None
+    host = None
+
+    def new(self, **kw):
+        nuevo = super().new(**kw)
+        nuevo.limitador = self.limitador
+        nuevo.host = self.host
+        return nuevo
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if not _es_idempotente(method) and not (status_code == 429 and has_retry_after):
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if error is not None and not _es_idempotente(method) and not self._is_connection_error(error):
+            raise error
+        nuevo = super().increment(method, url, response, error, _pool, _stacktrace)
+        if _pool is not None:
+            nuevo.host = _pool.host
+        if self.limitador and response is not None:
+            self.limitador.actualizar_desde_headers(nuevo.host, response.headers, response.status)
+        return nuevo
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        if self.limitador and self.host:
+            self.limitador.adquirir(self.host)
+
+
+class ClienteHTTP(requests.Session):
+    """
+    Sesión de requests con reintentos, pools por host, timeout por defecto
+    y limitador de tasa por host
+    """
+
+    def __init__(self, timeout=15, reintentos=3, backoff=0.5, jitter=0.5, pool_maxsize=16, limitador=None,
+                 concurrencia=None):
+        """
+        Args:
+            timeout (float): Timeout por defecto en segundos
+            reintentos (int): Reintentos máximos por petición
+            backoff (float): Factor de backoff exponencial (0.5 → 0.5s, 1s, 2s...)
+            jitter (float): Segundos aleatorios máximos añadidos a cada espera
+            pool_maxsize (int): Conexiones keep-alive por host
+            limitador (LimitadorTasa, optional): Token buckets por host
+            concurrencia (LimitadorConcurrencia, optional): Peticiones simultáneas
+                por host (por defecto, pool_maxsize)
+        """
+        super().__init__()
+        self.timeout = timeout
+        self.limitador = limitador or LimitadorTasa()
+        self.concurrencia = concurrencia or LimitadorConcurrencia(pool_maxsize)
+
+        parametros = dict(
+            total=reintentos,
+            connect=reintentos,
+            read=reintentos,
+            status=reintentos,
+            backoff_factor=backoff,
+            status_forcelist=CODIGOS_REINTENTO,
+            allowed_methods=frozenset(Retry.DEFAULT_ALLOWED_METHODS | {'POST'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        try:
+            retry = _RetryHunDea(backoff_jitter=jitter, **parametros)
+        except TypeError:
+            # urllib3 < 2.0 no soporta jitter
+            retry = _RetryHunDea(**parametros)
+        retry.limitador = self.limitador
+
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).hostname
+
+        with self.concurrencia.semaforo(host):
+            self.limitador.adquirir(host)
+            response = super().request(method, url, **kwargs)
+        self.limitador.actualizar_desde_headers(host, response.headers, response.status_code)
+
+        return response
+
+
+_cliente = None
+_cliente_lock = threading.Lock()
+
+
+def configurar_cliente(config):
+    """
+    Crea el cliente compartido a partir de config.json
+
+    Claves opcionales: http_timeout, http_reintentos, http_backoff,
+    http_jitter, http_pool_maxsize, rate_limits
+    (host -> {"por_segundo": float, "rafaga": int}), http_concurrencia_por_host
+    y http_concurrencia_hosts (host -> int)
+
+    Args:
+        config (dict): Configuración
+
+    Returns:
+        ClienteHTTP: Cliente compartido
+    """
+    global _cliente
+
+    with _cliente_lock:
+        _cliente = ClienteHTTP(
+            timeout=config.get('http_timeout', 15),
+            reintentos=config.get('http_reintentos', 3),
+            backoff=config.get('http_backoff', 0.5),
+            jitter=config.get('http_jitter', 0.5),
+            pool_maxsize=config.get('http_pool_maxsize', 16),
+            limitador=LimitadorTasa(config.get('rate_limits')),
+            concurrencia=LimitadorConcurrencia(
+                config.get('http_concurrencia_por_host', config.get('http_pool_maxsize', 16)),
+                config.get('http_concurrencia_hosts')
+            )
+        )
+        return _cliente
+
+
+def obtener_cliente():
+    """
+    Devuelve el cliente HTTP compartido (lo crea con valores por defecto)
+
+    Returns:
+        ClienteHTTP: Cliente compartido
+    """
+    global _cliente
+
+    with _cliente_lock:
+        if _cliente is None:
+            _cliente = ClienteHTTP()
+        return _cliente
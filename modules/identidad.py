@@ -0,0 +1,164 @@
+"""
+Identidad canónica de juegos para HunDea v3
+Asigna a cada juego su UUID de IsThereAnyDeal usando los endpoints de
+lookup en lote (Steam appid o título), con una tabla persistente de
+correspondencias para no repetir consultas entre ejecuciones
+"""
+
+from modules.http_client import obtener_cliente
+from modules.normalizacion import normalizar_titulo
+
+# ID de Steam en ITAD (/service/shops/v1)
+SHOP_STEAM = 61
+
+# Máximo de elementos por petición de lookup
+TAMANO_LOTE = 200
+
+
+class ResolvedorIdentidad:
+    """
+    Resuelve ids de tienda y títulos a ids de juego de ITAD, en lote
+    """
+
+    def __init__(self, api_key=None, cache=None, ttl_dias=30, ttl_negativo_dias=1):
+        """
+        Args:
+            api_key (str, optional): API key de ITAD (el lookup también funciona sin ella)
+            cache (CachePersistente, optional): Tabla persistente de correspondencias
+            ttl_dias (float): Vigencia de una correspondencia encontrada
+            ttl_negativo_dias (float): Vigencia de un "sin correspondencia"
+        """
+        self.base_url = "https://api.isthereanydeal.com"
+        self.api_key = api_key
+        self.cache = cache
+        self.ttl = ttl_dias * 86400
+        self.ttl_negativo = ttl_negativo_dias * 86400
+        self.memoria = {}
+        self.session = obtener_cliente()
+
+    def resolver_lote(self, juegos):
+        """
+        Asigna `itad_id` e `id_canonico` a los juegos que se puedan resolver
+
+        Primero por Steam appid (exacto) y después por título. Los resueltos
+        por appid quedan con `identidad_exacta` en True; los de título, en False.
+
+        Args:
+            juegos (list): Juegos de una o varias fuentes
+
+        Returns:
+            int: Juegos con identidad canónica
+        """
+        pendientes = [juego for juego in juegos if not juego.get('itad_id')]
+
+        # Steam appid: "app/<appid>" en la tienda 61
+        por_appid = {}
+        for juego in pendientes:
+            appid = juego.get('appid') or juego.get('steam_appid')
+            if appid and str(appid).isdigit():
+                por_appid.setdefault(f"app/{appid}", []).append(juego)
+
+        ids_steam = self._resolver('steam', por_appid, f"/lookup/id/shop/{SHOP_STEAM}/v1")
+
+        # Título para el resto
+        por_titulo = {}
+        for clave, grupo in por_appid.items():
+            if not ids_steam.get(clave):
+                for juego in grupo:
+                    por_titulo.setdefault(juego['titulo'], []).append(juego)
+        for juego in pendientes:
+            appid = juego.get('appid') or juego.get('steam_appid')
+            if not (appid and str(appid).isdigit()):
+                por_titulo.setdefault(juego['titulo'], []).append(juego)
+
+        ids_titulo = self._resolver('titulo', por_titulo, "/lookup/id/title/v1")
+
+        resueltos = 0
+        for agrupados, ids, exacta in ((por_appid, ids_steam, True), (por_titulo, ids_titulo, False)):
+            for clave, grupo in agrupados.items():
+                itad_id = ids.get(clave)
+                if not itad_id:
+                    continue
+                for juego in grupo:
+                    if not juego.get('itad_id'):
+                        juego['itad_id'] = itad_id
+                        juego['id_canonico'] = f"itad_{itad_id}"
+                        juego['identidad_exacta'] = exacta
+                        resueltos += 1
+
+        return resueltos
+
+    def _clave_cache(self, tipo, valor):
+        if tipo == 'titulo':
+            return f"titulo:{normalizar_titulo(valor)}"
+        return f"{tipo}:{valor}"
+
+    def _resolver(self, tipo, agrupados, endpoint):
+        """
+        Resuelve un conjunto de claves, consultando solo las que no están en cache
+
+        Args:
+            tipo (str): 'steam' o 'titulo' (prefijo en la tabla)
+            agrupados (dict): clave -> juegos
+            endpoint (str): Ruta del lookup
+
+        Returns:
+            dict: clave -> UUID de ITAD o None
+        """
+        resultado = {}
+        faltantes = []
+
+        for clave in agrupados:
+            clave_cache = self._clave_cache(tipo, clave)
+            if clave_cache in self.memoria:
+                resultado[clave] = self.memoria[clave_cache]
+                continue
+            if self.cache:
+                hit, guardado = self.cache.obtener('itad_id', clave_cache)
+                if hit:
+                    self.memoria[clave_cache] = guardado
+                    resultado[clave] = guardado
+                    continue
+            faltantes.append(clave)
+
+        for i in range(0, len(faltantes), TAMANO_LOTE):
+            bloque = faltantes[i:i + TAMANO_LOTE]
+            respuesta = self._consultar(endpoint, bloque)
+            if respuesta is None:
+                continue
+
+            for clave in bloque:
+                itad_id = respuesta.get(clave)
+                clave_cache = self._clave_cache(tipo, clave)
+                self.memoria[clave_cache] = itad_id
+                resultado[clave] = itad_id
+                if self.cache:
+                    self.cache.guardar(
+                        'itad_id', clave_cache, itad_id,
+                        self.ttl if itad_id else self.ttl_negativo
+                    )
+
+        return resultado
+
+    def _consultar(self, endpoint, valores):
+        """
+        POST de lookup con una lista de valores
+
+        Returns:
+            dict: valor -> UUID o None; None si la consulta falló
+        """
+        params = {'key': self.api_key} if self.api_key else None
+
+        try:
+            response = self.session.post(f"{self.base_url}{endpoint}", params=params, json=valores)
+
+            if response.status_code != 200:
+                print(f"   ⚠️ ITAD lookup respondió {response.status_code}")
+                return None
+
+            data = response.json()
+            return data if isinstance(data, dict) else None
+
+        except Exception as e:
+            print(f"   ⚠️ Error en ITAD lookup: {e}")
+            return None
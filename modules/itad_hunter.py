@@ -3,56 +3,61 @@
 Detector de juegos gratis usando IsThereAnyDeal API
 Detecta ofertas de múltiples tiendas: Steam, GOG, Humble, Epic, Uplay, etc.
 
-API completamente gratuita, sin necesidad de API key
+Usa /deals/v2 (requiere API key gratuita de isthereanydeal.com/apps)
 """
 
-import requests
 from datetime import datetime
-import time
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin, OfertasAsyncMixin
+from modules.concurrencia import ejecutar_en_paralelo, iterar_paginas
+from modules.tiendas import obtener_tiendas
 
-class IsThereAnyDealHunter:
+# Máximo permitido por /deals/v2
+LIMITE_PAGINA = 200
+
+class IsThereAnyDealHunter(HunterAsyncMixin, OfertasAsyncMixin):
     """
     Busca juegos gratis en múltiples tiendas usando IsThereAnyDeal API v2
     """
     
-    def __init__(self):
+    def __init__(self, api_key=None, pais='US', max_paginas=5, paginas_paralelas=5, filtro=None, cache=None, ttl_minimos_horas=12):
+        """
+        Args:
+            api_key (str): API key de ITAD (obligatoria para /deals/v2)
+            pais (str): Código de país ISO de 2 letras (precios y moneda)
+            max_paginas (int): Páginas de 200 deals como máximo por búsqueda
+            paginas_paralelas (int): Páginas pedidas a la vez
+            filtro (str, optional): Filtro de la web de ITAD (parámetro `filter`)
+            cache (CachePersistente, optional): Cache en disco de mínimos históricos
+            ttl_minimos_horas (float): Vigencia de los mínimos en cache
+        """
         self.base_url = "https://api.isthereanydeal.com"
+        self.api_key = api_key
+        self.pais = pais
+        self.max_paginas = max(1, max_paginas)
+        self.paginas_paralelas = max(1, paginas_paralelas)
+        self.filtro = filtro
+        self.cache = cache
+        self.ttl_minimos = ttl_minimos_horas * 3600
+        self.session = obtener_cliente()
         
-        # Mapeo de tiendas por ID
-        self.tiendas_map = {
-            'steam': {'nombre': 'Steam', 'emoji': '🔵'},
-            'gog': {'nombre': 'GOG', 'emoji': '🟣'},
-            'humblestore': {'nombre': 'Humble Store', 'emoji': '🟠'},
-            'epicgames': {'nombre': 'Epic Games', 'emoji': '⚫'},
-            'itchio': {'nombre': 'Itch.io', 'emoji': '🔴'},
-            'microsoft': {'nombre': 'Microsoft Store', 'emoji': '🟢'},
-            'origin': {'nombre': 'EA Origin', 'emoji': '🟠'},
-            'uplay': {'nombre': 'Ubisoft Connect', 'emoji': '🔵'},
-            'nuuvem': {'nombre': 'Nuuvem', 'emoji': '🟡'},
-            'greenmangaming': {'nombre': 'Green Man Gaming', 'emoji': '🟢'},
-            'fanatical': {'nombre': 'Fanatical', 'emoji': '🔴'},
-            'gamesplanet': {'nombre': 'Gamesplanet', 'emoji': '🔵'},
-            'gamersgate': {'nombre': 'GamersGate', 'emoji': '🟣'}
-        }
+        # Nombres, emojis e ids de tienda compartidos con el resto de hunters
+        self.tiendas = obtener_tiendas()
         
         # Estas tiendas suelen tener juegos gratis o promos permanentes
-        self.tiendas_prioritarias = [
-            'steam', 'gog', 'epicgames', 'itchio', 
-            'humblestore', 'microsoft'
-        ]
+        # (Steam, GOG, Epic, Humble, Microsoft). Itch.io no está: ITAD no la
+        # lista en /service/shops/v1 (sin id en TIENDAS_BASE) y la cubre ItchHunter
+        self.tiendas_prioritarias = [61, 35, 16, 37, 48]
         
         print("\n🌟 IsThereAnyDeal Hunter inicializado")
         print(f"   📍 Monitoreando {len(self.tiendas_prioritarias)} tiendas principales")
+        if not self.api_key:
+            print("   ⚠️ Sin API key de ITAD (itad_api_key): no se consultarán deals")
     
     def obtener_juegos_gratis(self):
         """
         Obtiene juegos que están 100% gratis (precio = $0)
         
-        Strategy:
-        1. Buscar deals recientes con precio actual = 0
-        2. Verificar que sean verdaderamente gratis (no beta access)
-        3. Filtrar duplicados entre tiendas
-        
         Returns:
             list: Lista de juegos gratis encontrados
         """
@@ -72,7 +77,11 @@ class IsThereAnyDealHunter:
     
     def _buscar_juegos(self, tipo='gratis', descuento_min=70):
         """
-        Busca juegos (gratis o con descuento)
+        Busca juegos (gratis o con descuento) en /deals/v2
+        
+        El servidor filtra por tiendas y ordena (precio ascendente para
+        gratis, descuento descendente para ofertas); se deja de paginar
+        cuando ya no hay coincidencias.
         
         Args:
             tipo (str): 'gratis' o 'descuento'
@@ -81,117 +90,116 @@ class IsThereAnyDealHunter:
         Returns:
             list: Lista de juegos encontrados
         """
-        juegos_encontrados = []
+        if not self.api_key:
+            return []
+        
+        if tipo == 'gratis':
+            print("\n🔍 Consultando IsThereAnyDeal API (juegos gratis)...")
+        else:
+            print(f"\n💰 Consultando IsThereAnyDeal API (descuentos {descuento_min}%+)...")
+        
+        orden = 'price' if tipo == 'gratis' else '-cut'
+        juegos = []
+        vistos = set()
         
         try:
-            if tipo == 'gratis':
-                print("\n🔍 Consultando IsThereAnyDeal API (juegos gratis)...")
-            else:
-                print(f"\n💰 Consultando IsThereAnyDeal API (descuentos {descuento_min}%+)...")
-            
-            # Buscar en las tiendas prioritarias
-            for tienda_id in self.tiendas_prioritarias:
-                print(f"   🏪 Revisando {self.tiendas_map[tienda_id]['nombre']}...")
+            for item in self.iterar_deals(orden):
+                deal = item.get('deal') or {}
+                precio = deal.get('price', {}).get('amount')
+                descuento = deal.get('cut', 0)
                 
-                juegos = self._buscar_en_tienda(tienda_id, tipo=tipo, descuento_min=descuento_min)
+                if tipo == 'gratis':
+                    if precio != 0:
+                        # Ordenado por precio: no habrá más gratis
+                        break
+                elif descuento < descuento_min:
+                    # Ordenado por descuento: el resto es menor
+                    break
+                elif not precio:
+                    continue
                 
-                if juegos:
-                    tipo_texto = "gratis" if tipo == 'gratis' else f"con {descuento_min}%+ descuento"
-                    print(f"      ✅ Encontrados {len(juegos)} juego(s) {tipo_texto}")
-                    juegos_encontrados.extend(juegos)
-                    
-                # Rate limiting: pequeña pausa entre requests
-                time.sleep(0.5)
-            
-            # Eliminar duplicados (mismo juego en diferentes tiendas)
-            juegos_unicos = self._eliminar_duplicados(juegos_encontrados)
+                if item.get('type') not in (None, 'game') or item.get('id') in vistos:
+                    continue
+                
+                juego_info = self._extraer_info_juego(item, deal, tipo=tipo)
+                if juego_info:
+                    vistos.add(item['id'])
+                    juegos.append(juego_info)
             
-            if juegos_unicos:
-                tipo_texto = "gratis" if tipo == 'gratis' else f"con descuento"
-                print(f"\n✨ Total IsThereAnyDeal: {len(juegos_unicos)} juego(s) {tipo_texto} únicos")
+            if juegos:
+                tipo_texto = "gratis" if tipo == 'gratis' else "con descuento"
+                print(f"\n✨ Total IsThereAnyDeal: {len(juegos)} juego(s) {tipo_texto} únicos")
             else:
                 tipo_texto = "gratis" if tipo == 'gratis' else "con descuento"
                 print(f"\n💤 IsThereAnyDeal: No hay juegos {tipo_texto} nuevos")
             
-            return juegos_unicos
+            return juegos
         
         except Exception as e:
             print(f"\n❌ Error en IsThereAnyDeal: {e}")
             return []
     
-    def _buscar_en_tienda(self, tienda_id, tipo='gratis', descuento_min=70):
+    def iterar_deals(self, orden):
         """
-        Busca juegos en una tienda específica
+        Recorre las páginas de /deals/v2 y entrega cada item en orden
+        
+        La primera página se pide sola; el resto solo si indica hasMore, en
+        rondas paralelas dentro del presupuesto max_paginas, y se deja de
+        pedir en cuanto una página dice que no hay más. Como es un generador,
+        el consumidor corta la paginación al dejar de iterar.
         
         Args:
-            tienda_id (str): ID de la tienda
-            tipo (str): 'gratis' o 'descuento'
-            descuento_min (int): Porcentaje mínimo de descuento
+            orden (str): Orden del servidor ('price' o '-cut')
+        
+        Yields:
+            dict: Items de /deals/v2 ({'id', 'title', 'type', 'deal', ...})
+        """
+        def pagina(numero):
+            data = self._obtener_pagina(numero * LIMITE_PAGINA, orden)
+            if data is None:
+                return None, None
+            # Sin hasMore esta es la última página
+            return data.get('list', []), None if data.get('hasMore') else numero + 1
+        
+        yield from iterar_paginas(pagina, self.max_paginas, self.paginas_paralelas)
+    
+    def _obtener_pagina(self, offset, orden):
+        """
+        Pide una página de /deals/v2
+        
+        Args:
+            offset (int): Desplazamiento en la lista de deals
+            orden (str): Orden del servidor ('price' o '-cut')
         
         Returns:
-            list: Juegos encontrados
+            dict: Respuesta {'list', 'hasMore', 'nextOffset'} o None
         """
-        juegos = []
+        params = {
+            'key': self.api_key,
+            'country': self.pais,
+            'offset': offset,
+            'limit': LIMITE_PAGINA,
+            'sort': orden,
+            'shops': ','.join(str(tienda) for tienda in self.tiendas_prioritarias)
+        }
+        if self.filtro:
+            params['filter'] = self.filtro
         
-        try:
-            # ITAD API v2: Buscar deals con precio 0
-            url = f"{self.base_url}/v02/web/search/"
-            
-            params = {
-                'q': '',  # Búsqueda vacía para obtener todos
-                'region': 'us',
-                'country': 'US',
-                'shops': tienda_id,
-                'offset': 0,
-                'limit': 20  # Limitar resultados
-            }
-            
-            response = requests.get(url, params=params, timeout=15)
-            
-            if response.status_code != 200:
-                return juegos
-            
-            data = response.json()
-            
-            # Procesar resultados
-            if 'data' in data and 'list' in data['data']:
-                for item in data['data']['list']:
-                    # Buscar la mejor oferta actual
-                    if 'deals' in item and item['deals']:
-                        mejor_deal = min(item['deals'], key=lambda x: x.get('price', {}).get('amount', float('inf')))
-                        
-                        precio_actual = mejor_deal.get('price', {}).get('amount', 999)
-                        precio_regular = mejor_deal.get('regular', {}).get('amount', 999)
-                        descuento = mejor_deal.get('cut', 0)
-                        
-                        # Filtrar según el tipo
-                        agregar = False
-                        
-                        if tipo == 'gratis' and precio_actual == 0:
-                            agregar = True
-                        elif tipo == 'descuento' and descuento >= descuento_min and precio_actual > 0:
-                            agregar = True
-                        
-                        if agregar:
-                            juego_info = self._extraer_info_juego(item, mejor_deal, tienda_id, tipo=tipo)
-                            if juego_info:
-                                juegos.append(juego_info)
-        
-        except requests.Timeout:
-            print(f"      ⚠️ Timeout en {tienda_id}")
-        except Exception as e:
-            print(f"      ⚠️ Error en {tienda_id}: {str(e)[:50]}")
+        response = self.session.get(f"{self.base_url}/deals/v2", params=params)
+        
+        if response.status_code != 200:
+            print(f"      ⚠️ ITAD /deals/v2 respondió {response.status_code} (offset {offset})")
+            return None
         
-        return juegos
+        return response.json()
     
-    def _extraer_info_juego(self, item, deal, tienda_id, tipo='gratis'):
+    def _extraer_info_juego(self, item, deal, tipo='gratis'):
         """
         Extrae información del juego en formato estándar
         
         Args:
-            item (dict): Datos del juego de ITAD
-            deal (dict): Datos del deal
-            tienda_id (str): ID de la tienda
+            item (dict): Juego de /deals/v2
+            deal (dict): Mejor deal actual del juego
             tipo (str): 'gratis' o 'descuento'
         
         Returns:
@@ -200,7 +208,7 @@ class IsThereAnyDealHunter:
         try:
             titulo = item.get('title', 'Juego sin título')
             
-            # ID único del juego
+            # ID único del juego (UUID de ITAD)
             game_id = item.get('id', '')
             if not game_id:
                 return None
@@ -212,32 +220,26 @@ class IsThereAnyDealHunter:
             
             # Fecha de fin (si existe)
             fecha_fin = None
-            if 'expiry' in deal:
+            if deal.get('expiry'):
                 try:
-                    timestamp = deal['expiry']
-                    if timestamp:
-                        fecha_fin = datetime.fromtimestamp(timestamp)
-                except:
+                    fecha_fin = datetime.fromisoformat(deal['expiry'].replace('Z', '+00:00'))
+                except ValueError:
                     pass
             
             # Info de la tienda
-            tienda_info = self.tiendas_map.get(tienda_id, {
-                'nombre': tienda_id.title(),
+            tienda = deal.get('shop') or {}
+            tienda_id = tienda.get('id')
+            tienda_info = self.tiendas.por_itad(tienda_id) or {
+                'nombre': tienda.get('name') or str(tienda_id),
                 'emoji': '🏪'
-            })
-            
-            # Información de precio (para descuentos)
-            precio_info = {}
-            if tipo == 'descuento':
-                precio_info = {
-                    'precio_actual': deal.get('price', {}).get('amount', 0),
-                    'precio_regular': deal.get('regular', {}).get('amount', 0),
-                    'descuento_porcentaje': deal.get('cut', 0),
-                    'moneda': deal.get('price', {}).get('currency', 'USD')
-                }
+            }
             
             juego_base = {
                 'id': f"itad_{tienda_id}_{game_id}",
+                'itad_id': game_id,
+                'identidad_exacta': True,
+                'itad_shop_id': tienda_id,
+                'id_canonico': f"itad_{game_id}",
                 'titulo': titulo,
                 'tienda': tienda_info['nombre'],
                 'tienda_emoji': tienda_info['emoji'],
@@ -254,7 +256,17 @@ class IsThereAnyDealHunter:
             
             # Agregar info de precio si es descuento
             if tipo == 'descuento':
-                juego_base.update(precio_info)
+                juego_base.update({
+                    'precio_actual': deal.get('price', {}).get('amount', 0),
+                    'precio_regular': deal.get('regular', {}).get('amount', 0),
+                    'descuento_porcentaje': deal.get('cut', 0),
+                    'moneda': deal.get('price', {}).get('currency', 'USD')
+                })
+                # /deals/v2 ya trae los mínimos: no hace falta pedirlos aparte
+                self._aplicar_minimos(juego_base, {
+                    'historico': self._precio(deal.get('historyLow')),
+                    'tiendas': {str(tienda_id): self._precio(deal.get('storeLow'))}
+                })
             
             return juego_base
         
@@ -273,59 +285,267 @@ class IsThereAnyDealHunter:
             str: URL de la imagen o None
         """
         # ITAD proporciona imágenes en diferentes tamaños
-        if 'assets' in item:
-            assets = item['assets']
-            
-            # Prioridad: banner, cover, logo
-            for tipo in ['banner600', 'cover', 'logo']:
-                if tipo in assets and assets[tipo]:
-                    return assets[tipo]
+        assets = item.get('assets') or {}
+        
+        # Prioridad: banner grande, boxart, banners menores
+        for tipo in ['banner600', 'boxart', 'banner400', 'banner300']:
+            if assets.get(tipo):
+                return assets[tipo]
         
         return None
     
-    def _eliminar_duplicados(self, juegos):
+    def obtener_precios(self, game_ids, solo_ofertas=True):
         """
-        Elimina juegos duplicados (mismo título, diferentes tiendas)
-        Prioriza por: 1) Epic Games, 2) GOG, 3) Steam, 4) Otras
+        Precios actuales de muchos juegos con /games/prices/v3 (200 por petición)
+        
+        Los bloques se piden en paralelo.
         
         Args:
-            juegos (list): Lista de juegos
+            game_ids (list): UUIDs de juegos en ITAD
+            solo_ofertas (bool): Solo precios con descuento (deals=true)
         
         Returns:
-            list: Lista sin duplicados
+            dict: UUID -> {'deals': [...], 'historyLow': {...}}; los juegos
+                cuya consulta falló no aparecen
         """
-        if not juegos:
-            return []
+        if not self.api_key:
+            return {}
         
-        # Prioridad de tiendas
-        prioridad = {
-            'Epic Games': 1,
-            'GOG': 2,
-            'Steam': 3,
-            'Microsoft Store': 4,
-            'Humble Store': 5
-        }
+        ids = list(dict.fromkeys(game_id for game_id in game_ids if game_id))
+        bloques = [ids[i:i + LIMITE_PAGINA] for i in range(0, len(ids), LIMITE_PAGINA)]
+        tareas = [(n, self._consultar_precios, (bloque, solo_ofertas)) for n, bloque in enumerate(bloques)]
         
-        # Agrupar por título (normalizado)
-        por_titulo = {}
+        precios = {}
+        for resultado in ejecutar_en_paralelo(tareas, max_workers=self.paginas_paralelas, valor_error={}).values():
+            precios.update(resultado)
+        return precios
+    
+    def _consultar_precios(self, game_ids, solo_ofertas=True):
+        """
+        POST a /games/prices/v3 con hasta 200 ids
         
-        for juego in juegos:
-            titulo_norm = juego['titulo'].lower().strip()
+        Returns:
+            dict: UUID -> entrada de precios
+        """
+        params = {'key': self.api_key, 'country': self.pais}
+        if solo_ofertas:
+            params['deals'] = 'true'
+        
+        response = self.session.post(f"{self.base_url}/games/prices/v3", params=params, json=game_ids)
+        
+        if response.status_code != 200:
+            print(f"   ⚠️ ITAD /games/prices/v3 respondió {response.status_code}")
+            return {}
+        
+        return {entrada['id']: entrada for entrada in response.json() if entrada.get('id')}
+    
+    def _tienda_itad(self, juego):
+        """
+        ID de tienda en ITAD del juego (None si ITAD no sigue esa tienda)
+        """
+        if juego.get('itad_shop_id'):
+            return juego['itad_shop_id']
+        tienda = self.tiendas.por_nombre(juego.get('tienda'))
+        return tienda['itad'] if tienda else None
+    
+    def verificar_precios(self, juegos):
+        """
+        Revalida en lote las ofertas antes de anunciarlas
+        
+        Actualiza precio, precio regular y descuento con el valor vigente en
+        la misma tienda si está en la misma moneda. Una oferta que ya no
+        existe solo se descarta si el id de ITAD es exacto (appid de Steam o
+        deal de ITAD): un id resuelto por título puede ser otra edición. Los
+        juegos gratis, sin id de ITAD o de tiendas que ITAD no sigue pasan
+        sin cambios.
+        
+        Args:
+            juegos (list): Juegos (con `itad_id` si se resolvió su identidad)
+        
+        Returns:
+            list: Juegos que siguen vigentes
+        """
+        verificables = [
+            juego for juego in juegos
+            if juego.get('precio_actual') is not None
+            and juego.get('itad_id') and self._tienda_itad(juego)
+        ]
+        if not verificables or not self.api_key:
+            return juegos
+        
+        precios = self.obtener_precios([juego['itad_id'] for juego in verificables])
+        
+        expirados = set()
+        for juego in verificables:
+            entrada = precios.get(juego['itad_id'])
+            if entrada is None:
+                # Consulta fallida: no se puede confirmar ni descartar
+                continue
             
-            if titulo_norm not in por_titulo:
-                por_titulo[titulo_norm] = juego
-            else:
-                # Mantener el de mejor tienda
-                tienda_actual = por_titulo[titulo_norm]['tienda']
-                tienda_nueva = juego['tienda']
-                
-                prioridad_actual = prioridad.get(tienda_actual, 999)
-                prioridad_nueva = prioridad.get(tienda_nueva, 999)
-                
-                if prioridad_nueva < prioridad_actual:
-                    por_titulo[titulo_norm] = juego
+            tienda_id = self._tienda_itad(juego)
+            deal = next((d for d in entrada.get('deals', []) if d.get('shop', {}).get('id') == tienda_id), None)
+            
+            if not deal:
+                if juego.get('identidad_exacta'):
+                    expirados.add(id(juego))
+                continue
+            
+            if deal.get('price', {}).get('currency') != juego.get('moneda', 'USD'):
+                # Otra moneda: el precio de la fuente no se puede comparar
+                continue
+            
+            juego['precio_verificado'] = True
+            juego['precio_actual'] = deal.get('price', {}).get('amount', juego['precio_actual'])
+            juego['precio_regular'] = deal.get('regular', {}).get('amount', juego.get('precio_regular'))
+            juego['descuento_porcentaje'] = deal.get('cut', juego.get('descuento_porcentaje'))
+            self._aplicar_minimos(juego, {
+                'historico': self._precio((entrada.get('historyLow') or {}).get('all')),
+                'tiendas': {str(tienda_id): self._precio(deal.get('storeLow'))}
+            })
+
+        if expirados:
+            print(f"   🧾 {len(expirados)} oferta(s) ya no vigente(s) según ITAD")
+        
+        return [juego for juego in juegos if id(juego) not in expirados]
+    
+    def obtener_minimos(self, game_ids, tiendas=None):
+        """
+        Mínimos históricos (global y por tienda) de muchos juegos
+        
+        Usa /games/historylow/v1 y /games/storelow/v2 (200 ids por petición)
+        y guarda cada resultado en la cache en disco.
+        
+        Args:
+            game_ids (list): UUIDs de juegos en ITAD
+            tiendas (list, optional): IDs de tienda para los mínimos por tienda
+        
+        Returns:
+            dict: UUID -> {'historico': {'monto', 'moneda'} o None,
+                'tiendas': {id_tienda: {'monto', 'moneda'}}}
+        """
+        minimos = {}
+        faltantes = []
+        
+        for game_id in dict.fromkeys(game_id for game_id in game_ids if game_id):
+            if self.cache:
+                hit, guardado = self.cache.obtener('itad_minimos', f"{self.pais}:{game_id}")
+                if hit:
+                    minimos[game_id] = guardado
+                    continue
+            faltantes.append(game_id)
+        
+        if not faltantes or not self.api_key:
+            return minimos
+        
+        bloques = [faltantes[i:i + LIMITE_PAGINA] for i in range(0, len(faltantes), LIMITE_PAGINA)]
+        tareas = []
+        for n, bloque in enumerate(bloques):
+            tareas.append((f"historylow_{n}", self._consultar_minimos, ("/games/historylow/v1", bloque, None)))
+            tareas.append((f"storelow_{n}", self._consultar_minimos, ("/games/storelow/v2", bloque, tiendas)))
+        resultados = ejecutar_en_paralelo(tareas, max_workers=self.paginas_paralelas, valor_error=None)
+        
+        nuevos = {}
+        for nombre, respuesta in resultados.items():
+            if respuesta is None:
+                continue
+            for entrada in respuesta:
+                game_id = entrada.get('id')
+                if not game_id:
+                    continue
+                registro = nuevos.setdefault(game_id, {'historico': None, 'tiendas': {}})
+                if nombre.startswith('historylow'):
+                    registro['historico'] = self._precio((entrada.get('low') or {}).get('price'))
+                else:
+                    for low in entrada.get('lows', []):
+                        shop_id = (low.get('shop') or {}).get('id')
+                        registro['tiendas'][str(shop_id)] = self._precio(low.get('price'))
+        
+        for game_id, registro in nuevos.items():
+            minimos[game_id] = registro
+            if self.cache:
+                self.cache.guardar('itad_minimos', f"{self.pais}:{game_id}", registro, self.ttl_minimos)
+        
+        return minimos
+    
+    def _consultar_minimos(self, endpoint, game_ids, tiendas=None):
+        """
+        POST a un endpoint de mínimos con hasta 200 ids
+        
+        Returns:
+            list: Respuesta del endpoint o None si falló
+        """
+        params = {'key': self.api_key, 'country': self.pais}
+        if tiendas:
+            params['shops'] = ','.join(str(tienda) for tienda in tiendas)
+        
+        response = self.session.post(f"{self.base_url}{endpoint}", params=params, json=game_ids)
+        
+        if response.status_code != 200:
+            print(f"   ⚠️ ITAD {endpoint} respondió {response.status_code}")
+            return None
+        
+        return response.json()
+    
+    def enriquecer_minimos(self, juegos):
+        """
+        Agrega el mínimo histórico a las ofertas que aún no lo tienen
+        
+        Campos: minimo_historico, minimo_tienda y es_minimo_historico
+        (solo se comparan precios en la misma moneda y de tiendas que ITAD
+        sigue; las ofertas de consola no tienen mínimos comparables).
+        
+        Args:
+            juegos (list): Juegos (se usan los que tengan `itad_id` y precio)
+        
+        Returns:
+            int: Ofertas enriquecidas
+        """
+        pendientes = [
+            juego for juego in juegos
+            if juego.get('itad_id') and juego.get('precio_actual') is not None
+            and 'minimo_historico' not in juego and self._tienda_itad(juego)
+        ]
+        if not pendientes:
+            return 0
         
-        return list(por_titulo.values())
+        tiendas = sorted({t for t in (self._tienda_itad(juego) for juego in pendientes) if t})
+        minimos = self.obtener_minimos([juego['itad_id'] for juego in pendientes], tiendas)
+        
+        enriquecidos = 0
+        for juego in pendientes:
+            registro = minimos.get(juego['itad_id'])
+            if registro and self._aplicar_minimos(juego, registro):
+                enriquecidos += 1
+        
+        return enriquecidos
+    
+    def _aplicar_minimos(self, juego, registro):
+        """
+        Copia los mínimos de `registro` al juego si la moneda coincide
+        
+        Returns:
+            bool: True si se agregó el mínimo histórico
+        """
+        moneda = juego.get('moneda', 'USD')
+        historico = registro.get('historico')
+        if not historico or historico.get('moneda') != moneda:
+            return False
+        
+        juego['minimo_historico'] = historico['monto']
+        juego['es_minimo_historico'] = juego['precio_actual'] <= historico['monto'] + 0.005
+        
+        tienda = (registro.get('tiendas') or {}).get(str(self._tienda_itad(juego)))
+        if tienda and tienda.get('moneda') == moneda:
+            juego['minimo_tienda'] = tienda['monto']
+        
+        return True
+    
+    @staticmethod
+    def _precio(precio):
+        """Convierte un obj.price de ITAD a {'monto', 'moneda'}"""
+        if not precio or precio.get('amount') is None:
+            return None
+        return {'monto': precio['amount'], 'moneda': precio.get('currency')}
     
     def verificar_disponibilidad(self, game_id):
         """
@@ -338,34 +558,20 @@ class IsThereAnyDealHunter:
             dict: Info actualizada o None
         """
         try:
-            url = f"{self.base_url}/v02/game/prices/"
-            
-            params = {
-                'key': game_id,
-                'region': 'us',
-                'country': 'US'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code != 200:
+            entrada = self.obtener_precios([game_id]).get(game_id)
+            if not entrada:
                 return None
             
-            data = response.json()
-            
             # Buscar ofertas con precio 0
-            if 'data' in data:
-                for tienda_id, tienda_data in data['data'].items():
-                    if isinstance(tienda_data, dict):
-                        price = tienda_data.get('price', {}).get('amount', 999)
-                        
-                        if price == 0:
-                            return {
-                                'disponible': True,
-                                'tienda': self.tiendas_map.get(tienda_id, {}).get('nombre', tienda_id),
-                                'url': tienda_data.get('url', ''),
-                                'expiracion': tienda_data.get('expiry')
-                            }
+            for deal in entrada.get('deals', []):
+                if deal.get('price', {}).get('amount', 999) == 0:
+                    tienda = deal.get('shop') or {}
+                    return {
+                        'disponible': True,
+                        'tienda': (self.tiendas.por_itad(tienda.get('id')) or {}).get('nombre', tienda.get('name')),
+                        'url': deal.get('url', ''),
+                        'expiracion': deal.get('expiry')
+                    }
             
             return None
         
@@ -5,12 +5,13 @@ Busca juegos gratis en Itch.io usando su RSS Feed
 
 import html
 import re
-import requests
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin
 
 
-class ItchHunter:
+class ItchHunter(HunterAsyncMixin):
     """
     Busca juegos indie gratis en Itch.io
     """
@@ -21,7 +22,7 @@ class ItchHunter:
             "https://itch.io/games/new-and-popular/free.xml",
             "https://itch.io/games/top-rated/top-sellers.xml"
         ]
-        self.session = requests.Session()
+        self.session = obtener_cliente()
         self.plataformas_validas = {
             'windows', 'macos', 'linux', 'android'
         }
@@ -46,7 +47,7 @@ class ItchHunter:
             response = None
             for url in self.rss_urls:
                 try:
-                    response = self.session.get(url, headers=headers, timeout=10)
+                    response = self.session.get(url, headers=headers)
                     response.raise_for_status()
                     break
                 except Exception:
@@ -4,11 +4,13 @@ Busca juegos gratis y ofertas con descuento usando eShop (API pública)
 """
 
 import re
-import requests
+import threading
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin, OfertasAsyncMixin
 
 
-class NintendoHunter:
+class NintendoHunter(HunterAsyncMixin, OfertasAsyncMixin):
     """
     Busca deals de Nintendo eShop usando endpoints públicos
     """
@@ -17,11 +19,13 @@ class NintendoHunter:
         self.region = region
         self.lang = lang
         self.base_url = "https://ec.nintendo.com/api"
-        self.session = requests.Session()
+        self.session = obtener_cliente()
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
     
     def obtener_juegos_gratis(self):
         """
-        Obtiene juegos gratis de Nintendo eShop
+        Obtiene juegos gratis de Nintendo eShop (vista sobre el snapshot de sales)
         
         Returns:
             list: Lista de juegos gratis
@@ -29,15 +33,9 @@ class NintendoHunter:
         juegos = []
         
         try:
-            print("🔍 Consultando Nintendo eShop (gratis)...")
+            snapshot = self._obtener_snapshot()
             
-            for item in self._iterar_sales():
-                descuento = self._extraer_descuento(item)
-                precio_actual = self._extraer_precio_actual(item)
-                
-                if not self._es_gratis(descuento, precio_actual):
-                    continue
-                
+            for item in snapshot['gratis']:
                 info = self._crear_info_gratis(item)
                 if info:
                     juegos.append(info)
@@ -51,7 +49,7 @@ class NintendoHunter:
     
     def obtener_ofertas_descuento(self, descuento_minimo=30, descuento_maximo=99):
         """
-        Obtiene ofertas con descuento de Nintendo eShop
+        Obtiene ofertas con descuento de Nintendo eShop (vista sobre el snapshot de sales)
         
         Args:
             descuento_minimo (int): % mínimo de descuento
@@ -63,13 +61,9 @@ class NintendoHunter:
         ofertas = []
         
         try:
-            print("🔍 Consultando Nintendo eShop (descuentos)...")
+            snapshot = self._obtener_snapshot()
             
-            for item in self._iterar_sales():
-                descuento = self._extraer_descuento(item)
-                if descuento is None:
-                    continue
-                
+            for item, descuento in snapshot['ofertas']:
                 if descuento < descuento_minimo:
                     continue
                 if descuento > descuento_maximo:
@@ -86,6 +80,33 @@ class NintendoHunter:
             print(f"❌ Error al consultar Nintendo eShop: {e}")
             return []
     
+    def _obtener_snapshot(self):
+        """
+        Recorre las páginas de sales una sola vez por ejecución y clasifica
+        cada item en gratis y con descuento en una sola pasada
+        
+        Returns:
+            dict: {'gratis': [item], 'ofertas': [(item, descuento)]}
+        """
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            
+            print("🔍 Consultando Nintendo eShop (sales)...")
+            
+            snapshot = {'gratis': [], 'ofertas': []}
+            for item in self._iterar_sales():
+                descuento = self._extraer_descuento(item)
+                precio_actual = self._extraer_precio_actual(item)
+                
+                if self._es_gratis(descuento, precio_actual):
+                    snapshot['gratis'].append(item)
+                elif descuento is not None:
+                    snapshot['ofertas'].append((item, descuento))
+            
+            self._snapshot = snapshot
+            return snapshot
+    
     def _iterar_sales(self, count=60, max_pages=5):
         offset = 0
         paginas = 0
@@ -110,7 +131,7 @@ class NintendoHunter:
         url = f"{self.base_url}/{self.region}/{self.lang}/search/sales"
         params = {"count": count, "offset": offset}
         try:
-            response = self.session.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params)
             if response.status_code != 200:
                 return {}
             return response.json()
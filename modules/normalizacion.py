@@ -0,0 +1,84 @@
+"""
+Normalización de títulos para HunDea v3
+Un solo normalizador para deduplicar, buscar reviews y comparar nombres:
+patrones precompilados, plegado Unicode (acentos, ™ ® ©) y memoización
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Símbolos de marca que se eliminan
+_MARCAS = re.compile(r'[™®©]')
+
+# Paréntesis: "Rustler (Grand Theft Horse)" → "Rustler Grand Theft Horse"
+_PARENTESIS = re.compile(r'\(([^)]*)\)')
+
+# Separadores que se convierten en espacio
+_SEPARADORES = re.compile(r'[-:_–—]')
+
+# Sufijos promocionales al final del título
+_SUFIJOS = re.compile(r'\s+(?:es gratis|is free|gratis|free)$')
+
+# Artículos que no cuentan para comparar
+ARTICULOS = frozenset(['the', 'a', 'an', 'el', 'la', 'los', 'las'])
+
+
+def plegar_unicode(texto):
+    """
+    Quita acentos y símbolos de marca ("Pokémon™" → "Pokemon")
+
+    Args:
+        texto (str): Texto original
+
+    Returns:
+        str: Texto sin diacríticos
+    """
+    texto = _MARCAS.sub('', texto)
+    descompuesto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=8192)
+def normalizar_titulo(titulo):
+    """
+    Normaliza títulos para comparación
+    Elimina acentos, símbolos de marca, separadores, sufijos
+    promocionales y artículos
+
+    Args:
+        titulo (str): Título original
+
+    Returns:
+        str: Título normalizado
+    """
+    titulo = plegar_unicode(titulo).lower()
+    titulo = _PARENTESIS.sub(r'\1', titulo)
+    titulo = _SEPARADORES.sub(' ', titulo)
+    titulo = ' '.join(titulo.split())
+    titulo = _SUFIJOS.sub('', titulo)
+
+    palabras = titulo.split()
+
+    # Artículo al inicio (solo uno)
+    if len(palabras) > 1 and palabras[0] in ARTICULOS:
+        palabras = palabras[1:]
+
+    # Artículos en medio (el último término se conserva)
+    if len(palabras) > 2:
+        palabras = [palabras[0]] + [p for p in palabras[1:-1] if p not in ARTICULOS] + [palabras[-1]]
+
+    return ' '.join(palabras)
+
+
+def palabras_titulo(titulo):
+    """
+    Conjunto de palabras del título normalizado
+
+    Args:
+        titulo (str): Título original
+
+    Returns:
+        frozenset: Palabras
+    """
+    return frozenset(normalizar_titulo(titulo).split())
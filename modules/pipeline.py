@@ -0,0 +1,134 @@
+"""
+Pipeline por etapas para HunDea v3
+Cada elemento avanza a la siguiente etapa en cuanto se produce, con colas
+acotadas entre etapas (una fuente lenta no retrasa a las demás)
+"""
+
+import queue
+import threading
+
+# Marca de fin de flujo entre etapas
+_FIN = object()
+
+
+class Pipeline:
+    """
+    Encadena etapas que corren en hilos separados unidos por colas acotadas
+    """
+
+    def __init__(self, etapas, tamano_buffer=32):
+        """
+        Args:
+            etapas (list): Lista de tuplas (nombre, funcion) o (nombre, funcion,
+                al_terminar). Cada función recibe un elemento y devuelve un
+                iterable con los elementos que pasan a la siguiente etapa (puede
+                ser vacío); `al_terminar()` se llama cuando ya no quedan
+                elementos y devuelve los que la etapa retuvo hasta el final
+            tamano_buffer (int): Capacidad máxima de cada cola entre etapas
+        """
+        self.etapas = etapas
+        self.tamano_buffer = max(1, int(tamano_buffer))
+
+    def ejecutar(self, productor):
+        """
+        Ejecuta el pipeline hasta que el productor termine y las colas se vacíen
+
+        Args:
+            productor (callable): Recibe `emitir(elemento)` y genera los
+                elementos de entrada de la primera etapa
+        """
+        if not self.etapas:
+            productor(lambda elemento: None)
+            return
+
+        colas = [queue.Queue(maxsize=self.tamano_buffer) for _ in self.etapas]
+        hilos = []
+
+        for i, (nombre, funcion, *al_terminar) in enumerate(self.etapas):
+            salida = colas[i + 1] if i + 1 < len(colas) else None
+            hilo = threading.Thread(
+                target=self._correr_etapa,
+                args=(nombre, funcion, colas[i], salida, *al_terminar),
+                name=f"etapa-{nombre}",
+                daemon=True
+            )
+            hilo.start()
+            hilos.append(hilo)
+
+        try:
+            productor(colas[0].put)
+        finally:
+            colas[0].put(_FIN)
+            for hilo in hilos:
+                hilo.join()
+
+    def _correr_etapa(self, nombre, funcion, entrada, salida, al_terminar=None):
+        """
+        Consume elementos de `entrada` y envía los resultados a `salida`
+
+        Un error con un elemento se registra y no detiene la etapa.
+        """
+        while True:
+            elemento = entrada.get()
+
+            if elemento is _FIN:
+                if al_terminar is not None:
+                    self._enviar(nombre, al_terminar, (), salida)
+                if salida is not None:
+                    salida.put(_FIN)
+                return
+
+            self._enviar(nombre, funcion, (elemento,), salida)
+
+    def _enviar(self, nombre, funcion, args, salida):
+        """Llama a la función de la etapa y pasa sus resultados a `salida`"""
+        try:
+            for resultado in funcion(*args) or ():
+                if salida is not None:
+                    salida.put(resultado)
+        except Exception as e:
+            ids = ids_afectados(args[0]) if args else []
+            detalle = f" (sin terminar: {', '.join(ids)})" if ids else ""
+            print(f"⚠️ Error en etapa {nombre}: {e}{detalle}")
+
+
+def ids_afectados(elemento):
+    """
+    Ids de los juegos de un elemento del pipeline, para el registro de errores
+
+    Args:
+        elemento: Lote {'fuente', 'juegos'}, tupla (categoria, juego) o juego
+
+    Returns:
+        list: Ids de juego (vacía si el elemento no los tiene)
+    """
+    if isinstance(elemento, tuple) and len(elemento) == 2:
+        elemento = elemento[1]
+    if not isinstance(elemento, dict):
+        return []
+    if 'juegos' in elemento:
+        return [str(juego.get('id')) for juego in elemento['juegos'] if isinstance(juego, dict)]
+    return [str(elemento['id'])] if 'id' in elemento else []
+
+
+def pasar_si_falla(nombre, funcion):
+    """
+    Envuelve una etapa de enriquecimiento: si falla, el elemento sigue sin cambios
+
+    Para etapas que solo agregan datos (reviews, precios...): un error no
+    debe costar los juegos del lote.
+
+    Args:
+        nombre (str): Nombre de la etapa (para el registro)
+        funcion (callable): Etapa que recibe un elemento y devuelve un iterable
+
+    Returns:
+        callable: Etapa equivalente que nunca pierde el elemento
+    """
+    def etapa(elemento):
+        try:
+            return list(funcion(elemento) or ())
+        except Exception as e:
+            print(f"⚠️ Error en etapa {nombre}: {e} (el lote sigue sin cambios)")
+            return [elemento]
+    return etapa
@@ -4,11 +4,13 @@ Busca deals y juegos gratis de PlayStation usando PlatPrices (endpoints público
 """
 
 import re
-import requests
+import threading
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin, OfertasAsyncMixin
 
 
-class PlatPricesHunter:
+class PlatPricesHunter(HunterAsyncMixin, OfertasAsyncMixin):
     """
     Busca deals de PlayStation (PS4/PS5) usando PlatPrices
     """
@@ -17,12 +19,14 @@ class PlatPricesHunter:
         self.api_key = api_key or "GH28jbaLCoVsO5QlNHnV8fHpvsQnuUbB"
         self.base_url = "https://platprices.com"
         self.region = region
-        self.session = requests.Session()
+        self.session = obtener_cliente()
         self._region_real = region
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
     
     def obtener_juegos_gratis(self):
         """
-        Obtiene juegos gratis de PlayStation
+        Obtiene juegos gratis de PlayStation (vista sobre el snapshot de sales)
         
         Returns:
             list: Lista de juegos gratis de PS
@@ -30,29 +34,16 @@ class PlatPricesHunter:
         juegos_gratis = []
         
         try:
-            print("🔍 Consultando PlatPrices (PlayStation gratis)...")
-            sales = self._obtener_sales()
+            snapshot = self._obtener_snapshot()
             
-            # Extraer items gratis desde sales/items
-            for sale in sales:
-                items = self._obtener_items_sale(sale)
-                if not items:
-                    continue
-                
-                for item in items:
-                    descuento = self._extraer_descuento(item)
-                    precio_actual = self._extraer_precio_actual(item)
-                    
-                    if not self._es_gratis(descuento, precio_actual):
-                        continue
-                    
-                    info = self._crear_info_gratis(item)
-                    if info:
-                        juegos_gratis.append(info)
+            for item in snapshot['gratis']:
+                info = self._crear_info_gratis(item)
+                if info:
+                    juegos_gratis.append(info)
             
             # Fallback: PS Plus Essential (si no hay items)
             if not juegos_gratis:
-                juegos_gratis.extend(self._fallback_ps_plus(sales))
+                juegos_gratis.extend(self._fallback_ps_plus(snapshot['sales']))
             
             print(f"✅ PlatPrices: {len(juegos_gratis)} juego(s) gratis encontrados")
             return juegos_gratis
@@ -63,7 +54,7 @@ class PlatPricesHunter:
     
     def obtener_ofertas_descuento(self, descuento_minimo=30, descuento_maximo=99):
         """
-        Obtiene ofertas con descuento de PlayStation
+        Obtiene ofertas con descuento de PlayStation (vista sobre el snapshot de sales)
         
         Args:
             descuento_minimo (int): % mínimo de descuento
@@ -75,27 +66,17 @@ class PlatPricesHunter:
         ofertas = []
         
         try:
-            print("🔍 Consultando PlatPrices (PlayStation descuentos)...")
-            sales = self._obtener_sales()
+            snapshot = self._obtener_snapshot()
             
-            for sale in sales:
-                items = self._obtener_items_sale(sale)
-                if not items:
+            for item, descuento in snapshot['ofertas']:
+                if descuento < descuento_minimo:
+                    continue
+                if descuento > descuento_maximo:
                     continue
                 
-                for item in items:
-                    descuento = self._extraer_descuento(item)
-                    if descuento is None:
-                        continue
-                    
-                    if descuento < descuento_minimo:
-                        continue
-                    if descuento > descuento_maximo:
-                        continue
-                    
-                    info = self._crear_info_oferta(item, descuento)
-                    if info:
-                        ofertas.append(info)
+                info = self._crear_info_oferta(item, descuento)
+                if info:
+                    ofertas.append(info)
             
             print(f"✅ PlatPrices: {len(ofertas)} oferta(s) de PlayStation encontradas")
             return ofertas
@@ -104,6 +85,35 @@ class PlatPricesHunter:
             print(f"❌ Error al consultar PlatPrices: {e}")
             return []
     
+    def _obtener_snapshot(self):
+        """
+        Descarga las sales (y sus detalles) una sola vez por ejecución y
+        clasifica cada item en gratis y con descuento en una sola pasada
+        
+        Returns:
+            dict: {'sales': [sale], 'gratis': [item], 'ofertas': [(item, descuento)]}
+        """
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            
+            print("🔍 Consultando PlatPrices (PlayStation sales)...")
+            sales = self._obtener_sales()
+            
+            snapshot = {'sales': sales, 'gratis': [], 'ofertas': []}
+            for sale in sales:
+                for item in self._obtener_items_sale(sale):
+                    descuento = self._extraer_descuento(item)
+                    precio_actual = self._extraer_precio_actual(item)
+                    
+                    if self._es_gratis(descuento, precio_actual):
+                        snapshot['gratis'].append(item)
+                    elif descuento is not None:
+                        snapshot['ofertas'].append((item, descuento))
+            
+            self._snapshot = snapshot
+            return snapshot
+    
     def _obtener_sales(self):
         try:
             data = self._get_json(self._sales_url(self.region))
@@ -170,7 +180,7 @@ class PlatPricesHunter:
     
     def _get_json(self, url):
         try:
-            response = self.session.get(url, timeout=15)
+            response = self.session.get(url)
             if response.status_code != 200:
                 return None
             return response.json()
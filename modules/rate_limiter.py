@@ -0,0 +1,203 @@
+"""
+Limitador de tasa por host para HunDea v3
+Un token bucket por host reemplaza las pausas fijas con time.sleep: las
+peticiones salen tan rápido como el proveedor permite y se frenan solo
+cuando el bucket se vacía o el servidor indica que se agotó su cuota
+"""
+
+import contextlib
+import threading
+import time
+
+# Límites por defecto (peticiones por segundo y ráfaga máxima)
+# Se pueden sobrescribir con "rate_limits" en config.json
+LIMITES_DEFAULT = {
+    'api.rawg.io': {'por_segundo': 5, 'rafaga': 5},
+    'api.isthereanydeal.com': {'por_segundo': 5, 'rafaga': 10},
+    'www.cheapshark.com': {'por_segundo': 2, 'rafaga': 4},
+    'store.steampowered.com': {'por_segundo': 4, 'rafaga': 8},
+    'discord.com': {'por_segundo': 2.5, 'rafaga': 5},
+}
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe
+    """
+
+    def __init__(self, por_segundo, rafaga=None):
+        """
+        Args:
+            por_segundo (float): Tokens que se recargan por segundo
+            rafaga (int, optional): Capacidad máxima del bucket
+        """
+        self.por_segundo = float(por_segundo)
+        self.rafaga = float(rafaga or max(1, por_segundo))
+        self.tokens = self.rafaga
+        self.ultimo = time.monotonic()
+        self.bloqueado_hasta = 0.0
+        self._lock = threading.Lock()
+
+    def adquirir(self):
+        """
+        Toma un token, esperando lo mínimo necesario si no hay disponibles
+        """
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+
+                if ahora < self.bloqueado_hasta:
+                    espera = self.bloqueado_hasta - ahora
+                else:
+                    transcurrido = ahora - self.ultimo
+                    self.tokens = min(self.rafaga, self.tokens + transcurrido * self.por_segundo)
+                    self.ultimo = ahora
+
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    espera = (1 - self.tokens) / self.por_segundo
+
+            time.sleep(espera)
+
+    def pausar(self, segundos):
+        """
+        Bloquea el bucket durante `segundos` (cuota agotada en el servidor)
+
+        Args:
+            segundos (float): Segundos de pausa
+        """
+        with self._lock:
+            self.bloqueado_hasta = max(self.bloqueado_hasta, time.monotonic() + segundos)
+            # Los tokens se vuelven a acumular cuando termina la pausa, no durante ella
+            self.tokens = 0
+            self.ultimo = self.bloqueado_hasta
+
+
+class LimitadorTasa:
+    """
+    Registro de token buckets por host
+    """
+
+    # Pausa máxima aceptada desde headers (evita bloquear una ejecución entera)
+    PAUSA_MAXIMA = 60
+
+    def __init__(self, limites=None):
+        """
+        Args:
+            limites (dict, optional): host -> {'por_segundo': float, 'rafaga': int}.
+                Los hosts sin límite configurado no se frenan.
+        """
+        self.limites = dict(LIMITES_DEFAULT)
+        self.limites.update(limites or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                limite = self.limites.get(host)
+                if not limite or not limite.get('por_segundo'):
+                    self._buckets[host] = None
+                else:
+                    self._buckets[host] = TokenBucket(limite['por_segundo'], limite.get('rafaga'))
+            return self._buckets[host]
+
+    def adquirir(self, host):
+        """
+        Espera el turno para hacer una petición al host
+
+        Args:
+            host (str): Nombre del host
+        """
+        bucket = self._bucket(host)
+        if bucket:
+            bucket.adquirir()
+
+    def actualizar_desde_headers(self, host, headers, status_code=None):
+        """
+        Ajusta el bucket según los headers de rate limit de la respuesta
+
+        Soporta Retry-After, X-RateLimit-Remaining / X-RateLimit-Reset(-After)
+        y RateLimit-Remaining / RateLimit-Reset.
+
+        Args:
+            host (str): Nombre del host
+            headers (dict): Headers de la respuesta
+            status_code (int, optional): Código HTTP de la respuesta
+        """
+        bucket = self._bucket(host)
+        if not bucket or not headers:
+            return
+
+        pausa = None
+
+        if status_code == 429:
+            pausa = self._segundos(headers.get('Retry-After'))
+
+        restantes = headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining'))
+        if pausa is None and restantes is not None:
+            try:
+                agotado = float(restantes) <= 0
+            except (TypeError, ValueError):
+                agotado = False
+            if agotado:
+                pausa = self._segundos(
+                    headers.get('X-RateLimit-Reset-After')
+                    or headers.get('X-RateLimit-Reset')
+                    or headers.get('RateLimit-Reset')
+                )
+
+        if pausa:
+            bucket.pausar(min(pausa, self.PAUSA_MAXIMA))
+
+    def _segundos(self, valor):
+        """
+        Convierte un valor de header (segundos o timestamp Unix) a segundos de espera
+        """
+        if valor is None:
+            return None
+        try:
+            numero = float(valor)
+        except (TypeError, ValueError):
+            return None
+        if numero > 1e9:
+            numero -= time.time()
+        return max(0.0, numero)
+
+
+class LimitadorConcurrencia:
+    """
+    Peticiones simultáneas máximas por host
+
+    Un semáforo por host que se ocupa solo mientras dura cada petición HTTP,
+    así lo respetan por igual los hilos del pipeline y los del runner asyncio.
+    """
+
+    def __init__(self, por_host=None, limites=None):
+        """
+        Args:
+            por_host (int, optional): Límite para cualquier host (None = sin límite)
+            limites (dict, optional): Límites específicos host -> int
+        """
+        self.por_host = por_host
+        self.limites = dict(limites or {})
+        self._semaforos = {}
+        self._lock = threading.Lock()
+
+    def semaforo(self, host):
+        """
+        Semáforo del host para usar con `with` (se crea en el primer uso)
+
+        Args:
+            host (str): Nombre del host
+
+        Returns:
+            threading.BoundedSemaphore o contextlib.nullcontext si el host no tiene límite
+        """
+        with self._lock:
+            if host not in self._semaforos:
+                limite = self.limites.get(host, self.por_host)
+                self._semaforos[host] = threading.BoundedSemaphore(max(1, int(limite))) if limite else None
+            semaforo = self._semaforos[host]
+        return semaforo or contextlib.nullcontext()
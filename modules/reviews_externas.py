@@ -1,21 +1,40 @@
 """
 Sistema de búsqueda de reviews externas
-Usa RAWG API (gratuita) para obtener ratings y reviews
+Usa las reviews de Steam por appid y de ITAD por id de juego, y RAWG API
+(gratuita) como respaldo por título para obtener ratings y reviews
 """
 
-import requests
-import time
+from modules.http_client import obtener_cliente
+from modules.concurrencia import ejecutar_en_paralelo
+from modules.normalizacion import normalizar_titulo
+from modules.cache_persistente import CacheConsultas, SIN_RESPUESTA
 
 class ReviewsExternas:
     """
     Busca reviews de juegos en bases de datos externas
     """
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache=None, ttl_horas=168, ttl_negativo_horas=24, max_hilos=8, itad=None, steam=None):
+        """
+        Args:
+            api_key (str, optional): RAWG API key
+            cache (CachePersistente, optional): Cache en disco entre ejecuciones
+            ttl_horas (float): Vigencia de las reviews encontradas
+            ttl_negativo_horas (float): Vigencia de los "no encontrado"
+            max_hilos (int): Consultas simultáneas a RAWG en buscar_reviews_lote
+            itad (ReviewsITAD, optional): Proveedor por id de ITAD, consultado
+                antes que RAWG en buscar_reviews_lote
+            steam (SteamHunter, optional): Proveedor por appid de Steam,
+                consultado antes que ITAD
+        """
         # RAWG API key (opcional pero recomendado)
         self.api_key = api_key
         self.rawg_url = "https://api.rawg.io/api/games"
-        self.cache_busquedas = {}
+        self.cache_busquedas = CacheConsultas('rawg', cache, ttl_horas * 3600, ttl_negativo_horas * 3600)
+        self.max_hilos = max_hilos
+        self.itad = itad
+        self.steam = steam
+        self.session = obtener_cliente()
     
     def buscar_reviews(self, titulo, tienda=None):
         """
@@ -28,19 +47,75 @@ class ReviewsExternas:
         Returns:
             dict: Reviews encontradas o None
         """
-        # Revisar cache
-        cache_key = titulo.lower().strip()
-        if cache_key in self.cache_busquedas:
-            return self.cache_busquedas[cache_key]
+        # Cache en memoria y en disco; si no, buscar en RAWG
+        return self.cache_busquedas.consultar(self._clave_cache(titulo), self._buscar_en_rawg, titulo)
+    
+    def buscar_reviews_lote(self, juegos, tienda=None):
+        """
+        Busca reviews para varios juegos a la vez y las escribe en cada juego
+        
+        Los juegos con appid de Steam se resuelven primero por appid y los que
+        tienen `itad_id` por id en ITAD; RAWG (búsqueda por título) queda como
+        respaldo para los que sigan sin reviews. Solo consulta RAWG
+        una vez por título distinto que no esté en cache; el resto se resuelve
+        con un pool acotado de hilos (el cliente HTTP aplica el límite de tasa
+        de RAWG).
+        
+        Args:
+            juegos (list): Juegos de una o varias fuentes
+            tienda (str, optional): Tienda fija (si no, se usa la del juego)
+        
+        Returns:
+            int: Juegos a los que se añadieron reviews
+        """
+        enriquecidos = 0
+        for proveedor in (self.steam, self.itad):
+            if proveedor:
+                enriquecidos += proveedor.buscar_reviews_lote(juegos)
+        
+        # Agrupar por título normalizado los juegos sin reviews propias
+        por_clave = {}
+        for juego in juegos:
+            if not juego.get('reviews_count') and not juego.get('fuente_reviews'):
+                por_clave.setdefault(self._clave_cache(juego['titulo']), []).append(juego)
         
-        # Buscar en RAWG
-        rawg_reviews = self._buscar_en_rawg(titulo)
+        if not por_clave:
+            return enriquecidos
         
-        if rawg_reviews:
-            self.cache_busquedas[cache_key] = rawg_reviews
-            return rawg_reviews
+        resultados = {}
+        tareas = []
+        for clave, grupo in por_clave.items():
+            hit, guardado = self.cache_busquedas.obtener(clave)
+            if hit:
+                resultados[clave] = guardado
+            else:
+                titulo = grupo[0]['titulo']
+                tareas.append((clave, self.buscar_reviews, (titulo, tienda or grupo[0].get('tienda'))))
         
-        return None
+        if tareas:
+            print(f"   🔍 Buscando reviews de {len(tareas)} títulos ({len(resultados)} en cache)")
+            resultados.update(ejecutar_en_paralelo(tareas, max_workers=self.max_hilos, valor_error=False))
+        
+        for clave, grupo in por_clave.items():
+            reviews = resultados.get(clave)
+            if reviews:
+                for juego in grupo:
+                    juego.update(reviews)
+                enriquecidos += len(grupo)
+        
+        return enriquecidos
+    
+    def _clave_cache(self, titulo):
+        """
+        Clave de cache: título normalizado
+        
+        Args:
+            titulo (str): Nombre del juego
+        
+        Returns:
+            str: Clave normalizada
+        """
+        return normalizar_titulo(titulo)
     
     def _buscar_en_rawg(self, titulo):
         """
@@ -50,7 +125,8 @@ class ReviewsExternas:
             titulo (str): Nombre del juego
         
         Returns:
-            dict: Datos de reviews o None
+            dict: Datos de reviews, None si no está en RAWG o
+                SIN_RESPUESTA si la consulta falló
         """
         try:
             # Buscar juego
@@ -63,10 +139,10 @@ class ReviewsExternas:
             if self.api_key:
                 params['key'] = self.api_key
             
-            response = requests.get(self.rawg_url, params=params, timeout=10)
+            response = self.session.get(self.rawg_url, params=params)
             
             if response.status_code != 200:
-                return None
+                return SIN_RESPUESTA
             
             data = response.json()
             
@@ -103,14 +179,11 @@ class ReviewsExternas:
             
             print(f"   ℹ️ Reviews encontradas en RAWG: {percent:.1f}% ({ratings_count:,} ratings)")
             
-            # Pequeño delay para no saturar la API
-            time.sleep(0.5)
-            
             return reviews_data
             
         except Exception as e:
             print(f"   ⚠️ Error al buscar en RAWG: {e}")
-            return None
+            return SIN_RESPUESTA
     
     def _nombres_similares(self, nombre1, nombre2):
         """
@@ -123,17 +196,8 @@ class ReviewsExternas:
         Returns:
             bool: True si son similares
         """
-        # Limpiar nombres
-        def limpiar(texto):
-            # Quitar caracteres especiales y normalizar
-            texto = texto.lower().strip()
-            # Quitar palabras comunes
-            for palabra in ['the', 'a', 'an', ':', '-', '™', '®']:
-                texto = texto.replace(palabra, ' ')
-            return ' '.join(texto.split())
-        
-        n1 = limpiar(nombre1)
-        n2 = limpiar(nombre2)
+        n1 = normalizar_titulo(nombre1)
+        n2 = normalizar_titulo(nombre2)
         
         # Verificar si uno está contenido en el otro
         if n1 in n2 or n2 in n1:
@@ -0,0 +1,155 @@
+"""
+Reviews de IsThereAnyDeal para HunDea v3
+Obtiene los agregados de reviews de /games/info/v2 por id de juego exacto
+(sin búsquedas por título), en paralelo y con cache en disco
+"""
+
+from modules.http_client import obtener_cliente
+from modules.concurrencia import ejecutar_en_paralelo
+from modules.cache_persistente import CacheConsultas, SIN_RESPUESTA
+
+# Fuentes de reviews de críticos (el resto son de usuarios)
+FUENTES_CRITICOS = frozenset(['Metascore', 'OpenCritic'])
+
+
+class ReviewsITAD:
+    """
+    Proveedor de reviews por id de ITAD
+    """
+
+    def __init__(self, api_key=None, cache=None, ttl_horas=168, ttl_negativo_horas=24, max_hilos=8):
+        """
+        Args:
+            api_key (str): API key de ITAD (obligatoria para /games/info/v2)
+            cache (CachePersistente, optional): Cache en disco entre ejecuciones
+            ttl_horas (float): Vigencia de las reviews encontradas
+            ttl_negativo_horas (float): Vigencia de los "sin reviews"
+            max_hilos (int): Consultas simultáneas a ITAD
+        """
+        self.base_url = "https://api.isthereanydeal.com"
+        self.api_key = api_key
+        self.cache_reviews = CacheConsultas(
+            'itad_reviews', cache, ttl_horas * 3600, ttl_negativo_horas * 3600,
+            es_negativo=lambda info: not info['reviews']
+        )
+        self.max_hilos = max_hilos
+        self.session = obtener_cliente()
+
+    def buscar_reviews_lote(self, juegos):
+        """
+        Escribe las reviews de ITAD en los juegos con `itad_id` que no traen
+        reviews propias
+
+        Args:
+            juegos (list): Juegos de una o varias fuentes
+
+        Returns:
+            int: Juegos a los que se añadieron reviews
+        """
+        if not self.api_key:
+            return 0
+
+        por_id = {}
+        for juego in juegos:
+            if juego.get('itad_id') and not juego.get('reviews_count') and not juego.get('fuente_reviews'):
+                por_id.setdefault(juego['itad_id'], []).append(juego)
+
+        if not por_id:
+            return 0
+
+        resultados = {}
+        tareas = []
+        for itad_id in por_id:
+            hit, guardado = self.cache_reviews.obtener(itad_id)
+            if hit:
+                resultados[itad_id] = guardado
+            else:
+                tareas.append((itad_id, self._buscar, (itad_id,)))
+
+        if tareas:
+            print(f"   🔍 Buscando reviews de {len(tareas)} juegos en ITAD ({len(resultados)} en cache)")
+            resultados.update(ejecutar_en_paralelo(tareas, max_workers=self.max_hilos, valor_error=False))
+
+        enriquecidos = 0
+        for itad_id, grupo in por_id.items():
+            info = resultados.get(itad_id)
+            if not info:
+                continue
+            for juego in grupo:
+                if info.get('appid') and not juego.get('appid'):
+                    juego['appid'] = info['appid']
+                if info.get('reviews'):
+                    juego.update(info['reviews'])
+                    enriquecidos += 1
+
+        return enriquecidos
+
+    def _buscar(self, itad_id):
+        """
+        Consulta /games/info/v2 con cache en memoria y disco
+
+        Returns:
+            dict: {'appid', 'reviews'} o None si la consulta falló
+        """
+        return self.cache_reviews.consultar(itad_id, self._consultar, itad_id)
+
+    def _consultar(self, itad_id):
+        """
+        GET /games/info/v2 de un juego
+
+        Returns:
+            dict: {'appid', 'reviews'} o SIN_RESPUESTA si la consulta falló
+        """
+        try:
+            response = self.session.get(
+                f"{self.base_url}/games/info/v2",
+                params={'key': self.api_key, 'id': itad_id}
+            )
+
+            if response.status_code != 200:
+                return SIN_RESPUESTA
+
+            data = response.json()
+            return {
+                'appid': data.get('appid'),
+                'reviews': self._convertir_reviews(data.get('reviews') or [])
+            }
+
+        except Exception as e:
+            print(f"   ⚠️ Error al buscar reviews en ITAD: {e}")
+            return SIN_RESPUESTA
+
+    @staticmethod
+    def _convertir_reviews(reviews):
+        """
+        Convierte los agregados de ITAD a los campos de reviews del juego
+
+        Las reviews de usuarios de Steam mandan; si no hay, se usa la fuente
+        de usuarios con más reviews. Metascore se guarda como metacritic.
+
+        Args:
+            reviews (list): Lista [{score, source, count, url}]
+
+        Returns:
+            dict: reviews_percent, reviews_count, metacritic y fuente_reviews,
+                o None si no hay reviews de usuarios
+        """
+        usuarios = [
+            r for r in reviews
+            if r.get('score') is not None and r.get('count') and r.get('source') not in FUENTES_CRITICOS
+        ]
+        if not usuarios:
+            return None
+
+        principal = next(
+            (r for r in usuarios if r.get('source') == 'Steam'),
+            max(usuarios, key=lambda r: r['count'])
+        )
+        metascore = next((r for r in reviews if r.get('source') == 'Metascore'), None)
+
+        return {
+            'reviews_percent': principal['score'],
+            'reviews_count': principal['count'],
+            'metacritic': metascore.get('score') if metascore else None,
+            'fuente_reviews': f"ITAD ({principal['source']})"
+        }
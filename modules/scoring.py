@@ -16,7 +16,51 @@ class SistemaScoring:
     @staticmethod
     def calcular_score(juego_info):
         """
-        Calcula el score total de un juego con sistema híbrido
+        Calcula el score total de un juego: reviews + bonus por mínimo histórico
+        
+        Args:
+            juego_info (dict): Información del juego con reviews
+        
+        Returns:
+            float: Score entre 0.0 y 5.0
+        """
+        score = SistemaScoring.score_reviews(juego_info)
+        
+        # Sin reviews no hay score: el precio por sí solo no lo hace recomendable
+        if score <= 0:
+            return score
+        
+        return min(score + SistemaScoring.bonus_minimo(juego_info), 5.0)
+    
+    @staticmethod
+    def bonus_minimo(juego_info):
+        """
+        Bonus para ofertas en su mínimo histórico (o mínimo en la tienda)
+        
+        Args:
+            juego_info (dict): Juego con `minimo_historico` / `minimo_tienda`
+        
+        Returns:
+            float: 0.3 si iguala el mínimo histórico, 0.15 si iguala el de
+                la tienda, 0.0 en otro caso
+        """
+        precio = juego_info.get('precio_actual')
+        if precio is None:
+            return 0.0
+        
+        if juego_info.get('es_minimo_historico'):
+            return 0.3
+        
+        minimo_tienda = juego_info.get('minimo_tienda')
+        if minimo_tienda is not None and precio <= minimo_tienda + 0.005:
+            return 0.15
+        
+        return 0.0
+    
+    @staticmethod
+    def score_reviews(juego_info):
+        """
+        Score por reviews con sistema híbrido
         
         Args:
             juego_info (dict): Información del juego con reviews
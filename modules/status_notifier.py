@@ -3,7 +3,7 @@ Sistema de notificaciones de status para GitHub Actions
 Envía alertas sobre el estado del workflow
 """
 
-import requests
+from modules.http_client import obtener_cliente
 from datetime import datetime
 
 class StatusNotifier:
@@ -19,6 +19,7 @@ class StatusNotifier:
             webhook_url (str): Webhook de Discord para status
         """
         self.webhook_url = webhook_url
+        self.session = obtener_cliente()
     
     def notificar_inicio(self):
         """
@@ -124,7 +125,7 @@ class StatusNotifier:
         
         try:
             payload = {"embeds": [embed]}
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
+            response = self.session.post(self.webhook_url, json=payload)
             return response.status_code == 204
         except Exception as e:
             print(f"⚠️ Error al enviar status: {e}")
@@ -3,25 +3,64 @@ Detector de juegos gratis en Steam
 """
 
 import re
-import requests
 from datetime import datetime, timedelta, timezone
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin, en_hilo
+from modules.concurrencia import ejecutar_en_paralelo
+from modules.cache_persistente import CacheConsultas, SIN_RESPUESTA
+from modules.tiendas import clave_tienda
 
 try:
     from zoneinfo import ZoneInfo
 except Exception:
     ZoneInfo = None
 
-class SteamHunter:
+# Appids por petición de appdetails con filters=price_overview
+TAMANO_LOTE_PRECIOS = 100
+
+# País de la tienda Steam que cobra en cada moneda (para confirmar una
+# oferta hay que consultar appdetails en un país con su misma moneda)
+PAIS_POR_MONEDA = {
+    'USD': 'us',
+    'MXN': 'mx',
+    'CAD': 'ca',
+    'BRL': 'br',
+    'GBP': 'gb',
+    'EUR': 'de',
+    'JPY': 'jp',
+    'AUD': 'au',
+}
+
+class SteamHunter(HunterAsyncMixin):
     """
     Busca y detecta juegos gratis en Steam
     """
     
-    def __init__(self, cc="us", lang="english"):
+    def __init__(self, cc="us", lang="english", cache=None, ttl_reviews_horas=24, ttl_reviews_negativo_horas=6,
+                 ttl_detalles_dias=7, max_hilos=8):
+        """
+        Args:
+            cc (str): País de la tienda (precios y disponibilidad)
+            lang (str): Idioma de la tienda
+            cache (CachePersistente, optional): Cache en disco entre ejecuciones
+            ttl_reviews_horas (float): Vigencia de los resúmenes de reviews
+            ttl_reviews_negativo_horas (float): Vigencia de los "sin reviews"
+            ttl_detalles_dias (float): Vigencia de los datos estáticos de appdetails
+                (nombre, imagen, is_free, tipo)
+            max_hilos (int): Consultas simultáneas en las operaciones en lote
+        """
         self.base_url = "https://store.steampowered.com"
         self.api_url = "https://store.steampowered.com/api"
-        self.session = requests.Session()
+        self.session = obtener_cliente()
         self.cc = cc
         self.lang = lang
+        self.cache = cache
+        self.ttl_detalles = ttl_detalles_dias * 86400
+        self.max_hilos = max_hilos
+        self.cache_reviews = CacheConsultas(
+            'steam_reviews', cache, ttl_reviews_horas * 3600, ttl_reviews_negativo_horas * 3600
+        )
+        self.cache_detalles = {}
     
     def obtener_juegos_gratis(self):
         """
@@ -86,35 +125,23 @@ class SteamHunter:
                 print("ℹ️ No se encontraron Free Weekends en Steam (spotlights)")
                 return free_weekends
 
-            vistos = set()
+            # Appids en el orden de los spotlights, sin repetir
+            candidatos = []
             for item in free_items:
-                url = item.get('url', '')
-                appid = self._extraer_appid(url)
-                if not appid:
-                    continue
-                if appid in vistos:
-                    continue
-                vistos.add(appid)
-
-                info = self._obtener_detalles_app(appid)
-                if not info:
-                    continue
-                if info.get('es_f2p'):
-                    # Evitar F2P permanentes
-                    continue
-                if info.get('tipo_app') and info.get('tipo_app') != 'game':
-                    continue
+                appid = self._extraer_appid(item.get('url', ''))
+                if appid and appid not in candidatos:
+                    candidatos.append(appid)
 
-                # Estimar fin del free weekend para deduplicación (no se muestra)
-                info['fin_ts_estimada'] = self._estimar_fin_free_weekend_ts()
-                info['tipo'] = 'free_weekend'
+            # Detalles y reviews de todos los candidatos a la vez (pool acotado
+            # para Steam); el resultado conserva el orden de los spotlights
+            fin_ts = self._estimar_fin_free_weekend_ts()
+            tareas = [(appid, self._obtener_free_weekend, (appid, fin_ts)) for appid in candidatos]
+            resultados = ejecutar_en_paralelo(tareas, max_workers=self.max_hilos, valor_error=False)
 
-                # Reviews
-                reviews = self.obtener_reviews(appid)
-                if reviews:
-                    info.update(reviews)
-
-                free_weekends.append(info)
+            for appid in candidatos:
+                info = resultados.get(appid)
+                if info:
+                    free_weekends.append(info)
 
             print(f"✅ Steam: {len(free_weekends)} Free Weekend(s) encontrados")
             
@@ -122,10 +149,155 @@ class SteamHunter:
             print(f"❌ Error al buscar Free Weekends: {e}")
         
         return free_weekends
+
+    async def obtener_free_weekends_async(self):
+        """
+        Versión asíncrona de obtener_free_weekends
+
+        Returns:
+            list: Lista de juegos con Free Weekend
+        """
+        return await en_hilo(self.obtener_free_weekends)
+
+    def verificar_precios(self, juegos):
+        """
+        Confirma contra Steam las ofertas de la tienda Steam antes de anunciarlas
+        
+        Usa appdetails con filters=price_overview (varios appids por
+        petición), consultado en el país de PAIS_POR_MONEDA que cobra en la
+        moneda de la oferta: un precio en USD de CheapShark se confirma en
+        cc=us aunque steam_cc sea mx.
+        Se actualizan precio y descuento, o se descartan si ya no tienen
+        descuento. Las de monedas sin país conocido, las de apps sin precio
+        en ese país y las de otras tiendas, gratis o sin appid pasan sin
+        cambios (sin consultar a Steam).
+        
+        Args:
+            juegos (list): Juegos de una o varias fuentes
+        
+        Returns:
+            list: Juegos que siguen vigentes
+        """
+        # País -> appid -> ofertas; las monedas sin país no se consultan
+        por_pais = {}
+        for juego in juegos:
+            if juego.get('precio_actual') is None or clave_tienda(juego.get('tienda')) != 'steam':
+                continue
+            pais = PAIS_POR_MONEDA.get(juego.get('moneda', 'USD'))
+            appid = str(juego.get('appid') or juego.get('steam_appid') or '')
+            if pais and appid.isdigit() and int(appid) > 0:
+                por_pais.setdefault(pais, {}).setdefault(appid, []).append(juego)
+        
+        if not por_pais:
+            return juegos
+        
+        tareas = []
+        for pais, por_appid in por_pais.items():
+            appids = list(por_appid)
+            tareas += [
+                ((pais, i), self._consultar_precios, (appids[i:i + TAMANO_LOTE_PRECIOS], pais))
+                for i in range(0, len(appids), TAMANO_LOTE_PRECIOS)
+            ]
+        precios = {}
+        for (pais, _), resultado in ejecutar_en_paralelo(tareas, max_workers=self.max_hilos, valor_error={}).items():
+            precios.setdefault(pais, {}).update(resultado)
+        
+        expirados = set()
+        for pais, por_appid in por_pais.items():
+            for appid, grupo in por_appid.items():
+                if appid not in precios.get(pais, {}):
+                    # Consulta fallida: no se puede confirmar ni descartar
+                    continue
+                
+                precio = precios[pais][appid]
+                if not precio:
+                    # Sin precio en este país: no indica si la oferta sigue
+                    continue
+                
+                for juego in grupo:
+                    if precio.get('currency') != juego.get('moneda', 'USD'):
+                        # El país cobra en otra moneda: no se puede comparar
+                        continue
+                    if not precio.get('discount_percent'):
+                        expirados.add(id(juego))
+                        continue
+                    juego['descuento_porcentaje'] = precio['discount_percent']
+                    juego['precio_actual'] = precio['final'] / 100
+                    juego['precio_regular'] = precio['initial'] / 100
+                    juego['precio_verificado'] = True
+        
+        if expirados:
+            print(f"   🧾 {len(expirados)} oferta(s) de Steam ya no vigente(s) según Steam")
+        
+        return [juego for juego in juegos if id(juego) not in expirados]
+    
+    def _consultar_precios(self, appids, cc=None):
+        """
+        appdetails con filters=price_overview para varios appids
+        
+        Args:
+            appids (list): Appids a consultar
+            cc (str, optional): País de la consulta (default: steam_cc)
+        
+        Returns:
+            dict: appid -> price_overview (None si el app no tiene precio o no
+                está disponible); los appids cuya consulta falló no aparecen
+        """
+        response = self.session.get(
+            f"{self.api_url}/appdetails",
+            params={'appids': ','.join(appids), 'filters': 'price_overview', 'cc': cc or self.cc}
+        )
+        
+        if response.status_code != 200:
+            print(f"   ⚠️ Steam appdetails (precios) respondió {response.status_code}")
+            return {}
+        
+        data = response.json() or {}
+        precios = {}
+        for appid in appids:
+            entrada = data.get(appid)
+            if entrada is None:
+                continue
+            datos = entrada.get('data') if entrada.get('success') else None
+            # Sin precio Steam devuelve data = [] en lugar de un objeto
+            precios[appid] = datos.get('price_overview') if isinstance(datos, dict) else None
+        
+        return precios
+    
+    def _obtener_free_weekend(self, appid, fin_ts):
+        """
+        Detalles y reviews de un candidato a Free Weekend
+        
+        Args:
+            appid (str): ID del juego en Steam
+            fin_ts (int): Fin estimado del Free Weekend
+        
+        Returns:
+            dict: Juego o None si no aplica (F2P permanente, no es juego...)
+        """
+        info = self._obtener_detalles_app(appid)
+        if not info:
+            return None
+        if info.get('es_f2p'):
+            # Evitar F2P permanentes
+            return None
+        if info.get('tipo_app') and info.get('tipo_app') != 'game':
+            return None
+
+        # Estimar fin del free weekend para deduplicación (no se muestra)
+        info['fin_ts_estimada'] = fin_ts
+        info['tipo'] = 'free_weekend'
+
+        # Reviews
+        reviews = self.obtener_reviews(appid)
+        if reviews:
+            info.update(reviews)
+
+        return info
     
     def obtener_reviews(self, appid):
         """
-        Obtiene las reviews de un juego de Steam
+        Obtiene las reviews de un juego de Steam (con cache en memoria y disco)
         
         Args:
             appid (str): ID del juego en Steam
@@ -133,6 +305,59 @@ class SteamHunter:
         Returns:
             dict: Información de reviews
         """
+        clave = str(appid)
+        return self.cache_reviews.consultar(clave, self._consultar_reviews, clave)
+    
+    def buscar_reviews_lote(self, juegos):
+        """
+        Escribe las reviews de Steam en los juegos con appid conocido
+        
+        Cada appid distinto se consulta una sola vez (las cacheadas no
+        generan peticiones) con un pool acotado de hilos.
+        
+        Args:
+            juegos (list): Juegos de una o varias fuentes
+        
+        Returns:
+            int: Juegos a los que se añadieron reviews
+        """
+        por_appid = {}
+        for juego in juegos:
+            if juego.get('reviews_count') or juego.get('fuente_reviews'):
+                continue
+            appid = str(juego.get('appid') or juego.get('steam_appid') or '')
+            if appid.isdigit() and int(appid) > 0:
+                por_appid.setdefault(appid, []).append(juego)
+        
+        if not por_appid:
+            return 0
+        
+        pendientes = [appid for appid in por_appid if appid not in self.cache_reviews]
+        if pendientes:
+            print(f"   🔍 Buscando reviews de {len(pendientes)} juegos en Steam por appid")
+        
+        tareas = [(appid, self.obtener_reviews, (appid,)) for appid in por_appid]
+        resultados = ejecutar_en_paralelo(tareas, max_workers=self.max_hilos, valor_error=False)
+        
+        enriquecidos = 0
+        for appid, grupo in por_appid.items():
+            reviews = resultados.get(appid)
+            if not reviews:
+                continue
+            for juego in grupo:
+                juego.update(reviews)
+                juego['fuente_reviews'] = 'Steam'
+                enriquecidos += 1
+        
+        return enriquecidos
+    
+    def _consultar_reviews(self, appid):
+        """
+        Resumen de reviews de appreviews (num_per_page=0)
+        
+        Returns:
+            dict: Reviews, None si no tiene o SIN_RESPUESTA si la consulta falló
+        """
         try:
             reviews_url = f"{self.base_url}/appreviews/{appid}"
             params = {
@@ -142,10 +367,10 @@ class SteamHunter:
                 'num_per_page': 0
             }
             
-            response = self.session.get(reviews_url, params=params, timeout=10)
+            response = self.session.get(reviews_url, params=params)
             
             if response.status_code != 200:
-                return None
+                return SIN_RESPUESTA
             
             data = response.json()
             
@@ -168,6 +393,7 @@ class SteamHunter:
             
         except Exception as e:
             print(f"❌ Error al obtener reviews de Steam: {e}")
+            return SIN_RESPUESTA
         
         return None
     
@@ -243,7 +469,7 @@ class SteamHunter:
         try:
             url = f"{self.api_url}/featuredcategories"
             params = {"cc": cc or self.cc, "l": lang or self.lang}
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params)
             if response.status_code != 200:
                 return None
             return response.json()
@@ -281,12 +507,42 @@ class SteamHunter:
 
     def _obtener_detalles_app(self, appid, cc=None, lang=None):
         """
-        Obtiene detalles del app desde appdetails
+        Obtiene detalles del app desde appdetails (con cache en memoria y disco)
+        
+        Solo se guardan datos que casi no cambian; cada llamada devuelve una
+        copia que se puede modificar.
+        """
+        clave = f"{lang or self.lang}:{appid}"
+        info = self.cache_detalles.get(clave)
+        
+        if info is None and self.cache:
+            hit, guardado = self.cache.obtener('steam_appdetails', clave)
+            if hit:
+                info = guardado
+        
+        if info is None:
+            info = self._consultar_detalles_app(appid, cc, lang)
+            # Fallos y apps no disponibles no se cachean
+            if info and self.cache:
+                self.cache.guardar('steam_appdetails', clave, info, self.ttl_detalles)
+        
+        if not info:
+            return None
+        
+        self.cache_detalles[clave] = info
+        return dict(info)
+    
+    def _consultar_detalles_app(self, appid, cc=None, lang=None):
+        """
+        Consulta appdetails de un app
+        
+        Returns:
+            dict: Detalles o None si falló o el app no está disponible
         """
         try:
             url = f"{self.api_url}/appdetails"
             params = {"appids": appid, "cc": cc or self.cc, "l": lang or self.lang}
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params)
             if response.status_code != 200:
                 return None
             data = response.json()
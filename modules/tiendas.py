@@ -0,0 +1,258 @@
+"""
+Registro de tiendas para HunDea v3
+Un solo catálogo de tiendas para hunters y notificadores: combina
+/service/shops/v1 de ITAD y /stores de CheapShark (con cache en disco de
+larga duración) con los datos de presentación propios (emoji y color)
+"""
+
+import re
+import threading
+
+from modules.http_client import obtener_cliente
+from modules.concurrencia import ejecutar_en_paralelo
+from modules.normalizacion import plegar_unicode
+
+# Color de embed para tiendas sin color propio
+COLOR_DEFAULT = 0x00D9FF
+
+# Tiendas conocidas: nombre a mostrar, emoji, color e ids en cada fuente.
+# Son también el respaldo si las APIs no responden.
+TIENDAS_BASE = [
+    {'nombre': 'Steam', 'emoji': '🔵', 'color': 0x1B2838, 'itad': 61, 'cheapshark': '1'},
+    {'nombre': 'GOG', 'emoji': '🟣', 'color': 0x86328A, 'itad': 35, 'cheapshark': '7'},
+    {'nombre': 'Humble Store', 'emoji': '🟠', 'itad': 37, 'cheapshark': '11'},
+    {'nombre': 'Epic Games', 'emoji': '⚫', 'color': 0x00D9FF, 'itad': 16, 'cheapshark': '25',
+     'alias': ('Epic Games Store', 'Epic Game Store')},
+    {'nombre': 'Microsoft Store', 'emoji': '🟢', 'itad': 48},
+    {'nombre': 'EA Origin', 'emoji': '🟠', 'itad': 52, 'cheapshark': '8',
+     'alias': ('Origin', 'EA Store', 'EA App')},
+    {'nombre': 'Ubisoft Connect', 'emoji': '🔵', 'itad': 62, 'cheapshark': '13',
+     'alias': ('Uplay', 'Ubisoft Store')},
+    {'nombre': 'Nuuvem', 'emoji': '🟡', 'itad': 50},
+    {'nombre': 'Green Man Gaming', 'emoji': '🟢', 'itad': 36, 'cheapshark': '3'},
+    {'nombre': 'Fanatical', 'emoji': '🔴', 'itad': 6, 'cheapshark': '15'},
+    {'nombre': 'GamersGate', 'emoji': '🟣', 'itad': 24, 'cheapshark': '2'},
+    {'nombre': 'Gamesplanet', 'emoji': '🔵', 'cheapshark': '27'},
+    {'nombre': 'Gamesload', 'emoji': '🟡', 'cheapshark': '28'},
+    {'nombre': 'AllYouPlay', 'emoji': '🟢', 'cheapshark': '29'},
+    {'nombre': 'DLGamer', 'emoji': '🟠', 'cheapshark': '30'},
+    {'nombre': 'Itch.io', 'emoji': '🔴', 'color': 0xFA5C5C},
+]
+
+_NO_ALFANUMERICO = re.compile(r'[^a-z0-9]')
+
+
+def clave_tienda(nombre):
+    """
+    Clave de búsqueda de una tienda por nombre
+
+    "Green Man Gaming" y "GreenManGaming" → "greenmangaming"
+
+    Args:
+        nombre (str): Nombre de la tienda
+
+    Returns:
+        str: Nombre en minúsculas sin espacios ni signos
+    """
+    return _NO_ALFANUMERICO.sub('', plegar_unicode(nombre or '').lower())
+
+
+class RegistroTiendas:
+    """
+    Catálogo de tiendas con búsqueda O(1) por id de ITAD, id de CheapShark
+    o nombre
+
+    Las listas remotas se cargan la primera vez que se consulta el registro.
+    """
+
+    def __init__(self, api_key=None, cache=None, ttl_dias=7, remoto=True):
+        """
+        Args:
+            api_key (str, optional): API key de ITAD
+            cache (CachePersistente, optional): Cache en disco de las listas remotas
+            ttl_dias (float): Vigencia de las listas en cache
+            remoto (bool): Consultar ITAD y CheapShark (si no, solo TIENDAS_BASE)
+        """
+        self.api_key = api_key
+        self.cache = cache
+        self.ttl = ttl_dias * 86400
+        self.remoto = remoto
+        self.session = obtener_cliente()
+
+        self._por_itad = {}
+        self._por_cheapshark = {}
+        self._por_nombre = {}
+        self._cargado = False
+        self._lock = threading.Lock()
+
+        for base in TIENDAS_BASE:
+            tienda = {
+                'nombre': base['nombre'],
+                'emoji': base['emoji'],
+                'color': base.get('color'),
+                'itad': base.get('itad'),
+                'cheapshark': base.get('cheapshark'),
+            }
+            self._indexar(tienda, base['nombre'], *base.get('alias', ()))
+
+    def _indexar(self, tienda, *nombres):
+        """Registra la tienda bajo sus ids y nombres (sin pisar los existentes)"""
+        if tienda['itad'] is not None:
+            self._por_itad.setdefault(tienda['itad'], tienda)
+        if tienda['cheapshark'] is not None:
+            self._por_cheapshark.setdefault(tienda['cheapshark'], tienda)
+        for nombre in nombres:
+            clave = clave_tienda(nombre)
+            if clave:
+                self._por_nombre.setdefault(clave, tienda)
+
+    def _asegurar_cargado(self):
+        if self._cargado:
+            return
+        with self._lock:
+            if self._cargado:
+                return
+            if self.remoto:
+                self._cargar_remoto()
+            self._cargado = True
+
+    def _cargar_remoto(self):
+        """Combina las listas de ITAD y CheapShark con las tiendas base"""
+        tareas = [
+            ('itad', self._obtener_lista, ('itad', "https://api.isthereanydeal.com/service/shops/v1")),
+            ('cheapshark', self._obtener_lista, ('cheapshark', "https://www.cheapshark.com/api/1.0/stores")),
+        ]
+        listas = ejecutar_en_paralelo(tareas, max_workers=2, valor_error=[])
+
+        for shop in listas['itad'] or []:
+            self._combinar('itad', shop.get('id'), shop.get('title'))
+        for store in listas['cheapshark'] or []:
+            self._combinar('cheapshark', store.get('storeID'), store.get('storeName'))
+
+    def _combinar(self, fuente, id_fuente, nombre):
+        """Agrega una tienda remota o enlaza su id con una tienda conocida"""
+        if id_fuente is None or not nombre:
+            return
+        if fuente == 'cheapshark':
+            id_fuente = str(id_fuente)
+
+        indice = self._por_itad if fuente == 'itad' else self._por_cheapshark
+        tienda = indice.get(id_fuente) or self._por_nombre.get(clave_tienda(nombre))
+
+        if tienda is None:
+            tienda = {'nombre': nombre, 'emoji': '🏪', 'color': None, 'itad': None, 'cheapshark': None}
+        if tienda[fuente] is None:
+            tienda[fuente] = id_fuente
+        self._indexar(tienda, nombre)
+
+    def _obtener_lista(self, fuente, url):
+        """
+        Lista remota de tiendas, desde la cache si sigue vigente
+
+        Returns:
+            list: Tiendas de la fuente (vacía si falló)
+        """
+        if self.cache:
+            hit, guardado = self.cache.obtener('tiendas', fuente)
+            if hit:
+                return guardado
+
+        params = {'key': self.api_key} if fuente == 'itad' and self.api_key else None
+        response = self.session.get(url, params=params)
+
+        if response.status_code != 200:
+            print(f"   ⚠️ Lista de tiendas de {fuente} respondió {response.status_code}")
+            return []
+
+        lista = response.json()
+        if self.cache and lista:
+            self.cache.guardar('tiendas', fuente, lista, self.ttl)
+        return lista
+
+    def por_itad(self, shop_id):
+        """
+        Tienda por id de ITAD
+
+        Returns:
+            dict: {'nombre', 'emoji', 'color', 'itad', 'cheapshark'} o None
+        """
+        self._asegurar_cargado()
+        return self._por_itad.get(shop_id)
+
+    def por_cheapshark(self, store_id):
+        """
+        Tienda por id de CheapShark (storeID)
+
+        Returns:
+            dict: Tienda o None
+        """
+        self._asegurar_cargado()
+        return self._por_cheapshark.get(str(store_id))
+
+    def por_nombre(self, nombre):
+        """
+        Tienda por nombre, sin distinguir mayúsculas, espacios ni signos
+
+        Returns:
+            dict: Tienda o None
+        """
+        self._asegurar_cargado()
+        return self._por_nombre.get(clave_tienda(nombre))
+
+    def color(self, nombre, defecto=COLOR_DEFAULT):
+        """
+        Color de embed de la tienda
+
+        Args:
+            nombre (str): Nombre de la tienda
+            defecto (int): Color si la tienda no tiene uno propio
+
+        Returns:
+            int: Color RGB
+        """
+        tienda = self.por_nombre(nombre)
+        return (tienda or {}).get('color') or defecto
+
+
+_registro = None
+_registro_lock = threading.Lock()
+
+
+def configurar_tiendas(config, cache=None):
+    """
+    Crea el registro compartido a partir de config.json
+
+    Claves opcionales: itad_api_key, tiendas_ttl_dias y tiendas_remotas
+
+    Args:
+        config (dict): Configuración
+        cache (CachePersistente, optional): Cache en disco
+
+    Returns:
+        RegistroTiendas: Registro compartido
+    """
+    global _registro
+
+    with _registro_lock:
+        _registro = RegistroTiendas(
+            api_key=config.get('itad_api_key'),
+            cache=cache,
+            ttl_dias=config.get('tiendas_ttl_dias', 7),
+            remoto=config.get('tiendas_remotas', True)
+        )
+        return _registro
+
+
+def obtener_tiendas():
+    """
+    Devuelve el registro de tiendas compartido (lo crea con valores por defecto)
+
+    Returns:
+        RegistroTiendas: Registro compartido
+    """
+    global _registro
+
+    with _registro_lock:
+        if _registro is None:
+            _registro = RegistroTiendas()
+        return _registro
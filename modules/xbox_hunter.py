@@ -3,11 +3,14 @@
 Busca juegos gratis y ofertas con descuento usando Microsoft Display Catalog API
 """
 
+import threading
 import requests
 from datetime import datetime
+from modules.http_client import obtener_cliente
+from modules.async_engine import HunterAsyncMixin, OfertasAsyncMixin
 
 
-class XboxHunter:
+class XboxHunter(HunterAsyncMixin, OfertasAsyncMixin):
     """
     Busca juegos gratis y ofertas de Xbox usando Microsoft API oficial
     """
@@ -16,11 +19,20 @@ class XboxHunter:
         self.catalog_url = "https://displaycatalog.mp.microsoft.com/v7.0/products"
         self.market = market
         self.language = language
-        self.session = requests.Session()
+        self.session = obtener_cliente()
+        
+        # Catálogos consultados (una vez por ejecución) y su tamaño
+        self.catalogos = [
+            ("Computed/TopFree", 50),
+            ("Computed/Deal", 100),
+            ("Computed/TopPaid", 100),
+        ]
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
     
     def obtener_juegos_gratis(self):
         """
-        Obtiene juegos GRATIS de Xbox (TopFree catalog)
+        Obtiene juegos GRATIS de Xbox (vista sobre el snapshot del catálogo)
         
         Returns:
             list: Lista de juegos gratis de Xbox
@@ -28,20 +40,10 @@ class XboxHunter:
         juegos_gratis = []
         
         try:
-            print("🔍 Consultando Xbox Store (TopFree)...")
-            
-            products = self._consultar_catalogo("Computed/TopFree", count=50)
+            snapshot = self._obtener_snapshot()
             
-            for product in products:
-                info_precio = self._extraer_precio_y_descuento(product)
-                if not info_precio:
-                    continue
-                
-                precio_actual, precio_regular, descuento, moneda, fecha_fin = info_precio
-                if not self._es_gratis(descuento, precio_actual):
-                    continue
-                
-                info = self._crear_info_juego(product, precio_actual, precio_regular, descuento, moneda, fecha_fin)
+            for product, info_precio in snapshot['gratis']:
+                info = self._crear_info_juego(product, *info_precio)
                 if info:
                     juegos_gratis.append(info)
             
@@ -54,7 +56,7 @@ class XboxHunter:
     
     def obtener_ofertas_descuento(self, descuento_minimo=30, descuento_maximo=99):
         """
-        Obtiene ofertas con descuento de Xbox
+        Obtiene ofertas con descuento de Xbox (vista sobre el snapshot del catálogo)
         
         Args:
             descuento_minimo (int): % mínimo de descuento
@@ -66,13 +68,54 @@ class XboxHunter:
         ofertas = []
         
         try:
-            print("🔍 Consultando Xbox Store (Deals)...")
+            snapshot = self._obtener_snapshot()
             
-            catalogos = ["Computed/Deal", "Computed/TopPaid"]
+            for product, info_precio in snapshot['ofertas']:
+                descuento = info_precio[2]
+                if descuento < descuento_minimo:
+                    continue
+                if descuento > descuento_maximo:
+                    continue
+                
+                info = self._crear_info_oferta(product, *info_precio)
+                if info:
+                    ofertas.append(info)
+            
+            print(f"✅ Xbox: {len(ofertas)} oferta(s) encontradas")
+            return ofertas
+            
+        except Exception as e:
+            print(f"❌ Error al consultar Xbox Store: {e}")
+            return []
+    
+    def _obtener_snapshot(self):
+        """
+        Descarga los catálogos una sola vez por ejecución y clasifica cada
+        producto en gratis y con descuento en una sola pasada
+        
+        Cada catálogo está aislado: si uno falla (HTTP o conexión) se usan
+        los demás, y el snapshot parcial también se guarda para no repetir
+        las consultas en la otra vista.
+        
+        Returns:
+            dict: {'gratis': [(product, info_precio)], 'ofertas': [(product, info_precio)]}
+        """
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            
+            print("🔍 Consultando Xbox Store (TopFree, Deals, TopPaid)...")
+            
+            snapshot = {'gratis': [], 'ofertas': []}
             vistos = set()
             
-            for catalogo in catalogos:
-                products = self._consultar_catalogo(catalogo, count=100)
+            for catalogo, count in self.catalogos:
+                try:
+                    products = self._consultar_catalogo(catalogo, count=count)
+                except (requests.RequestException, ValueError) as e:
+                    print(f"⚠️ Xbox: no se pudo consultar {catalogo}: {e}")
+                    continue
+                
                 for product in products:
                     product_id = product.get('ProductId')
                     if product_id and product_id in vistos:
@@ -84,24 +127,14 @@ class XboxHunter:
                     if not info_precio:
                         continue
                     
-                    precio_actual, precio_regular, descuento, moneda, fecha_fin = info_precio
-                    if descuento is None:
-                        continue
-                    if descuento < descuento_minimo:
-                        continue
-                    if descuento > descuento_maximo:
-                        continue
-                    
-                    info = self._crear_info_oferta(product, precio_actual, precio_regular, descuento, moneda, fecha_fin)
-                    if info:
-                        ofertas.append(info)
+                    precio_actual, _, descuento, _, _ = info_precio
+                    if self._es_gratis(descuento, precio_actual):
+                        snapshot['gratis'].append((product, info_precio))
+                    elif descuento is not None:
+                        snapshot['ofertas'].append((product, info_precio))
             
-            print(f"✅ Xbox: {len(ofertas)} oferta(s) encontradas")
-            return ofertas
-            
-        except Exception as e:
-            print(f"❌ Error al consultar Xbox Store: {e}")
-            return []
+            self._snapshot = snapshot
+            return snapshot
     
     def _consultar_catalogo(self, big_catalog_id, count=50):
         try:
@@ -128,7 +161,7 @@ class XboxHunter:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = self.session.get(self.catalog_url, params=params, headers=headers, timeout=15)
+        response = self.session.get(self.catalog_url, params=params, headers=headers)
         response.raise_for_status()
         
         data = response.json()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+🧪 Test del Registro de Anunciados
+Verifica journal tras una interrupción, expiración, compactación y migración
+"""
+
+import json
+import os
+import sys
+import tempfile
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from modules import anunciados as modulo_anunciados
+from modules.anunciados import RegistroAnunciados
+
+DIA = 86400
+
+def _rutas(tmp_path=None):
+    directorio = str(tmp_path) if tmp_path else tempfile.mkdtemp()
+    return os.path.join(directorio, 'cache.json'), os.path.join(directorio, 'cache_journal.jsonl')
+
+def test_journal_tras_interrupcion(tmp_path=None):
+    """Test de journal: lo anotado antes de la caída se recupera, la línea truncada se descarta y lo nuevo sobrevive"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Journal tras Interrupción")
+    print("="*70 + "\n")
+
+    ruta_cache, ruta_journal = _rutas(tmp_path)
+
+    registro = RegistroAnunciados.cargar(ruta_cache, ruta_journal)
+    registro.registrar('epic_hades')
+    registro.registrar('steam_celeste_deal')
+    # Caída a mitad de escritura: sin compactar y con la última línea cortada
+    with open(ruta_journal, 'a', encoding='utf-8') as f:
+        f.write('{"id": "gog_cortado", "primera": 17')
+    del registro
+
+    recuperado = RegistroAnunciados.cargar(ruta_cache, ruta_journal)
+    print(f"   ✅ Recuperados: {sorted(recuperado.entradas)}")
+
+    assert not os.path.exists(ruta_cache)
+    assert 'epic_hades' in recuperado
+    assert 'steam_celeste_deal' in recuperado
+    assert 'gog_cortado' not in recuperado
+    assert recuperado.lineas_journal == 2
+
+    # Lo que se registra tras la caída no queda pegado a la línea cortada
+    recuperado.registrar('itch_celeste')
+    del recuperado
+    recargado = RegistroAnunciados.cargar(ruta_cache, ruta_journal)
+    print(f"   ✅ Tras registrar de nuevo: {sorted(recargado.entradas)}")
+
+    assert 'itch_celeste' in recargado
+    assert 'epic_hades' in recargado
+    assert recargado.lineas_journal == 3
+    print("="*70 + "\n")
+
+def test_expiracion(tmp_path=None):
+    """Test de TTL: gratis dura ttl_gratis, ofertas ttl_ofertas y weekends hasta su fin"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Expiración")
+    print("="*70 + "\n")
+
+    ahora = 1_700_000_000
+    registro = RegistroAnunciados(ttl_gratis_dias=10, ttl_ofertas_dias=2)
+    with mock.patch.object(modulo_anunciados.time, 'time', lambda: ahora):
+        registro.registrar('epic_hades')
+        registro.registrar('steam_celeste_deal')
+        registro.registrar('steam_weekend_portal', expira=ahora + DIA)
+
+    assert registro.contiene('steam_weekend_portal', ahora=ahora + DIA - 1)
+    assert not registro.contiene('steam_weekend_portal', ahora=ahora + DIA)
+    assert registro.contiene('steam_celeste_deal', ahora=ahora + 2 * DIA - 1)
+    assert not registro.contiene('steam_celeste_deal', ahora=ahora + 2 * DIA)
+    assert registro.contiene('epic_hades', ahora=ahora + 9 * DIA)
+
+    # Una oferta que sigue apareciendo extiende su vigencia
+    with mock.patch.object(modulo_anunciados.time, 'time', lambda: ahora + DIA):
+        registro.tocar('steam_celeste_deal')
+    assert registro.contiene('steam_celeste_deal', ahora=ahora + 2 * DIA)
+
+    purgados = registro.purgar(ahora=ahora + 3 * DIA - 1)
+    print(f"   ✅ Purgados: {purgados}, vigentes: {sorted(registro.entradas)}")
+    assert purgados == 1
+    assert sorted(registro.entradas) == ['epic_hades', 'steam_celeste_deal']
+    print("="*70 + "\n")
+
+def test_compactacion(tmp_path=None):
+    """Test de compactación: snapshot atómico con os.replace y journal vacío"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Compactación")
+    print("="*70 + "\n")
+
+    ruta_cache, ruta_journal = _rutas(tmp_path)
+    registro = RegistroAnunciados.cargar(ruta_cache, ruta_journal)
+    registro.registrar('epic_hades')
+    registro.registrar('gog_celeste')
+
+    reemplazos = []
+    replace_original = os.replace
+
+    def replace_espia(origen, destino):
+        reemplazos.append((origen, destino))
+        replace_original(origen, destino)
+
+    with mock.patch.object(modulo_anunciados.os, 'replace', replace_espia):
+        registro.compactar(ruta_cache)
+
+    with open(ruta_cache, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    print(f"   ✅ Snapshot: {sorted(snapshot['anunciados'])}")
+
+    assert reemplazos == [(f"{ruta_cache}.tmp", ruta_cache)]
+    assert not os.path.exists(f"{ruta_cache}.tmp")
+    assert sorted(snapshot['anunciados']) == ['epic_hades', 'gog_celeste']
+    assert os.path.getsize(ruta_journal) == 0
+    assert registro.lineas_journal == 0
+
+    # Si falla el reemplazo, el snapshot anterior queda intacto
+    registro.registrar('itch_nuevo')
+    with mock.patch.object(modulo_anunciados.os, 'replace', side_effect=OSError("disco lleno")):
+        try:
+            registro.compactar(ruta_cache)
+            assert False, "se esperaba OSError"
+        except OSError:
+            pass
+
+    recargado = RegistroAnunciados.cargar(ruta_cache, ruta_journal)
+    assert sorted(recargado.entradas) == ['epic_hades', 'gog_celeste', 'itch_nuevo']
+    print("="*70 + "\n")
+
+def test_migracion_formato_anterior(tmp_path=None):
+    """Test de migración: las listas del cache.json anterior pasan al índice con expiración"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Migración de cache.json")
+    print("="*70 + "\n")
+
+    ruta_cache, ruta_journal = _rutas(tmp_path)
+    ahora = 1_700_000_000
+    with open(ruta_cache, 'w', encoding='utf-8') as f:
+        json.dump({
+            'juegos_anunciados': ['epic_hades', 'steam_celeste_deal'],
+            'weekend_anunciados': {'steam_weekend_portal': ahora + DIA},
+        }, f)
+
+    with mock.patch.object(modulo_anunciados.time, 'time', lambda: ahora):
+        registro = RegistroAnunciados.cargar(ruta_cache, ruta_journal, ttl_gratis_dias=365, ttl_ofertas_dias=30)
+
+    print(f"   ✅ Migrados: {sorted(registro.entradas)}")
+    assert registro.migrado
+    assert registro.entradas['epic_hades']['expira'] == ahora + 365 * DIA
+    assert registro.entradas['steam_celeste_deal']['expira'] == ahora + 30 * DIA
+    assert registro.entradas['steam_weekend_portal']['expira'] == ahora + DIA
+
+    registro.compactar(ruta_cache)
+    with open(ruta_cache, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert list(snapshot) == ['anunciados']
+    assert not RegistroAnunciados.cargar(ruta_cache, ruta_journal).migrado
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_journal_tras_interrupcion()
+    test_expiracion()
+    test_compactacion()
+    test_migracion_formato_anterior()
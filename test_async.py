@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+🧪 Test del Runner Asíncrono
+Verifica el tope de peticiones por host y que cada fuente llegue al pipeline
+"""
+
+import asyncio
+import io
+import sys
+import threading
+import time
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.response import HTTPResponse
+
+from hundea_async import producir_lotes_async
+from modules.async_engine import HunterAsyncMixin, OfertasAsyncMixin
+from modules.http_client import ClienteHTTP
+from modules.rate_limiter import LimitadorConcurrencia, LimitadorTasa
+
+def test_tope_por_host():
+    """Test de concurrencia: nunca hay más peticiones simultáneas que el tope del host"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Tope de Peticiones por Host")
+    print("="*70 + "\n")
+
+    cliente = ClienteHTTP(
+        reintentos=0, limitador=LimitadorTasa(),
+        concurrencia=LimitadorConcurrencia(8, {'lento.test': 2})
+    )
+    activas, maximo = {}, {}
+    lock = threading.Lock()
+
+    def enviar(pool, conn, method, url, **kwargs):
+        with lock:
+            activas[pool.host] = activas.get(pool.host, 0) + 1
+            maximo[pool.host] = max(maximo.get(pool.host, 0), activas[pool.host])
+        time.sleep(0.02)
+        with lock:
+            activas[pool.host] -= 1
+        return HTTPResponse(body=io.BytesIO(b''), status=200, preload_content=False)
+
+    async def pedir_todo():
+        urls = [f"http://{host}/api" for host in ('lento.test', 'rapido.test') for _ in range(6)]
+        await asyncio.gather(*(asyncio.to_thread(cliente.get, url) for url in urls))
+
+    with mock.patch.object(HTTPConnectionPool, '_make_request', autospec=True, side_effect=enviar):
+        asyncio.run(pedir_todo())
+
+    print(f"   ✅ Máximo simultáneo por host: {maximo}")
+    assert maximo['lento.test'] == 2
+    assert maximo['rapido.test'] > 2
+    print("="*70 + "\n")
+
+class HunterFalso(HunterAsyncMixin, OfertasAsyncMixin):
+    def __init__(self, nombre, espera=0, falla=False):
+        self.nombre, self.espera, self.falla = nombre, espera, falla
+
+    def obtener_juegos_gratis(self):
+        time.sleep(self.espera)
+        if self.falla:
+            raise RuntimeError("API caída")
+        return [{'id': f'{self.nombre}-1'}]
+
+    def obtener_ofertas_descuento(self, minimo):
+        return [{'id': f'{self.nombre}-oferta-{minimo}'}]
+
+def test_lotes_al_terminar():
+    """Test de runner: cada fuente se emite al terminar y un error no frena a las demás"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Lotes del Runner Asíncrono")
+    print("="*70 + "\n")
+
+    lenta, caida, rapida = HunterFalso('lenta', 0.2), HunterFalso('caida', falla=True), HunterFalso('rapida')
+    tareas = [
+        ('Lenta', lenta.obtener_juegos_gratis, ()),
+        ('Caída', caida.obtener_juegos_gratis, ()),
+        ('Ofertas', rapida.obtener_ofertas_descuento, (70,)),
+    ]
+    lotes = []
+    with mock.patch('sys.stdout', new=io.StringIO()):
+        asyncio.run(producir_lotes_async(tareas, {'max_hilos': 4}, lotes.append))
+
+    for lote in lotes:
+        print(f"   ✅ {lote['fuente']}: {[juego['id'] for juego in lote['juegos']]}")
+    assert [lote['fuente'] for lote in lotes][-1] == 'Lenta'
+    assert {lote['fuente']: lote['juegos'] for lote in lotes} == {
+        'Lenta': [{'id': 'lenta-1'}],
+        'Caída': [],
+        'Ofertas': [{'id': 'rapida-oferta-70'}],
+    }
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_tope_por_host()
+    test_lotes_al_terminar()
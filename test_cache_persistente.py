@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🧪 Test de Cache Persistente
+Verifica hits, misses, expiración y resultados negativos en SQLite,
+y la cache en memoria de los proveedores por clave
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from modules import cache_persistente
+from modules.cache_persistente import CacheConsultas, CachePersistente, SIN_RESPUESTA
+
+def test_hit_miss_y_negativos(tmp_path=None):
+    """Test de lectura: hit, miss y resultado negativo (None) sobreviven al reabrir"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Hit, Miss y Negativos")
+    print("="*70 + "\n")
+
+    directorio = str(tmp_path) if tmp_path else tempfile.mkdtemp()
+    ruta = os.path.join(directorio, 'hundea_cache.db')
+
+    cache = CachePersistente(ruta)
+    cache.guardar('rawg', 'hades', {'reviews_percent': 93, 'reviews_count': 5120}, ttl=3600)
+    cache.guardar('rawg', 'inexistente', None, ttl=3600)
+    cache.cerrar()
+
+    # Otra ejecución: la misma ruta conserva las entradas
+    cache = CachePersistente(ruta)
+    hit, valor = cache.obtener('rawg', 'hades')
+    print(f"   ✅ Hit: {hit} → {valor}")
+    assert (hit, valor) == (True, {'reviews_percent': 93, 'reviews_count': 5120})
+
+    hit, valor = cache.obtener('rawg', 'inexistente')
+    print(f"   ✅ Negativo: {hit} → {valor}")
+    assert (hit, valor) == (True, None)
+
+    assert cache.obtener('rawg', 'celeste') == (False, None)
+    assert cache.obtener('steam_reviews', 'hades') == (False, None)
+    cache.cerrar()
+    print("="*70 + "\n")
+
+def test_expiracion(tmp_path=None):
+    """Test de TTL: una entrada vencida es un miss y purgar_expirados la borra"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Expiración")
+    print("="*70 + "\n")
+
+    directorio = str(tmp_path) if tmp_path else tempfile.mkdtemp()
+    cache = CachePersistente(os.path.join(directorio, 'hundea_cache.db'))
+
+    ahora = 1_700_000_000.0
+    with mock.patch.object(cache_persistente.time, 'time', lambda: ahora):
+        cache.guardar('itad_id', 'corta', 'id-corta', ttl=60)
+        cache.guardar('itad_id', 'negativa', None, ttl=60)
+        cache.guardar('itad_id', 'larga', 'id-larga', ttl=86400)
+
+    ahora += 61
+    with mock.patch.object(cache_persistente.time, 'time', lambda: ahora):
+        assert cache.obtener('itad_id', 'corta') == (False, None)
+        assert cache.obtener('itad_id', 'negativa') == (False, None)
+        assert cache.obtener('itad_id', 'larga') == (True, 'id-larga')
+
+        purgadas = cache.purgar_expirados()
+        print(f"   ✅ Purgadas: {purgadas}")
+        assert purgadas == 2
+        assert cache.purgar_expirados() == 0
+        assert cache.obtener('itad_id', 'larga') == (True, 'id-larga')
+    cache.cerrar()
+    print("="*70 + "\n")
+
+def test_cache_consultas():
+    """Test de CacheConsultas: memoria → disco → consulta; los fallos no se guardan"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Cache de Consultas")
+    print("="*70 + "\n")
+
+    disco = CachePersistente(':memory:')
+    disco.guardar('rawg', 'celeste', {'reviews_count': 800}, ttl=3600)
+    respuestas = {'hades': {'reviews_count': 5120}, 'inexistente': None, 'caido': SIN_RESPUESTA}
+    consultas = []
+
+    def consultar(clave):
+        consultas.append(clave)
+        return respuestas[clave]
+
+    cache = CacheConsultas('rawg', disco, ttl=3600, ttl_negativo=60)
+    for clave in ('celeste', 'hades', 'inexistente', 'caido', 'hades', 'inexistente', 'caido'):
+        cache.consultar(clave, consultar, clave)
+    print(f"   ✅ Consultas a la API: {consultas}")
+
+    assert consultas == ['hades', 'inexistente', 'caido', 'caido']
+    assert cache.consultar('caido', lambda: SIN_RESPUESTA) is None
+    assert 'celeste' in cache and 'caido' not in cache
+    assert disco.obtener('rawg', 'hades') == (True, {'reviews_count': 5120})
+    assert disco.obtener('rawg', 'inexistente') == (True, None)
+    assert disco.obtener('rawg', 'caido') == (False, None)
+
+    # El resultado negativo usa su propia vigencia
+    ahora = cache_persistente.time.time() + 61
+    with mock.patch.object(cache_persistente.time, 'time', lambda: ahora):
+        assert disco.obtener('rawg', 'inexistente') == (False, None)
+        assert disco.obtener('rawg', 'hades')[0]
+    disco.cerrar()
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_hit_miss_y_negativos()
+    test_expiracion()
+    test_cache_consultas()
@@ -7,6 +7,8 @@ Prueba completa con scoring y reviews
 import sys
 sys.path.insert(0, '.')
 
+from unittest import mock
+
 from modules.cheapshark_hunter import CheapSharkHunter
 from modules.scoring import SistemaScoring
 
@@ -121,8 +123,64 @@ def test_completo():
     print("="*70 + "\n")
 
 
+def _sesion_paginada(paginas=3, fallida=None):
+    """Sesión falsa de /deals: `paginas` páginas de 2 deals y X-Total-Page-Count"""
+    pedidas = []
+
+    def get(url, params=None):
+        numero = params['pageNumber']
+        pedidas.append(numero)
+        if numero == fallida:
+            return mock.Mock(status_code=500, headers={})
+        deals = [{'dealID': f'p{numero}-d{n}'} for n in range(2)] if numero < paginas else []
+        return mock.Mock(status_code=200, headers={'X-Total-Page-Count': str(paginas)}, json=lambda: deals)
+
+    return mock.Mock(get=mock.Mock(side_effect=get)), pedidas
+
+def test_iterar_deals():
+    """Test de paginación: orden de entrega, corte y página intermedia fallida"""
+    print("\n" + "="*70)
+    print("🦈 TEST - Paginación de /deals")
+    print("="*70 + "\n")
+
+    # Tres páginas en orden, pedidas en paralelo tras la primera
+    hunter = CheapSharkHunter(max_paginas=5, paginas_paralelas=3)
+    hunter.session, pedidas = _sesion_paginada()
+    ids = [deal['dealID'] for deal in hunter.iterar_deals({'upperPrice': 0})]
+    print(f"   ✅ Entregados: {ids}")
+    assert ids == ['p0-d0', 'p0-d1', 'p1-d0', 'p1-d1', 'p2-d0', 'p2-d1']
+    assert sorted(pedidas) == [0, 1, 2]
+
+    # El corte detiene la entrega y las páginas siguientes no se piden
+    hunter = CheapSharkHunter(max_paginas=5, paginas_paralelas=1)
+    hunter.session, pedidas = _sesion_paginada()
+    ids = [deal['dealID'] for deal in hunter.iterar_deals({}, corte=lambda deal: deal['dealID'] == 'p1-d1')]
+    print(f"   ✅ Con corte: {ids} (páginas pedidas {pedidas})")
+    assert ids == ['p0-d0', 'p0-d1', 'p1-d0']
+    assert pedidas == [0, 1]
+
+    # Presupuesto: no se pasa de max_paginas aunque el header diga más
+    hunter = CheapSharkHunter(max_paginas=2, paginas_paralelas=3)
+    hunter.session, pedidas = _sesion_paginada()
+    assert len(list(hunter.iterar_deals({}))) == 4
+    assert sorted(pedidas) == [0, 1]
+
+    # Una página intermedia fallida termina la iteración sin saltarse deals
+    hunter = CheapSharkHunter(max_paginas=5, paginas_paralelas=3)
+    hunter.session, pedidas = _sesion_paginada(fallida=1)
+    ids = [deal['dealID'] for deal in hunter.iterar_deals({})]
+    print(f"   ✅ Con página 1 fallida: {ids}")
+    assert ids == ['p0-d0', 'p0-d1']
+
+    # Si falla la primera no hay nada que entregar
+    hunter.session, pedidas = _sesion_paginada(fallida=0)
+    assert list(hunter.iterar_deals({})) == []
+    assert pedidas == [0]
+    print("="*70 + "\n")
+
 if __name__ == "__main__":
     try:
+        test_iterar_deals()
         test_completo()
     except KeyboardInterrupt:
         print("\n\n⚠️ Test interrumpido\n")
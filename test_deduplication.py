@@ -104,6 +104,38 @@ def test_deduplicacion():
     
     print("="*70 + "\n")
 
+def test_casi_duplicados():
+    """Test de casi duplicados entre tiendas"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Casi Duplicados")
+    print("="*70 + "\n")
+    
+    juegos = [
+        {'id': 'itad_gta', 'titulo': 'Grand Theft Auto V', 'precio_actual': 7.5},
+        {'id': 'cheapshark_gta', 'titulo': 'GTA V Premium Edition', 'precio_actual': 6.0},
+        {'id': 'xbox_gta', 'titulo': 'Grand Theft Auto V: Premium Edition', 'precio_actual': 9.9},
+        {'id': 'itad_gta4', 'titulo': 'Grand Theft Auto IV', 'precio_actual': 5.0},
+        {'id': 'itad_witcher2', 'titulo': 'The Witcher 2', 'precio_actual': 2.0},
+        {'id': 'itad_witcher3', 'titulo': 'The Witcher 3: Wild Hunt GOTY', 'precio_actual': 8.0},
+        {'id': 'gog_witcher3', 'titulo': 'The Witcher 3 - Wild Hunt', 'precio_actual': 7.0},
+    ]
+    
+    unicos = eliminar_duplicados(juegos)
+    ids = sorted(juego['id'] for juego in unicos)
+    esperado = ['cheapshark_gta', 'gog_witcher3', 'itad_gta4', 'itad_witcher2']
+    
+    for juego in unicos:
+        print(f"   ✅ {juego['titulo']} (${juego['precio_actual']})")
+    
+    if ids == esperado:
+        print(f"\n✅ CASI DUPLICADOS CORRECTOS - Se mantiene el mejor precio y se separan secuelas")
+    else:
+        print(f"\n❌ ERROR - Esperado {esperado}, obtenido {ids}")
+    
+    assert ids == esperado
+    print("="*70 + "\n")
+
 if __name__ == "__main__":
     test_normalizacion()
     test_deduplicacion()
+    test_casi_duplicados()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+🧪 Test de Fusión entre Tiendas
+Verifica que se conserve la mejor versión de cada juego entre lotes
+"""
+
+import io
+import sys
+import threading
+from contextlib import redirect_stdout
+sys.path.insert(0, '.')
+
+from modules.fusion import FusionJuegos
+from modules.pipeline import Pipeline, pasar_si_falla
+
+FUENTES_OFERTAS = ['itad_ofertas', 'cheapshark_ofertas']
+
+def test_mejor_precio_entre_lotes():
+    """Test de ofertas: gana el menor precio aunque llegue después"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Mejor Precio entre Lotes")
+    print("="*70 + "\n")
+
+    fusion = FusionJuegos(FUENTES_OFERTAS)
+
+    pasan = fusion.procesar_lote('cheapshark_ofertas', [
+        {'id': 'steam_hades', 'titulo': 'Hades', 'tienda': 'Steam', 'precio_actual': 9.0, 'descuento_porcentaje': 50},
+    ])
+    pasan += fusion.procesar_lote('itad_ofertas', [
+        {'id': 'gog_hades', 'titulo': 'Hades', 'tienda': 'GOG', 'precio_actual': 3.0, 'descuento_porcentaje': 80},
+        {'id': 'gog_celeste', 'titulo': 'Celeste', 'tienda': 'GOG', 'precio_actual': 4.0, 'descuento_porcentaje': 75},
+    ])
+    ganadores = fusion.vaciar()
+
+    ids = [juego['id'] for _, juego in ganadores]
+    print(f"   ✅ Ganadores: {ids}")
+
+    assert pasan == []
+    assert ids == ['gog_hades', 'gog_celeste']
+    assert fusion.duplicados_por_fuente == {'cheapshark_ofertas': 1}
+    print("="*70 + "\n")
+
+def test_gratis_sin_esperar():
+    """Test de gratis: salen con su lote y lo repetido después solo cuenta como duplicado"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Gratis sin Esperar al Resto")
+    print("="*70 + "\n")
+
+    fusion = FusionJuegos(FUENTES_OFERTAS)
+
+    salen = fusion.procesar_lote('epic', [
+        {'id': 'epic_rustler', 'titulo': 'Rustler - Grand Theft Horse', 'reviews_count': 3089},
+    ])
+    assert [juego['id'] for _, juego in salen] == ['epic_rustler']
+
+    # Otra fuente con el mismo juego: ya se entregó, no vuelve a salir
+    salen = fusion.procesar_lote('itch', [
+        {'id': 'itch_rustler', 'titulo': 'Rustler (Grand Theft Horse)', 'reviews_count': 5000},
+        {'id': 'itch_celeste', 'titulo': 'Celeste', 'reviews_count': 10},
+    ])
+    print(f"   ✅ Segundo lote: {[juego['id'] for _, juego in salen]}")
+    assert salen == [('gratis', {'id': 'itch_celeste', 'titulo': 'Celeste', 'reviews_count': 10})]
+    assert fusion.duplicados_por_fuente == {'itch': 1}
+
+    # Las ofertas son las únicas que esperan a vaciar()
+    assert fusion.vaciar() == []
+    print("="*70 + "\n")
+
+def test_gratis_compara_reviews_sin_importar_el_precio():
+    """Test de gratis: dentro de un lote gana el de más reviews, aunque haya None o precio 0"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Gratis por Reviews (con None)")
+    print("="*70 + "\n")
+
+    lote = [
+        {'id': 'itad_61_hades', 'titulo': 'Hades', 'precio_actual': 0, 'descuento_porcentaje': 100,
+         'reviews_count': None},
+        {'id': 'itad_35_hades', 'titulo': 'Hades', 'precio_actual': 0, 'descuento_porcentaje': 100,
+         'reviews_count': 5000},
+        {'id': 'itad_16_hades', 'titulo': 'Hades', 'precio_actual': 0, 'descuento_porcentaje': 100,
+         'reviews_count': None},
+    ]
+
+    for juegos in (lote, lote[::-1]):
+        fusion = FusionJuegos(FUENTES_OFERTAS)
+        salen = [(categoria, juego['id']) for categoria, juego in fusion.procesar_lote('itad_ofertas', juegos)]
+        print(f"   ✅ {[juego['id'] for juego in juegos]} → {salen}")
+
+        assert salen == [('gratis', 'itad_35_hades')]
+        assert fusion.total_duplicados == 2
+
+    # Sin reviews en ninguno: gana el primero del lote
+    fusion = FusionJuegos(FUENTES_OFERTAS)
+    salen = fusion.procesar_lote('itad_ofertas', [lote[2], lote[0]])
+    assert [juego['id'] for _, juego in salen] == ['itad_16_hades']
+    print("="*70 + "\n")
+
+def test_empate_por_orden_de_fuentes():
+    """Test de empates: gana la fuente con más prioridad, no la primera en llegar"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Empate por Orden de Fuentes")
+    print("="*70 + "\n")
+
+    fusion = FusionJuegos(FUENTES_OFERTAS, orden_fuentes=['itad_ofertas', 'cheapshark_ofertas'])
+
+    fusion.procesar_lote('cheapshark_ofertas', [
+        {'id': 'cheapshark_hades', 'titulo': 'Hades', 'precio_actual': 3.0, 'descuento_porcentaje': 80},
+    ])
+    fusion.procesar_lote('itad_ofertas', [
+        {'id': 'itad_hades', 'titulo': 'Hades', 'precio_actual': 3.0, 'descuento_porcentaje': 80},
+    ])
+    ids = [juego['id'] for _, juego in fusion.vaciar()]
+    print(f"   ✅ Ganadores: {ids}")
+
+    assert ids == ['itad_hades']
+    print("="*70 + "\n")
+
+def test_pipeline_lotes_desordenados():
+    """Test de pipeline: el menor precio gana sin importar qué fuente termina antes"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Pipeline con Lotes Desordenados")
+    print("="*70 + "\n")
+
+    lote_steam = {'fuente': 'cheapshark_ofertas', 'juegos': [
+        {'id': 'steam_hades', 'titulo': 'Hades', 'tienda': 'Steam', 'precio_actual': 9.0, 'descuento_porcentaje': 50},
+    ]}
+    lote_gog = {'fuente': 'itad_ofertas', 'juegos': [
+        {'id': 'gog_hades', 'titulo': 'Hades', 'tienda': 'GOG', 'precio_actual': 3.0, 'descuento_porcentaje': 80},
+    ]}
+
+    for lotes in ([lote_steam, lote_gog], [lote_gog, lote_steam]):
+        fusion = FusionJuegos(FUENTES_OFERTAS, orden_fuentes=FUENTES_OFERTAS)
+        anunciados = []
+
+        def etapa_fusion(lote):
+            yield from fusion.procesar_lote(lote['fuente'], lote['juegos'])
+
+        def etapa_discord(item):
+            anunciados.append(item)
+            return ()
+
+        pipeline = Pipeline([
+            ('fusion', etapa_fusion, fusion.vaciar),
+            ('discord', etapa_discord),
+        ], tamano_buffer=1)
+        pipeline.ejecutar(lambda emitir: [emitir(dict(lote)) for lote in lotes])
+
+        resultado = [(categoria, juego['id'], juego['precio_actual']) for categoria, juego in anunciados]
+        print(f"   ✅ Orden {[lote['fuente'] for lote in lotes]} → {resultado}")
+
+        assert resultado == [('oferta', 'gog_hades', 3.0)]
+    print("="*70 + "\n")
+
+def test_pipeline_gratis_antes_que_fuentes_lentas():
+    """Test de pipeline: un juego gratis llega a Discord sin esperar a las fuentes lentas"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Gratis sin Esperar a Fuentes Lentas")
+    print("="*70 + "\n")
+
+    fusion = FusionJuegos(FUENTES_OFERTAS)
+    anunciados = []
+    gratis_anunciado = threading.Event()
+
+    def etapa_discord(item):
+        anunciados.append(item[1]['id'])
+        if item[0] == 'gratis':
+            gratis_anunciado.set()
+        return ()
+
+    def productor(emitir):
+        emitir({'fuente': 'epic', 'juegos': [{'id': 'epic_hades', 'titulo': 'Hades', 'reviews_count': 10}]})
+        # La fuente lenta no termina hasta que el gratis ya se anunció
+        assert gratis_anunciado.wait(timeout=5)
+        emitir({'fuente': 'itad_ofertas', 'juegos': [
+            {'id': 'gog_celeste', 'titulo': 'Celeste', 'precio_actual': 4.0, 'descuento_porcentaje': 75},
+        ]})
+
+    Pipeline([
+        ('fusion', lambda lote: fusion.procesar_lote(lote['fuente'], lote['juegos']), fusion.vaciar),
+        ('discord', etapa_discord),
+    ]).ejecutar(productor)
+
+    print(f"   ✅ Anunciados en orden: {anunciados}")
+    assert anunciados == ['epic_hades', 'gog_celeste']
+    print("="*70 + "\n")
+
+def test_pipeline_errores_no_pierden_juegos():
+    """Test de errores: el enriquecimiento que falla deja pasar el lote y lo perdido se registra"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Errores en Etapas")
+    print("="*70 + "\n")
+
+    lote = {'fuente': 'epic', 'juegos': [{'id': 'epic_hades'}, {'id': 'epic_celeste'}]}
+    recibidos = []
+
+    def etapa_rota(lote):
+        raise RuntimeError("API caída")
+
+    salida = io.StringIO()
+    with redirect_stdout(salida):
+        Pipeline([
+            ('precios', pasar_si_falla('precios', etapa_rota)),
+            ('fusion', etapa_rota),
+            ('discord', recibidos.append),
+        ]).ejecutar(lambda emitir: emitir(lote))
+    registro = salida.getvalue()
+    print(registro)
+
+    assert "Error en etapa precios: API caída (el lote sigue sin cambios)" in registro
+    assert "Error en etapa fusion: API caída (sin terminar: epic_hades, epic_celeste)" in registro
+    assert recibidos == []
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_mejor_precio_entre_lotes()
+    test_gratis_sin_esperar()
+    test_gratis_compara_reviews_sin_importar_el_precio()
+    test_empate_por_orden_de_fuentes()
+    test_pipeline_lotes_desordenados()
+    test_pipeline_gratis_antes_que_fuentes_lentas()
+    test_pipeline_errores_no_pierden_juegos()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🧪 Test del Cliente HTTP
+Verifica qué peticiones se reintentan, con el transporte de urllib3 simulado
+"""
+
+import io
+import sys
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+import requests
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.response import HTTPResponse
+
+from modules.http_client import ClienteHTTP
+from modules.rate_limiter import LimitadorTasa
+
+URL = "http://hundea.test/api"
+
+def _cliente():
+    return ClienteHTTP(reintentos=2, backoff=0, jitter=0, limitador=LimitadorTasa())
+
+def _respuesta(status, headers=None):
+    return HTTPResponse(body=io.BytesIO(b''), headers=headers or {}, status=status, preload_content=False)
+
+def _transporte(*resultados):
+    """Simula el envío de cada intento: devuelve o lanza los resultados en orden"""
+    llamadas = []
+
+    def enviar(pool, conn, method, url, **kwargs):
+        resultado = resultados[min(len(llamadas), len(resultados) - 1)]
+        llamadas.append(method)
+        if isinstance(resultado, Exception):
+            raise resultado
+        return resultado
+
+    return mock.patch.object(HTTPConnectionPool, '_make_request', autospec=True, side_effect=enviar), llamadas
+
+def test_timeout_de_lectura():
+    """Test de timeouts: GET se reintenta, POST no (el webhook pudo publicarse)"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Timeout de Lectura")
+    print("="*70 + "\n")
+
+    for metodo, intentos in (('GET', 3), ('POST', 1)):
+        parche, llamadas = _transporte(ReadTimeoutError(None, URL, "read timed out"))
+        with parche:
+            try:
+                _cliente().request(metodo, URL)
+                assert False, "se esperaba un error"
+            except requests.exceptions.RequestException:
+                pass
+        print(f"   ✅ {metodo}: {len(llamadas)} intento(s)")
+        assert len(llamadas) == intentos
+    print("="*70 + "\n")
+
+def test_post_solo_429_con_retry_after():
+    """Test de estados: POST se reintenta ante 429 con Retry-After y nada más"""
+    print("\n" + "="*70)
+    print("🧪 TEST - POST y Códigos de Estado")
+    print("="*70 + "\n")
+
+    casos = [
+        ('GET', _respuesta(503), [503, 200], 2),
+        ('POST', _respuesta(503), [503], 1),
+        ('POST', _respuesta(429), [429], 1),
+        ('POST', _respuesta(429, {'Retry-After': '0'}), [429, 200], 2),
+    ]
+
+    for metodo, primera, esperado, intentos in casos:
+        parche, llamadas = _transporte(primera, _respuesta(200))
+        with parche:
+            response = _cliente().request(metodo, URL)
+        estado_esperado = esperado[-1]
+        print(f"   ✅ {metodo} {primera.status} {dict(primera.headers)} → {response.status_code} en {len(llamadas)} intento(s)")
+        assert response.status_code == estado_esperado
+        assert len(llamadas) == intentos
+    print("="*70 + "\n")
+
+class LimitadorRegistro(LimitadorTasa):
+    """Limitador que anota cada turno pedido y cada pausa por headers"""
+
+    def __init__(self):
+        super().__init__()
+        self.turnos = []
+        self.pausas = []
+
+    def adquirir(self, host):
+        self.turnos.append(host)
+
+    def actualizar_desde_headers(self, host, headers, status_code=None):
+        self.pausas.append((host, status_code))
+
+def test_reintentos_pasan_por_el_limitador():
+    """Test de limitador: cada reintento de urllib3 pide su propio turno"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Reintentos y Limitador")
+    print("="*70 + "\n")
+
+    limitador = LimitadorRegistro()
+    cliente = ClienteHTTP(reintentos=3, backoff=0, jitter=0, limitador=limitador)
+    parche, llamadas = _transporte(
+        _respuesta(429, {'Retry-After': '0'}),
+        _respuesta(503),
+        _respuesta(200),
+    )
+    with parche:
+        response = cliente.get(URL)
+
+    print(f"   ✅ {len(llamadas)} intento(s), turnos: {limitador.turnos}")
+    print(f"   ✅ Headers revisados: {limitador.pausas}")
+    assert response.status_code == 200
+    assert limitador.turnos == ['hundea.test'] * len(llamadas) == ['hundea.test'] * 3
+    assert limitador.pausas == [('hundea.test', 429), ('hundea.test', 503), ('hundea.test', 200)]
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_timeout_de_lectura()
+    test_post_solo_429_con_retry_after()
+    test_reintentos_pasan_por_el_limitador()
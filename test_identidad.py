@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🧪 Test de Identidad Canónica
+Verifica el lookup en lote de ITAD con una sesión simulada
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from modules.cache_persistente import CachePersistente
+from modules.identidad import ResolvedorIdentidad, TAMANO_LOTE
+
+def _sesion():
+    """Sesión falsa: el lookup responde un UUID derivado de cada valor pedido"""
+    def post(url, params=None, json=None):
+        return mock.Mock(status_code=200, json=lambda: {valor: f"uuid-{valor}" for valor in json})
+    return mock.Mock(post=mock.Mock(side_effect=post))
+
+def test_lote_de_250_titulos():
+    """Test de lotes: 250 títulos se resuelven en 2 peticiones (200 + 50)"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Lookup en Lote")
+    print("="*70 + "\n")
+
+    resolvedor = ResolvedorIdentidad()
+    resolvedor.session = _sesion()
+
+    juegos = [{'id': f'gog_{n}', 'titulo': f'Juego {n}'} for n in range(250)]
+    resueltos = resolvedor.resolver_lote(juegos)
+
+    llamadas = resolvedor.session.post.call_args_list
+    tamanos = [len(llamada.kwargs['json']) for llamada in llamadas]
+    print(f"   ✅ {resueltos} resueltos en {len(llamadas)} petición(es): {tamanos}")
+
+    assert resueltos == 250
+    assert tamanos == [TAMANO_LOTE, 50]
+    assert all(llamada.args[0].endswith('/lookup/id/title/v1') for llamada in llamadas)
+    assert juegos[0]['id_canonico'] == 'itad_uuid-Juego 0'
+    print("="*70 + "\n")
+
+def test_ids_en_cache_no_consultan():
+    """Test de cache: lo resuelto en otra ejecución no vuelve a la red"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Ids en Cache")
+    print("="*70 + "\n")
+
+    cache = CachePersistente(':memory:')
+
+    primero = ResolvedorIdentidad(cache=cache)
+    primero.session = _sesion()
+    primero.resolver_lote([
+        {'id': 'steam_hades', 'titulo': 'Hades', 'appid': 1145360},
+        {'id': 'gog_celeste', 'titulo': 'Celeste'},
+    ])
+    assert primero.session.post.call_count == 2
+
+    # Nueva ejecución: memoria vacía, misma tabla persistente
+    segundo = ResolvedorIdentidad(cache=cache)
+    segundo.session = _sesion()
+    juegos = [
+        {'id': 'cheapshark_hades', 'titulo': 'Hades', 'appid': '1145360'},
+        {'id': 'itch_celeste', 'titulo': 'CELESTE'},
+    ]
+    resueltos = segundo.resolver_lote(juegos)
+
+    print(f"   ✅ {resueltos} resueltos con {segundo.session.post.call_count} petición(es)")
+    assert resueltos == 2
+    assert segundo.session.post.call_count == 0
+    assert juegos[0]['itad_id'] == 'uuid-app/1145360'
+    assert juegos[1]['itad_id'] == 'uuid-Celeste'
+
+    # En la misma ejecución basta la memoria
+    segundo.resolver_lote([{'id': 'gog_hades', 'titulo': 'Hades', 'appid': 1145360}])
+    assert segundo.session.post.call_count == 0
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_lote_de_250_titulos()
+    test_ids_en_cache_no_consultan()
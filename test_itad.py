@@ -7,10 +7,11 @@ Prueba rápida de la integración con ITAD
 import sys
 sys.path.insert(0, '.')
 
-from modules.itad_hunter import IsThereAnyDealHunter
+from modules.itad_hunter import IsThereAnyDealHunter, LIMITE_PAGINA
 from modules.reviews_externas import ReviewsExternas
 from modules.scoring import SistemaScoring
 import json
+from unittest import mock
 
 def test_itad_completo():
     """Prueba completa de ITAD + Reviews + Scoring"""
@@ -96,8 +97,116 @@ def test_itad_completo():
     print("✅ Test completado!")
     print("="*70 + "\n")
 
+def _paginas_falsas(ultima):
+    """Simula /deals/v2: páginas de un item hasta `ultima` (hasMore en las anteriores)"""
+    pedidas = []
+
+    def obtener_pagina(offset, orden):
+        numero = offset // LIMITE_PAGINA
+        pedidas.append(numero)
+        if numero > ultima:
+            return {'list': [], 'hasMore': False}
+        return {'list': [{'id': f'juego-{numero}'}], 'hasMore': numero < ultima}
+
+    return obtener_pagina, pedidas
+
+def test_paginacion_itad():
+    """Prueba de paginación: la página 0 va sola y el resto solo mientras haya hasMore"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Paginación de /deals/v2")
+    print("="*70 + "\n")
+
+    hunter = IsThereAnyDealHunter(api_key='clave', max_paginas=5, paginas_paralelas=3)
+
+    # Una sola página: no se gasta nada en rondas
+    obtener_pagina, pedidas = _paginas_falsas(ultima=0)
+    with mock.patch.object(hunter, '_obtener_pagina', side_effect=obtener_pagina):
+        ids = [item['id'] for item in hunter.iterar_deals('price')]
+    print(f"   ✅ 1 página → pedidas {pedidas}")
+    assert ids == ['juego-0']
+    assert pedidas == [0]
+
+    # Tres páginas: una ronda (1-3) y se para en la que dice hasMore=False
+    obtener_pagina, pedidas = _paginas_falsas(ultima=2)
+    with mock.patch.object(hunter, '_obtener_pagina', side_effect=obtener_pagina):
+        ids = [item['id'] for item in hunter.iterar_deals('price')]
+    print(f"   ✅ 3 páginas → pedidas {sorted(pedidas)}")
+    assert ids == ['juego-0', 'juego-1', 'juego-2']
+    assert sorted(pedidas) == [0, 1, 2, 3]
+
+    # Más páginas que el presupuesto: nunca se pasa de max_paginas
+    obtener_pagina, pedidas = _paginas_falsas(ultima=50)
+    with mock.patch.object(hunter, '_obtener_pagina', side_effect=obtener_pagina):
+        ids = [item['id'] for item in hunter.iterar_deals('price')]
+    assert len(ids) == 5
+    assert sorted(pedidas) == [0, 1, 2, 3, 4]
+
+    # El consumidor corta: no se piden más rondas
+    obtener_pagina, pedidas = _paginas_falsas(ultima=50)
+    with mock.patch.object(hunter, '_obtener_pagina', side_effect=obtener_pagina):
+        next(hunter.iterar_deals('price'))
+    assert pedidas == [0]
+    print("="*70 + "\n")
+
+def test_verificar_precios_moneda_e_identidad():
+    """Prueba de verificación: solo misma moneda actualiza y solo id exacto descarta"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Verificación de Precios en ITAD")
+    print("="*70 + "\n")
+
+    hunter = IsThereAnyDealHunter(api_key='clave')
+    deal_usd = {
+        'shop': {'id': 61},
+        'price': {'amount': 4.99, 'currency': 'USD'},
+        'regular': {'amount': 19.99, 'currency': 'USD'},
+        'cut': 75,
+    }
+    precios = {
+        'uuid-hades': {'deals': [deal_usd]},
+        'uuid-celeste': {'deals': [deal_usd]},
+        'uuid-portal': {'deals': []},
+        'uuid-rustler': {'deals': []},
+    }
+
+    def oferta(juego_id, itad_id, moneda, exacta):
+        return {
+            'id': juego_id, 'titulo': juego_id, 'itad_id': itad_id, 'itad_shop_id': 61,
+            'identidad_exacta': exacta, 'moneda': moneda,
+            'precio_actual': 9.99, 'precio_regular': 19.99, 'descuento_porcentaje': 50,
+        }
+
+    juegos = [
+        oferta('hades', 'uuid-hades', 'USD', False),
+        oferta('celeste', 'uuid-celeste', 'MXN', True),
+        oferta('portal', 'uuid-portal', 'USD', True),
+        oferta('rustler', 'uuid-rustler', 'USD', False),
+    ]
+
+    with mock.patch.object(hunter, 'obtener_precios', return_value=precios):
+        vigentes = hunter.verificar_precios(juegos)
+
+    por_id = {juego['id']: juego for juego in vigentes}
+    print(f"   ✅ Vigentes: {sorted(por_id)}")
+
+    # Misma moneda: se actualiza con el precio de ITAD
+    assert por_id['hades']['precio_actual'] == 4.99
+    assert por_id['hades']['descuento_porcentaje'] == 75
+    assert por_id['hades']['precio_verificado']
+
+    # Otra moneda: queda como la trajo la fuente
+    assert por_id['celeste']['precio_actual'] == 9.99
+    assert por_id['celeste']['descuento_porcentaje'] == 50
+    assert not por_id['celeste'].get('precio_verificado')
+
+    # Sin deal: se descarta solo con id exacto
+    assert 'portal' not in por_id
+    assert 'rustler' in por_id
+    print("="*70 + "\n")
+
 if __name__ == "__main__":
     try:
+        test_paginacion_itad()
+        test_verificar_precios_moneda_e_identidad()
         test_itad_completo()
     except KeyboardInterrupt:
         print("\n\n⚠️ Test interrumpido\n")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+🧪 Test del Limitador de Tasa
+Verifica el token bucket con un reloj simulado (sin esperas reales)
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from modules import rate_limiter
+from modules.rate_limiter import LimitadorTasa
+
+class RelojFalso:
+    """Sustituye al módulo time: sleep avanza el reloj en lugar de esperar"""
+
+    def __init__(self):
+        self.ahora = 1000.0
+        self.esperas = []
+
+    def monotonic(self):
+        return self.ahora
+
+    def time(self):
+        return 1_700_000_000 + self.ahora
+
+    def sleep(self, segundos):
+        self.esperas.append(round(segundos, 6))
+        self.ahora += segundos
+
+def test_rafaga_y_recarga():
+    """Test de bucket: la ráfaga sale sin esperar y luego 1 token cada 1/por_segundo"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Ráfaga y Recarga")
+    print("="*70 + "\n")
+
+    reloj = RelojFalso()
+    with mock.patch.object(rate_limiter, 'time', reloj):
+        limitador = LimitadorTasa({'api.test': {'por_segundo': 2, 'rafaga': 3}})
+        for _ in range(5):
+            limitador.adquirir('api.test')
+        print(f"   ✅ Esperas tras la ráfaga: {reloj.esperas}")
+        assert reloj.esperas == [0.5, 0.5]
+
+        reloj.ahora += 10
+        reloj.esperas.clear()
+        for _ in range(3):
+            limitador.adquirir('api.test')
+        assert reloj.esperas == []
+
+        limitador.adquirir('otro.test')
+        assert reloj.esperas == []
+    print("="*70 + "\n")
+
+def test_pausa_desde_headers():
+    """Test de headers: un 429 con Retry-After bloquea el host ese tiempo"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Pausa desde Headers")
+    print("="*70 + "\n")
+
+    reloj = RelojFalso()
+    with mock.patch.object(rate_limiter, 'time', reloj):
+        limitador = LimitadorTasa({'api.test': {'por_segundo': 1, 'rafaga': 5}})
+        limitador.adquirir('api.test')
+        limitador.actualizar_desde_headers('api.test', {'Retry-After': '7'}, 429)
+        limitador.adquirir('api.test')
+        print(f"   ✅ Retry-After 7 → esperas {reloj.esperas}")
+        assert reloj.esperas == [7.0, 1.0]
+
+        reloj.esperas.clear()
+        limitador.actualizar_desde_headers('api.test', {'Retry-After': '3600'}, 429)
+        limitador.adquirir('api.test')
+        assert reloj.esperas[0] == LimitadorTasa.PAUSA_MAXIMA
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_rafaga_y_recarga()
+    test_pausa_desde_headers()
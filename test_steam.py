@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+🧪 Test de Verificación de Precios en Steam
+Verifica appdetails (price_overview) con una sesión simulada por país
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from modules.steam_hunter import SteamHunter
+
+def _sesion(precios_por_pais):
+    """Sesión falsa de appdetails: cc -> appid -> price_overview (None = sin precio)"""
+    def get(url, params=None):
+        precios = precios_por_pais.get(params['cc'], {})
+        data = {}
+        for appid in params['appids'].split(','):
+            precio = precios.get(appid)
+            data[appid] = {'success': True, 'data': {'price_overview': precio} if precio else []}
+        return mock.Mock(status_code=200, json=lambda: data)
+    return mock.Mock(get=mock.Mock(side_effect=get))
+
+def _oferta(juego_id, appid, moneda, precio=9.99, descuento=50):
+    return {
+        'id': juego_id, 'titulo': juego_id, 'tienda': 'Steam', 'appid': appid, 'moneda': moneda,
+        'precio_actual': precio, 'precio_regular': 19.99, 'descuento_porcentaje': descuento,
+    }
+
+def test_verificar_precios_moneda():
+    """Test de monedas: con steam_cc=mx las ofertas en USD se confirman en cc=us"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Verificación de Precios con Otra Moneda")
+    print("="*70 + "\n")
+
+    hunter = SteamHunter(cc='mx')
+    hunter.session = _sesion({
+        'mx': {
+            '1145360': {'currency': 'MXN', 'initial': 29999, 'final': 7499, 'discount_percent': 75},
+            '504230': {'currency': 'MXN', 'initial': 19999, 'final': 19999, 'discount_percent': 0},
+            '620': None,
+        },
+        'us': {
+            '1145360': {'currency': 'USD', 'initial': 2499, 'final': 624, 'discount_percent': 75},
+            '504230': {'currency': 'USD', 'initial': 1999, 'final': 1999, 'discount_percent': 0},
+        },
+    })
+
+    juegos = [
+        # CheapShark en USD (lo desplegado: steam_cc=mx): se consulta cc=us
+        _oferta('cheapshark_hades', '1145360', 'USD'),
+        _oferta('cheapshark_celeste', '504230', 'USD'),
+        # En MXN: se consulta cc=mx
+        _oferta('itad_hades', '1145360', 'MXN', precio=149.99),
+        _oferta('itad_celeste', '504230', 'MXN', precio=99.99),
+        # Sin precio en el país: sin cambios
+        _oferta('itad_portal', '620', 'MXN'),
+        # Moneda sin país conocido: no se consulta
+        _oferta('itad_portal_2', '400', 'XYZ'),
+    ]
+    vigentes = hunter.verificar_precios(juegos)
+    por_id = {juego['id']: juego for juego in vigentes}
+    print(f"   ✅ Vigentes: {sorted(por_id)}")
+
+    consultas = sorted(
+        (llamada.kwargs['params']['cc'], llamada.kwargs['params']['appids'])
+        for llamada in hunter.session.get.call_args_list
+    )
+    print(f"   ✅ Consultas: {consultas}")
+    assert consultas == [('mx', '1145360,504230,620'), ('us', '1145360,504230')]
+
+    assert por_id['cheapshark_hades']['precio_actual'] == 6.24
+    assert por_id['cheapshark_hades']['precio_regular'] == 24.99
+    assert por_id['cheapshark_hades']['precio_verificado']
+    assert 'cheapshark_celeste' not in por_id
+
+    assert por_id['itad_hades']['precio_actual'] == 74.99
+    assert por_id['itad_hades']['precio_regular'] == 299.99
+    assert por_id['itad_hades']['descuento_porcentaje'] == 75
+    assert por_id['itad_hades']['precio_verificado']
+
+    assert 'itad_celeste' not in por_id
+    assert por_id['itad_portal']['precio_actual'] == 9.99
+    assert not por_id['itad_portal_2'].get('precio_verificado')
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_verificar_precios_moneda()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🧪 Test del Registro de Tiendas
+Verifica que ids de ITAD, ids de CheapShark, nombres y alias lleven a la misma tienda
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+from unittest import mock
+
+from modules.tiendas import RegistroTiendas
+
+# (id ITAD, id CheapShark, nombre a mostrar, nombres y alias que deben coincidir)
+CASOS = [
+    (36, '3', 'Green Man Gaming', ['Green Man Gaming', 'GreenManGaming', 'green-man-gaming']),
+    (52, '8', 'EA Origin', ['EA Origin', 'Origin', 'EA App']),
+    (62, '13', 'Ubisoft Connect', ['Ubisoft Connect', 'Uplay', 'Ubisoft Store']),
+    (16, '25', 'Epic Games', ['Epic Games', 'Epic Games Store', 'Epic Game Store']),
+]
+
+def _verificar(registro):
+    for itad, cheapshark, nombre, nombres in CASOS:
+        tienda = registro.por_itad(itad)
+        print(f"   ✅ ITAD {itad} / CheapShark {cheapshark} → {tienda['nombre']}")
+        assert tienda['nombre'] == nombre
+        assert registro.por_cheapshark(cheapshark) is tienda
+        assert registro.por_cheapshark(int(cheapshark)) is tienda
+        for otro in nombres:
+            assert registro.por_nombre(otro) is tienda, otro
+
+def test_busquedas_base():
+    """Test sin red: id, nombre y alias resuelven la misma entrada de TIENDAS_BASE"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Búsquedas en Tiendas Base")
+    print("="*70 + "\n")
+
+    _verificar(RegistroTiendas(remoto=False))
+    print("="*70 + "\n")
+
+def test_busquedas_con_listas_remotas():
+    """Test con listas remotas: los nombres de cada API se enlazan a la misma tienda"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Búsquedas con Listas Remotas")
+    print("="*70 + "\n")
+
+    listas = {
+        'itad': [
+            {'id': 36, 'title': 'GreenManGaming'},
+            {'id': 52, 'title': 'EA Store'},
+            {'id': 62, 'title': 'Ubisoft Store'},
+            {'id': 16, 'title': 'Epic Game Store'},
+            {'id': 99, 'title': 'WinGameStore'},
+        ],
+        'cheapshark': [
+            {'storeID': '3', 'storeName': 'GreenManGaming'},
+            {'storeID': '8', 'storeName': 'Origin'},
+            {'storeID': '13', 'storeName': 'Uplay'},
+            {'storeID': '25', 'storeName': 'Epic Games Store'},
+            {'storeID': '21', 'storeName': 'WinGameStore'},
+        ],
+    }
+
+    registro = RegistroTiendas()
+    with mock.patch.object(registro, '_obtener_lista', side_effect=lambda fuente, url: listas[fuente]):
+        _verificar(registro)
+
+    # Una tienda que no está en la base se comparte entre ambas fuentes
+    nueva = registro.por_itad(99)
+    assert nueva['nombre'] == 'WinGameStore'
+    assert registro.por_cheapshark('21') is nueva
+    assert registro.por_nombre('wingamestore') is nueva
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_busquedas_base()
+    test_busquedas_con_listas_remotas()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+🧪 Test del Snapshot de Xbox
+Verifica el snapshot compartido del catálogo con una sesión simulada
+"""
+
+import io
+import sys
+sys.path.insert(0, '.')
+
+from contextlib import redirect_stdout
+from unittest import mock
+
+import requests
+
+from modules.xbox_hunter import XboxHunter
+
+def _producto(product_id, msrp, precio):
+    return {
+        'ProductId': product_id,
+        'LocalizedProperties': [{'ProductTitle': product_id, 'Images': []}],
+        'DisplaySkuAvailabilities': [{'Availabilities': [{
+            'OrderManagementData': {'Price': {'MSRP': msrp, 'ListPrice': precio, 'CurrencyCode': 'USD'}}
+        }]}],
+    }
+
+def _sesion(catalogos):
+    """Sesión falsa: bigCatalogId -> lista de productos o excepción a lanzar"""
+    def get(url, params=None, headers=None):
+        resultado = catalogos[params['bigCatalogId']]
+        if isinstance(resultado, Exception):
+            raise resultado
+        return mock.Mock(status_code=200, json=lambda: {'Products': resultado})
+    return mock.Mock(get=mock.Mock(side_effect=get))
+
+def test_snapshot_con_catalogo_caido():
+    """Test de snapshot: un error de conexión en TopFree no tumba las ofertas y no se repite"""
+    print("\n" + "="*70)
+    print("🧪 TEST - Snapshot de Xbox con un Catálogo Caído")
+    print("="*70 + "\n")
+
+    hunter = XboxHunter()
+    hunter.session = _sesion({
+        'Computed/TopFree': requests.ConnectionError("conexión reiniciada"),
+        'Computed/Deal': [_producto('halo', 40.0, 10.0)],
+        'Computed/TopPaid': [_producto('forza', 60.0, 0.0), _producto('halo', 40.0, 10.0)],
+    })
+
+    with redirect_stdout(io.StringIO()):
+        ofertas = hunter.obtener_ofertas_descuento(30, 99)
+        gratis = hunter.obtener_juegos_gratis()
+
+    print(f"   ✅ Ofertas: {[oferta['id'] for oferta in ofertas]}")
+    print(f"   ✅ Gratis: {[juego['id'] for juego in gratis]}")
+    print(f"   ✅ Consultas al catálogo: {hunter.session.get.call_count}")
+
+    assert [oferta['id'] for oferta in ofertas] == ['xbox_halo']
+    assert ofertas[0]['descuento_porcentaje'] == 75
+    assert [juego['id'] for juego in gratis] == ['xbox_forza']
+    # Tres catálogos, una vez por ejecución, aunque uno haya fallado
+    assert hunter.session.get.call_count == 3
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    test_snapshot_con_catalogo_caido()